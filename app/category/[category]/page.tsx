@@ -1,6 +1,4 @@
-import { getCategories, getToolsByCategory } from '@/lib/mcp-data';
-import { generateSlug } from '@/lib/mcp-data';
-import { MCPTool } from '@/lib/types';
+import { getPageIndex, getCategoryPage, ToolCard as ToolCardData } from '@/lib/page-data';
 import Link from 'next/link';
 import { notFound } from 'next/navigation';
 import { Metadata } from 'next';
@@ -10,17 +8,17 @@ interface Props {
 }
 
 export async function generateStaticParams() {
-  const categories = getCategories();
+  const { categories } = await getPageIndex();
   return categories.map((category) => ({
-    category: category,
+    category: category.name,
   }));
 }
 
 export async function generateMetadata({ params }: Props): Promise<Metadata> {
   const { category } = await params;
-  const tools = getToolsByCategory(category);
+  const page = await getCategoryPage(category);
   
-  if (tools.length === 0) {
+  if (!page) {
     return {
       title: 'Category Not Found',
     };
@@ -28,19 +26,19 @@ export async function generateMetadata({ params }: Props): Promise<Metadata> {
 
   return {
     title: `${category.charAt(0).toUpperCase() + category.slice(1)} MCP Tools - MCP Curator`,
-    description: `Discover ${tools.length} MCP tools in the ${category} category. Find the perfect Model Context Protocol integration for your ${category} needs.`,
+    description: `Discover ${page.count} MCP tools in the ${category} category. Find the perfect Model Context Protocol integration for your ${category} needs.`,
     keywords: [category, 'MCP', 'Model Context Protocol', 'tools', 'directory'],
   };
 }
 
 export default async function CategoryPage({ params }: Props) {
   const { category } = await params;
-  const tools = getToolsByCategory(category);
-  const allCategories = getCategories();
+  const page = await getCategoryPage(category);
 
-  if (tools.length === 0) {
+  if (!page) {
     notFound();
   }
+  const { tools, others } = page;
 
   const getCategoryDescription = (cat: string): string => {
     const descriptions: Record<string, string> = {
@@ -125,21 +123,16 @@ export default async function CategoryPage({ params }: Props) {
         <div className="mt-16">
           <h2 className="text-2xl font-bold text-gray-900 mb-8">Explore Other Categories</h2>
           <div className="grid grid-cols-2 md:grid-cols-3 lg:grid-cols-4 gap-4">
-            {allCategories
-              .filter(cat => cat !== category)
-              .map(cat => {
-                const categoryTools = getToolsByCategory(cat);
-                return (
-                  <Link
-                    key={cat}
-                    href={`/category/${cat}`}
-                    className="bg-white p-4 rounded-lg border border-gray-200 hover:border-blue-300 hover:shadow-md transition-all"
-                  >
-                    <h3 className="font-semibold text-gray-900 capitalize mb-1">{cat}</h3>
-                    <p className="text-sm text-gray-600">{categoryTools.length} tools</p>
-                  </Link>
-                );
-              })}
+            {others.map(cat => (
+              <Link
+                key={cat.name}
+                href={`/category/${cat.name}`}
+                className="bg-white p-4 rounded-lg border border-gray-200 hover:border-blue-300 hover:shadow-md transition-all"
+              >
+                <h3 className="font-semibold text-gray-900 capitalize mb-1">{cat.name}</h3>
+                <p className="text-sm text-gray-600">{cat.count} tools</p>
+              </Link>
+            ))}
           </div>
         </div>
       </main>
@@ -147,11 +140,9 @@ export default async function CategoryPage({ params }: Props) {
   );
 }
 
-function ToolCard({ tool }: { tool: MCPTool }) {
-  const slug = generateSlug(tool.name);
-  
+function ToolCard({ tool }: { tool: ToolCardData }) {
   return (
-    <Link href={`/mcp/${slug}`} className="block">
+    <Link href={`/mcp/${tool.slug}`} className="block">
       <div className="bg-white p-6 rounded-xl border border-gray-200 hover:border-blue-300 hover:shadow-lg transition-all h-full">
         <div className="flex justify-between items-start mb-4">
           <h3 className="text-xl font-semibold text-gray-900 line-clamp-1">{tool.name}</h3>
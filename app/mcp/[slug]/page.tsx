@@ -1,4 +1,4 @@
-import { getAllTools, getToolBySlug, generateSlug, getToolsByCategory } from '@/lib/mcp-data';
+import { getPageIndex, getToolPage } from '@/lib/page-data';
 import { MCPTool } from '@/lib/types';
 import Link from 'next/link';
 import { notFound } from 'next/navigation';
@@ -11,15 +11,15 @@ interface Props {
 }
 
 export async function generateStaticParams() {
-  const tools = getAllTools();
-  return tools.map((tool) => ({
-    slug: generateSlug(tool.name),
+  const { slugs } = await getPageIndex();
+  return slugs.map((slug) => ({
+    slug,
   }));
 }
 
 export async function generateMetadata({ params }: Props): Promise<Metadata> {
   const { slug } = await params;
-  const tool = getToolBySlug(slug);
+  const tool = (await getToolPage(slug))?.tool;
   
   if (!tool) {
     return {
@@ -79,11 +79,12 @@ export async function generateMetadata({ params }: Props): Promise<Metadata> {
 
 export default async function MCPToolPage({ params }: Props) {
   const { slug } = await params;
-  const tool = getToolBySlug(slug);
+  const page = await getToolPage(slug);
 
-  if (!tool) {
+  if (!page) {
     notFound();
   }
+  const { tool } = page;
 
   // Fetch real-time GitHub data
   let githubData: EnhancedGitHubData | null = null;
@@ -103,7 +104,7 @@ export default async function MCPToolPage({ params }: Props) {
   const installCommand = generateInstallCommand(tool);
   const configExample = generateConfigExample(tool);
   const usageExample = generateUsageExample(tool);
-  const relatedTools = getToolsByCategory(tool.category).filter(t => t.id !== tool.id).slice(0, 6);
+  const relatedTools = page.related;
 
   return (
     <div className="min-h-screen bg-gradient-to-br from-slate-50 via-blue-50 to-indigo-50">
@@ -444,11 +445,11 @@ export default async function MCPToolPage({ params }: Props) {
         {relatedTools.length > 0 && (
           <section className="mt-16">
             <h2 className="text-3xl font-bold text-slate-900 mb-8 text-center">
-              More {tool.category} MCP Tools
+              Similar MCP Tools
             </h2>
             <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6">
               {relatedTools.map((relatedTool) => (
-                <Link key={relatedTool.id} href={`/mcp/${generateSlug(relatedTool.name)}`} className="block group">
+                <Link key={relatedTool.id} href={`/mcp/${relatedTool.slug}`} className="block group">
                   <div className="bg-white/80 backdrop-blur-xl p-6 rounded-2xl border border-slate-200/60 hover:border-blue-300 hover:shadow-xl transition-all duration-300 group-hover:-translate-y-1">
                     <h4 className="text-lg font-semibold text-slate-900 mb-2 group-hover:text-blue-600 transition-colors">
                       {relatedTool.name}
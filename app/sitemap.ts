@@ -1,10 +1,9 @@
 import { MetadataRoute } from 'next';
-import { getAllTools, getCategories, generateSlug } from '@/lib/mcp-data';
+import { getSitemapEntries } from '@/lib/page-data';
 
-export default function sitemap(): MetadataRoute.Sitemap {
+export default async function sitemap(): Promise<MetadataRoute.Sitemap> {
   const baseUrl = 'https://www.mcpcurator.com';
-  const allTools = getAllTools();
-  const categories = getCategories();
+  const entries = await getSitemapEntries();
 
   // Static pages
   const staticPages = [
@@ -34,21 +33,16 @@ export default function sitemap(): MetadataRoute.Sitemap {
     },
   ];
 
-  // Category pages
-  const categoryPages = categories.map((category) => ({
-    url: `${baseUrl}/category/${category}`,
-    lastModified: new Date(),
-    changeFrequency: 'weekly' as const,
-    priority: 0.7,
-  }));
-
-  // MCP tool pages
-  const toolPages = allTools.map((tool) => ({
-    url: `${baseUrl}/mcp/${generateSlug(tool.name)}`,
-    lastModified: new Date(tool.lastUpdated || Date.now()),
-    changeFrequency: 'weekly' as const,
-    priority: 0.6,
-  }));
+  // Category and MCP tool pages, with lastmod from the precomputed pages
+  const pages = entries.map((entry) => {
+    const isCategory = entry.path.startsWith('/category/');
+    return {
+      url: `${baseUrl}${entry.path}`,
+      lastModified: new Date(entry.lastmod),
+      changeFrequency: 'weekly' as const,
+      priority: isCategory ? 0.7 : 0.6,
+    };
+  });
 
-  return [...staticPages, ...categoryPages, ...toolPages];
+  return [...staticPages, ...pages];
 }
\ No newline at end of file
@@ -0,0 +1,146 @@
+import fs from 'fs';
+import path from 'path';
+import { MCPTool } from './types';
+
+// Per-page payloads written by scripts/pages.py. Each page reads only its own
+// shard; when data/pages has not been generated we fall back to deriving
+// everything from the full catalog (lib/mcp-data.ts), loaded on demand.
+const PAGES_DIR = path.join(process.cwd(), 'data', 'pages');
+
+// Slugs and categories come from route params and become file names, so
+// only names the page index lists (and that cannot leave the directory) are read
+const NAME_PATTERN = /^[a-z0-9-]+$/;
+
+export type ToolCard = Pick<
+  MCPTool,
+  'id' | 'name' | 'description' | 'language' | 'tags' | 'rating' | 'stars' | 'lastUpdated'
+> & { slug: string };
+
+export interface CategoryCount {
+  name: string;
+  count: number;
+}
+
+export interface ToolPage {
+  slug: string;
+  tool: MCPTool;
+  related: ToolCard[];
+  category: CategoryCount;
+}
+
+export interface CategoryPage {
+  category: string;
+  count: number;
+  tools: ToolCard[];
+  others: CategoryCount[];
+}
+
+export interface SitemapEntry {
+  path: string;
+  lastmod: string;
+}
+
+function readShard<T>(relativePath: string): T | null | undefined {
+  // undefined: no generated pages at all, null: pages exist but not this one
+  if (!fs.existsSync(PAGES_DIR)) {
+    return undefined;
+  }
+  const file = path.resolve(PAGES_DIR, relativePath);
+  if (!file.startsWith(PAGES_DIR + path.sep) || !fs.existsSync(file)) {
+    return null;
+  }
+  return JSON.parse(fs.readFileSync(file, 'utf8')) as T;
+}
+
+async function catalog() {
+  return import('./mcp-data');
+}
+
+function toCard(tool: MCPTool, slug: string): ToolCard {
+  const { id, name, description, language, tags, rating, stars, lastUpdated } = tool;
+  return { id, name, description, language, tags, rating, stars, lastUpdated, slug };
+}
+
+export async function getPageIndex(): Promise<{ slugs: string[]; categories: CategoryCount[] }> {
+  const index = readShard<{ slugs: string[]; categories: CategoryCount[] }>('index.json');
+  if (index) {
+    return index;
+  }
+  const { getAllTools, generateSlug, getCategoryInfo } = await catalog();
+  const slugs = [...new Set(getAllTools().map((tool) => generateSlug(tool.name)))];
+  return { slugs, categories: getCategoryInfo().map(({ name, count }) => ({ name, count })) };
+}
+
+async function isListed(kind: 'slug' | 'category', name: string): Promise<boolean> {
+  if (!NAME_PATTERN.test(name)) {
+    return false;
+  }
+  const index = await getPageIndex();
+  return kind === 'slug'
+    ? index.slugs.includes(name)
+    : index.categories.some((category) => category.name === name);
+}
+
+export async function getToolPage(slug: string): Promise<ToolPage | null> {
+  if (!(await isListed('slug', slug))) {
+    return null;
+  }
+  const page = readShard<ToolPage>(path.join('tools', `${slug}.json`));
+  if (page !== undefined) {
+    return page;
+  }
+  const { getToolBySlug, getToolsByCategory, generateSlug } = await catalog();
+  const tool = getToolBySlug(slug);
+  if (!tool) {
+    return null;
+  }
+  const sameCategory = getToolsByCategory(tool.category);
+  return {
+    slug,
+    tool,
+    related: sameCategory
+      .filter((t) => t.id !== tool.id)
+      .slice(0, 6)
+      .map((t) => toCard(t, generateSlug(t.name))),
+    category: { name: tool.category, count: sameCategory.length },
+  };
+}
+
+export async function getCategoryPage(category: string): Promise<CategoryPage | null> {
+  if (!(await isListed('category', category))) {
+    return null;
+  }
+  const page = readShard<CategoryPage>(path.join('categories', `${category}.json`));
+  if (page !== undefined) {
+    return page;
+  }
+  const { getToolsByCategory, getCategoryInfo, generateSlug } = await catalog();
+  const tools = getToolsByCategory(category);
+  if (tools.length === 0) {
+    return null;
+  }
+  return {
+    category,
+    count: tools.length,
+    tools: tools.map((t) => toCard(t, generateSlug(t.name))),
+    others: getCategoryInfo()
+      .filter((c) => c.name !== category)
+      .map(({ name, count }) => ({ name, count })),
+  };
+}
+
+export async function getSitemapEntries(): Promise<SitemapEntry[]> {
+  const entries = readShard<SitemapEntry[]>('sitemap.json');
+  if (entries) {
+    return entries;
+  }
+  const { getAllTools, getCategories, generateSlug } = await catalog();
+  const now = new Date().toISOString();
+  return [
+    ...getCategories().map((category) => ({ path: `/category/${category}`, lastmod: now })),
+    ...getAllTools().map((tool) => ({
+      path: `/mcp/${generateSlug(tool.name)}`,
+      lastmod: tool.lastUpdated || now,
+    })),
+  ];
+}
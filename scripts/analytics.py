@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Catalog Analytics
+Loads mcp-data.json (and the star counts kept in the catalog snapshot store)
+into pandas frames and produces vectorized reports. The flattened catalog frame is cached
+as Parquet (or pickle when pyarrow is missing), keyed by a hash of the data
+file, so repeat runs skip JSON parsing entirely.
+
+    python analytics.py                   # all reports
+    python analytics.py category language # selected reports
+    python analytics.py --category-counts ../data/category-counts.json
+"""
+
+import sys
+import json
+import hashlib
+import argparse
+
+import pandas as pd
+
+from catalog import DATA_FILE
+
+CACHE_DIR = DATA_FILE.parent / ".cache"
+FRESHNESS_BINS = [-1, 30, 90, 180, 365, float('inf')]
+FRESHNESS_LABELS = ['< 1 month', '1-3 months', '3-6 months', '6-12 months', '> 1 year']
+
+try:
+    import pyarrow  # noqa: F401
+    CACHE_FORMAT = 'parquet'
+except ImportError:
+    CACHE_FORMAT = 'pkl'
+
+# -------- Loading -------------------------------------------------------------
+def file_hash(path) -> str:
+    h = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()[:16]
+
+def build_frame(tools) -> pd.DataFrame:
+    """Flatten catalog entries into typed columns"""
+    df = pd.DataFrame.from_records(tools)
+    for col, default in [('stars', 0), ('forks', 0), ('watchers', 0), ('contributors', None),
+                         ('tags', None), ('lastUpdated', None), ('rating', None), ('language', None)]:
+        if col not in df:
+            df[col] = default
+    frame = pd.DataFrame({
+        'id': df['id'].astype('int64'),
+        'name': df['name'].astype('string'),
+        'category': df['category'].astype('category'),
+        'language': df['language'].fillna('unknown').astype(str).str.lower().astype('category'),
+        'stars': pd.to_numeric(df['stars'], errors='coerce').fillna(0).astype('int64'),
+        'forks': pd.to_numeric(df['forks'], errors='coerce').fillna(0).astype('int64'),
+        'rating': pd.to_numeric(df['rating'], errors='coerce').astype('float32'),
+        'last_updated': pd.to_datetime(df['lastUpdated'], errors='coerce', utc=True, format='mixed'),
+        'contributor_count': df['contributors'].map(lambda c: len(c) if isinstance(c, list) else 0).astype('int32'),
+        'contributor_logins': df['contributors'].map(
+            lambda c: [x.get('login') for x in c] if isinstance(c, list) else []
+        ),
+        'tags': df['tags'].map(lambda t: list(t) if isinstance(t, list) else []),
+    })
+    return frame
+
+def load_frame(path=DATA_FILE, use_cache=True) -> pd.DataFrame:
+    """Catalog frame, served from the hash-keyed cache when the file is unchanged"""
+    cache_file = CACHE_DIR / f"catalog-{file_hash(path)}.{CACHE_FORMAT}"
+    if use_cache and cache_file.exists():
+        return pd.read_parquet(cache_file) if CACHE_FORMAT == 'parquet' else pd.read_pickle(cache_file)
+
+    with open(path, 'r') as f:
+        frame = build_frame(json.load(f))
+    if use_cache:
+        CACHE_DIR.mkdir(exist_ok=True)
+        for stale in CACHE_DIR.glob(f"catalog-*.{CACHE_FORMAT}"):
+            stale.unlink()
+        if CACHE_FORMAT == 'parquet':
+            frame.to_parquet(cache_file, index=False)
+        else:
+            frame.to_pickle(cache_file)
+    return frame
+
+def load_history(data_file=DATA_FILE) -> pd.DataFrame:
+    """Star count of every tool in every catalog snapshot (snapshots.py) kept next to ``data_file``"""
+    from snapshots import SnapshotStore
+    with SnapshotStore.for_catalog(data_file) as store:
+        history = store.field_history('stars')
+    rows = [(snapshot['id'], snapshot['created_at'], tool_id, stars)
+            for snapshot, column in history for tool_id, stars in column.items()]
+    df = pd.DataFrame.from_records(rows, columns=['snapshot', 'created_at', 'id', 'stars'])
+    df['created_at'] = pd.to_datetime(df['created_at'], errors='coerce')
+    df['stars'] = pd.to_numeric(df['stars'], errors='coerce').fillna(0).astype('int64')
+    return df
+
+# -------- Reports -------------------------------------------------------------
+def summary(frame, top=10, name_col='name') -> dict:
+    """Totals plus the top repos by stars (nlargest is a partial sort)"""
+    return {
+        'tools': int(len(frame)),
+        'total_stars': int(frame['stars'].sum()),
+        'average_stars': float(frame['stars'].mean()) if len(frame) else 0.0,
+        'median_stars': float(frame['stars'].median()) if len(frame) else 0.0,
+        'top': frame.nlargest(top, 'stars')[[name_col, 'stars']],
+    }
+
+def stars_by(frame, column) -> pd.DataFrame:
+    """Tool count and star distribution per category/language"""
+    return (frame.groupby(column, observed=True)['stars']
+            .agg(tools='count', total='sum', mean='mean', median='median', max='max')
+            .sort_values('total', ascending=False))
+
+def freshness(frame, now=None) -> pd.Series:
+    """How many tools were updated within each age band"""
+    now = now or pd.Timestamp.now(tz='UTC')
+    age_days = (now - frame['last_updated']).dt.days
+    bands = pd.cut(age_days, FRESHNESS_BINS, labels=FRESHNESS_LABELS)
+    counts = bands.value_counts(sort=False)
+    counts['unknown'] = int(age_days.isna().sum())
+    return counts
+
+def contributor_concentration(frame, top=10) -> dict:
+    """How concentrated tools are among contributors (share of top logins, HHI)"""
+    logins = frame['contributor_logins'].explode().dropna()
+    counts = logins.value_counts()
+    if counts.empty:
+        return {'contributors': 0, 'top': counts, 'top_share': 0.0, 'hhi': 0.0}
+    shares = counts / counts.sum()
+    return {
+        'contributors': int(len(counts)),
+        'top': counts.head(top),
+        'top_share': float(shares.head(top).sum()),
+        'hhi': float((shares ** 2).sum()),
+    }
+
+def category_counts(frame) -> list:
+    """Per-category tool counts in the shape getCategoryInfo() builds on the site"""
+    counts = frame['category'].value_counts()
+    return [{'name': str(name), 'count': int(count)} for name, count in counts.items()]
+
+def history_stars(history, frame) -> pd.DataFrame:
+    """Current star count per tool and change since the oldest snapshot it appears in"""
+    first = history.sort_values('snapshot').groupby('id')['stars'].first()
+    current = frame.set_index('id')
+    common = current.index.intersection(first.index)
+    return pd.DataFrame({
+        'name': current.loc[common, 'name'],
+        'first': first[common],
+        'last': current.loc[common, 'stars'],
+        'delta': current.loc[common, 'stars'] - first[common],
+    }).sort_values('delta', ascending=False)
+
+# -------- Printing ------------------------------------------------------------
+def print_summary(frame, label="repositories", top=10, name_col='name'):
+    """The stats block the scrapers print at the end of a run"""
+    s = summary(frame, top, name_col)
+    print(f"\n📈 STATISTICS:")
+    print(f"   • Total {label}: {s['tools']}")
+    print(f"   • Total stars: {s['total_stars']:,}")
+    print(f"   • Average stars: {s['average_stars']:.1f}")
+    print(f"\n🏆 TOP {top} {label.upper()}:")
+    for i, (name, stars) in enumerate(s['top'].itertuples(index=False), 1):
+        print(f"   {i:2d}. {str(name)[:40]:40} {stars:8,} ⭐")
+
+def print_reports(frame, reports, history=None):
+    if 'summary' in reports:
+        print_summary(frame, "tools")
+    for column in ('category', 'language'):
+        if column in reports:
+            print(f"\n⭐ STARS BY {column.upper()}:")
+            print(stars_by(frame, column).head(25).round(1).to_string())
+    if 'freshness' in reports:
+        print("\n🕒 FRESHNESS:")
+        for band, count in freshness(frame).items():
+            print(f"   • {band:12} {count:6,}")
+    if 'contributors' in reports:
+        c = contributor_concentration(frame)
+        print(f"\n👥 CONTRIBUTORS: {c['contributors']:,} distinct, "
+              f"top 10 cover {c['top_share']:.1%} of listings, HHI {c['hhi']:.4f}")
+        for login, count in c['top'].items():
+            print(f"   • {login:30} {count:6,}")
+    if history is not None and 'history' in reports:
+        if history.empty:
+            print("\n📜 No catalog snapshots yet, so no star history")
+        else:
+            print(f"\n📜 STAR CHANGES SINCE {history['created_at'].min():%Y-%m-%d} "
+                  f"({history['snapshot'].nunique()} snapshots):")
+            print(history_stars(history, frame).head(15).to_string())
+
+REPORTS = ['summary', 'category', 'language', 'freshness', 'contributors', 'history']
+
+def main():
+    parser = argparse.ArgumentParser(description="Catalog analytics")
+    parser.add_argument('reports', nargs='*', metavar='report', help=f"One or more of: {', '.join(REPORTS)}")
+    parser.add_argument('--data', default=str(DATA_FILE))
+    parser.add_argument('--no-cache', action='store_true')
+    parser.add_argument('--category-counts', metavar='PATH', help="Write per-category counts for the site")
+    args = parser.parse_args()
+    unknown = set(args.reports) - set(REPORTS)
+    if unknown:
+        parser.error(f"unknown report(s): {', '.join(sorted(unknown))}")
+
+    frame = load_frame(args.data, use_cache=not args.no_cache)
+    reports = args.reports or REPORTS
+    history = load_history(args.data) if 'history' in reports else None
+
+    if args.category_counts:
+        with open(args.category_counts, 'w') as f:
+            json.dump(category_counts(frame), f, indent=2)
+        print(f"💾 Category counts saved to {args.category_counts}")
+        if not args.reports:
+            return
+
+    print_reports(frame, reports, history)
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
@@ -1,9 +1,9 @@
 #!/usr/bin/env python3
-import json
-import requests
-from bs4 import BeautifulSoup
+from extraction import extractor
+from partial_fetch import fetch_fields, print_stats
 import time
 import random
+from catalog import DATA_FILE, load_catalog, save_catalog, sort_by_stars, is_live
 
 def get_github_stars(url):
     """Get real-time stars from GitHub repository"""
@@ -15,50 +15,25 @@ def get_github_stars(url):
         # Add random delay to avoid being blocked
         time.sleep(random.uniform(1.0, 2.0))
         
-        response = requests.get(url, headers=headers, timeout=15)
-        if response.status_code != 200:
+        # Stars sit in the page header, so stop downloading once they are parsed
+        status, fields, _, _ = fetch_fields(url, ['stars'], headers=headers, timeout=15, defaults={})
+        if fields is None:
             return None
             
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Try multiple selectors for stars
-        selectors = [
-            '#repo-stars-counter-star',
-            'a[href$="/stargazers"] .Counter',
-            'a[href*="stargazers"] strong',
-            '[data-testid="stargazers"] .Counter',
-            'a[href*="stargazers"] span[title]'
-        ]
-        
-        for selector in selectors:
-            elem = soup.select_one(selector)
-            if elem:
-                text = elem.get_text(strip=True) or elem.get('title', '')
-                if text:
-                    # Parse number (handle k, m suffixes)
-                    text = text.lower().replace(',', '')
-                    if 'k' in text:
-                        return int(float(text.replace('k', '')) * 1000)
-                    elif 'm' in text:
-                        return int(float(text.replace('m', '')) * 1000000)
-                    elif text.isdigit():
-                        return int(text)
-        
-        return None
+        return fields['stars']
         
     except Exception as e:
         print(f"❌ Error fetching {url}: {e}")
         return None
 
-def main():
+def main(data_file=DATA_FILE):
     """Update GitHub stars in smaller batches"""
-    with open('../data/mcp-data.json', 'r') as f:
-        data = json.load(f)
+    data = load_catalog(data_file)
     
     # Get all GitHub URLs with current stars
     github_repos = []
     for i, tool in enumerate(data):
-        if tool.get('githubUrl'):
+        if is_live(tool):
             github_repos.append((i, tool))
     
     print(f"🚀 Found {len(github_repos)} repositories to update")
@@ -97,16 +72,18 @@ def main():
             time.sleep(10)
     
     # Sort by updated stars
-    data.sort(key=lambda x: x.get('stars', 0), reverse=True)
+    sort_by_stars(data)
     
     # Save updated data
-    with open('../data/mcp-data.json', 'w') as f:
-        json.dump(data, f, indent=2)
+    save_catalog(data, data_file)
     
     print(f"\n🎉 Successfully updated {updated_count} repositories!")
     print("\n🏆 Top 10 repositories by stars:")
     for i, tool in enumerate(data[:10], 1):
         print(f"  {i:2d}. {tool['name'][:40]:40} {tool.get('stars', 0):8,} ⭐")
+    
+    extractor.print_report()
+    print_stats()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Catalog Helpers
+Shared loading, saving and merging for data/mcp-data.json so the scripts stop
+re-implementing the same update logic.
+"""
+
+import re
+import sys
+import json
+import time
+import pathlib
+
+from changeset import diff_catalogs, is_empty, summary
+from schema import normalize_catalog
+
+DATA_FILE = pathlib.Path(__file__).resolve().parent.parent / "data" / "mcp-data.json"
+MAX_TAGS = 6
+
+# One changeset file per run, named by when the run started
+RUN_ID = time.strftime("%Y%m%d-%H%M%S")
+
+# Catalog text as first loaded this run, per path, to diff saves against
+_baselines = {}
+# Paths whose pre-run version is already in the snapshot store
+_snapshotted = set()
+
+def repo_slug(url: str) -> str:
+    """Extract owner/repo from GitHub URL"""
+    m = re.search(r"github\.com[:/](.+?)/(.+?)(?:\.git|/|$)", url)
+    if not m:
+        raise ValueError(f"Bad GitHub URL: {url}")
+    return f"{m.group(1)}/{m.group(2)}"
+
+def is_live(tool):
+    """Has a githubUrl that the link checker has not marked dead"""
+    return bool(tool.get('githubUrl')) and not tool.get('dead')
+
+def load_catalog(path=DATA_FILE):
+    """Load the MCP tool list"""
+    with open(path, 'r') as f:
+        text = f.read()
+    _baselines.setdefault(pathlib.Path(path).resolve(), text)
+    return json.loads(text)
+
+def sort_by_stars(data):
+    """Sort by stars (descending); the sort is stable, so ties keep their previous order"""
+    data.sort(key=lambda x: x.get('stars', 0), reverse=True)
+    return data
+
+def _baseline(key):
+    """The catalog at ``key`` as first loaded this run, or None if there is none or it does not parse"""
+    text = _baselines.get(key)
+    if text is None:
+        return None
+    try:
+        return json.loads(text)
+    except ValueError as e:
+        print(f"⚠️  {key.name} was not valid JSON before this run ({e}); "
+              f"it is replaced without a snapshot or changeset", file=sys.stderr)
+        return None
+
+def _snapshot_baseline(key, baseline):
+    """Snapshot the version this run replaces; a failure is reported but never blocks the save"""
+    from snapshots import SnapshotStore
+    try:
+        with SnapshotStore.for_catalog(key) as store:
+            store.take(baseline, f"before run {RUN_ID}", _baselines[key])
+    except Exception as e:
+        print(f"⚠️  Could not snapshot the previous {key.name}: {e}", file=sys.stderr)
+
+def changeset_path(path=DATA_FILE):
+    return pathlib.Path(path).resolve().parent / "changesets" / f"{RUN_ID}.json"
+
+def save_catalog(data, path=DATA_FILE):
+    """Validate, normalize and write the MCP tool list in the repo's JSON layout.
+
+    Entries are coerced to the schema (see schema.py) on the way out; an
+    entry that cannot be coerced raises ValidationError and nothing is
+    written. Also writes this run's changeset (everything that differs from the
+    catalog as first loaded) next to it under changesets/, so the site can
+    rebuild only the affected pages. The first save of a run snapshots the
+    version it replaces (see snapshots.py).
+    """
+    data = normalize_catalog(data)
+    key = pathlib.Path(path).resolve()
+    if key not in _baselines and key.exists():
+        _baselines[key] = key.read_text()
+    baseline = _baseline(key)
+    if baseline is not None and key not in _snapshotted:
+        _snapshotted.add(key)
+        _snapshot_baseline(key, baseline)
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
+
+    if baseline is None:
+        return None
+    changes = diff_catalogs(baseline, data)
+    out = changeset_path(path)
+    if is_empty(changes):
+        out.unlink(missing_ok=True)
+        return changes
+    out.parent.mkdir(exist_ok=True)
+    with open(out, 'w') as f:
+        json.dump(changes, f, separators=(',', ':'))
+    print(f"📝 Changeset {out.name}: {summary(changes)}")
+    return changes
+
+def repo_record(url, fields):
+    """Build the raw scrape record for one repo from extracted page fields"""
+    return {
+        "slug": repo_slug(url),
+        "url": url,
+        "stars": fields['stars'],
+        "forks": fields['forks'],
+        "watchers": fields['watchers'],
+        "description": fields['description'],
+        "language": fields['language'],
+        "topics": fields['topics'],
+        "license": fields['license'],
+        "last_commit": fields['last_commit'],
+        "scraped_at": time.strftime("%Y-%m-%d %H:%M:%S")
+    }
+
+def apply_github_data(tool, github_info):
+    """Update one catalog entry in place with a scrape record.
+
+    Deterministic, so applying the same record twice leaves the entry unchanged.
+    """
+    tool.update({
+        'stars': github_info['stars'],
+        'forks': github_info.get('forks', 0),
+        'watchers': github_info.get('watchers', 0),
+        'description': github_info['description'] or tool.get('description', ''),
+        'language': github_info['language'] if github_info['language'] != 'unknown' else tool.get('language', 'typescript'),
+        'topics': github_info.get('topics', []),
+        'license': github_info.get('license'),
+        'lastUpdated': github_info.get('last_commit') or tool.get('lastUpdated', ''),
+        'scraped_at': github_info['scraped_at']
+    })
+
+    # Update tags with topics in canonical spelling, keeping existing tags first
+    if github_info.get('topics'):
+        from classify import canonical_tag
+        tags = list(dict.fromkeys(tool.get('tags', []) + [canonical_tag(t) for t in github_info['topics']]))
+        tool['tags'] = tags[:MAX_TAGS]
+    return tool
+
+def merge_github_data(mcp_data, results):
+    """Apply scrape records to the catalog, matched on githubUrl"""
+    github_data_lookup = {item['url']: item for item in results}
+    for tool in mcp_data:
+        github_info = github_data_lookup.get(tool.get('githubUrl', ''))
+        if github_info:
+            apply_github_data(tool, github_info)
+    return mcp_data
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Catalog Changesets
+Structural diff between two versions of mcp-data.json: which ids were added,
+removed, or had which fields changed, plus the page slugs and categories the
+site needs to rebuild.
+
+    python changeset.py old.json new.json
+"""
+
+import re
+import sys
+import json
+import time
+
+def generate_slug(name: str) -> str:
+    """Same slug rules as generateSlug in lib/mcp-data.ts"""
+    slug = re.sub(r'[^a-z0-9\s-]', '', name.lower().strip())
+    slug = re.sub(r'\s+', '-', slug)
+    slug = re.sub(r'-+', '-', slug)
+    return slug.strip('-')
+
+# Run bookkeeping that every scrape rewrites; a change to these alone is not a
+# change to the tool, so it marks no field, page or category
+BOOKKEEPING_FIELDS = frozenset({'scraped_at'})
+
+def diff_catalogs(old, new):
+    """Compare two tool lists by id, ignoring BOOKKEEPING_FIELDS"""
+    old_by_id = {tool['id']: tool for tool in old}
+    new_by_id = {tool['id']: tool for tool in new}
+
+    added = [i for i in new_by_id if i not in old_by_id]
+    removed = [i for i in old_by_id if i not in new_by_id]
+    changed = {}
+    for i, tool in new_by_id.items():
+        before = old_by_id.get(i)
+        if before is None or before == tool:
+            continue
+        fields = sorted(k for k in before.keys() | tool.keys()
+                        if k not in BOOKKEEPING_FIELDS and before.get(k) != tool.get(k))
+        if fields:
+            changed[i] = fields
+
+    slugs, categories = set(), set()
+    for i in added + list(changed):
+        slugs.add(generate_slug(new_by_id[i]['name']))
+        categories.add(new_by_id[i].get('category'))
+    for i in removed + list(changed):
+        slugs.add(generate_slug(old_by_id[i]['name']))
+        categories.add(old_by_id[i].get('category'))
+
+    return {
+        'generated_at': time.strftime("%Y-%m-%d %H:%M:%S"),
+        'count': len(new),
+        'added': added,
+        'removed': removed,
+        'changed': changed,
+        'order_changed': [t['id'] for t in old if t['id'] in new_by_id] != [t['id'] for t in new if t['id'] in old_by_id],
+        'slugs': sorted(slugs),
+        'categories': sorted(c for c in categories if c),
+    }
+
+def is_empty(changeset):
+    return not (changeset['added'] or changeset['removed'] or changeset['changed'] or changeset['order_changed'])
+
+def summary(changeset):
+    return (f"+{len(changeset['added'])} added, -{len(changeset['removed'])} removed, "
+            f"~{len(changeset['changed'])} changed, {len(changeset['slugs'])} pages affected")
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print(__doc__.strip())
+        sys.exit(1)
+    with open(sys.argv[1]) as f:
+        old = json.load(f)
+    with open(sys.argv[2]) as f:
+        new = json.load(f)
+    print(json.dumps(diff_catalogs(old, new), indent=2))
@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+"""
+Category & Tag Classifier
+Assigns a category and canonical tags to catalog entries from their GitHub
+topics, name, description and (when a cached repo page has one) README text.
+All keywords are compiled once into a single Aho–Corasick automaton over
+word tokens, so each text is scanned in one pass no matter how many keywords
+the taxonomy has. Every prediction carries a confidence score, and the
+review report lists them so low-confidence calls can be checked by hand.
+
+    python classify.py                        # write data/classification.json and summarize
+    python classify.py --apply                # also update categories/tags at confidence >= 0.7
+    python classify.py --apply --min-confidence 0.8
+    python classify.py --bench 100000         # time a batch on a synthetic import
+"""
+
+import re
+import sys
+import json
+import html
+import math
+import time
+import pathlib
+import argparse
+from collections import deque
+
+from catalog import DATA_FILE, MAX_TAGS, load_catalog, save_catalog, repo_slug
+
+REPORT_FILE = DATA_FILE.parent / "classification.json"
+CACHE_DIR = DATA_FILE.parent / "github_cache"
+FALLBACK_CATEGORY = 'utilities'
+DEFAULT_MIN_CONFIDENCE = 0.7
+MIN_TAG_SCORE = 2.0
+
+# How much one keyword hit counts, by where it was found
+SOURCE_WEIGHTS = {'topics': 3.0, 'name': 2.5, 'description': 1.0, 'readme': 0.5}
+
+TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+# -------- Taxonomy ------------------------------------------------------------
+# category -> {keyword phrase: weight}. Phrases are matched on whole words.
+CATEGORY_KEYWORDS = {
+    'database': {
+        'database': 1.5, 'sql': 1.5, 'postgres': 2, 'postgresql': 2, 'mysql': 2, 'mariadb': 2, 'sqlite': 2,
+        'mongodb': 2, 'mongo': 1.5, 'redis': 2, 'elasticsearch': 2, 'opensearch': 2, 'clickhouse': 2,
+        'snowflake': 2, 'bigquery': 2, 'duckdb': 2, 'neo4j': 2, 'cassandra': 2, 'dynamodb': 2,
+        'supabase': 1.5, 'firestore': 2, 'vector database': 2, 'qdrant': 2, 'pinecone': 2, 'chroma': 1.5,
+        'milvus': 2, 'weaviate': 2, 'query': 0.5, 'schema': 0.5, 'orm': 1, 'prisma': 1.5, 'airtable': 1,
+    },
+    'automation': {
+        'automation': 1.5, 'browser': 1.5, 'playwright': 2, 'puppeteer': 2, 'selenium': 2, 'headless': 1.5,
+        'scraping': 1.5, 'scraper': 1.5, 'crawler': 1.5, 'crawl': 1, 'screenshot': 1, 'workflow': 1,
+        'zapier': 2, 'n8n': 2, 'make com': 1.5, 'ifttt': 2, 'rpa': 2, 'testing': 0.5,
+    },
+    'cloud': {
+        'aws': 2, 'amazon web services': 2, 'azure': 2, 'gcp': 2, 'google cloud': 2, 'cloudflare': 2,
+        'kubernetes': 2, 'k8s': 2, 'docker': 1.5, 'terraform': 2, 'pulumi': 2, 'helm': 1.5, 'lambda': 1,
+        's3': 1.5, 'vercel': 1.5, 'netlify': 1.5, 'heroku': 1.5, 'cloud': 1, 'serverless': 1.5,
+        'infrastructure': 1, 'iac': 1.5, 'devops': 1, 'digitalocean': 2,
+    },
+    'development': {
+        'git': 1.5, 'github': 1, 'gitlab': 1.5, 'bitbucket': 1.5, 'code': 0.5, 'compiler': 1.5,
+        'debugger': 1.5, 'debug': 1, 'lint': 1, 'linter': 1.5, 'ide': 1, 'vscode': 1.5, 'xcode': 1.5,
+        'npm': 1, 'pypi': 1, 'sdk': 0.5, 'cli': 0.5, 'ci': 1, 'jenkins': 1.5, 'sentry': 1.5,
+        'code review': 1.5, 'refactor': 1, 'language server': 2, 'lsp': 1.5, 'simulator': 1,
+    },
+    'communication': {
+        'slack': 2, 'discord': 2, 'telegram': 2, 'whatsapp': 2, 'email': 1.5, 'gmail': 2, 'smtp': 2,
+        'imap': 2, 'twilio': 2, 'sms': 1.5, 'teams': 1, 'chat': 1, 'messaging': 1.5, 'twitter': 1.5,
+        'x com': 1, 'bluesky': 2, 'mastodon': 2, 'linkedin': 1.5, 'zoom': 1.5, 'matrix': 0.5,
+    },
+    'productivity': {
+        'notion': 2, 'obsidian': 2, 'todoist': 2, 'trello': 2, 'asana': 2, 'jira': 2, 'linear': 1,
+        'calendar': 1.5, 'google calendar': 2, 'google drive': 1.5, 'google sheets': 1.5, 'excel': 1.5,
+        'spreadsheet': 1.5, 'notes': 1, 'note taking': 1.5, 'task': 0.5, 'todo': 1.5, 'confluence': 2,
+        'clickup': 2, 'monday': 1, 'evernote': 2, 'markdown': 0.5, 'hackmd': 1.5, 'mind map': 1.5,
+    },
+    'security': {
+        'security': 1.5, 'vulnerability': 2, 'pentest': 2, 'pentesting': 2, 'exploit': 1.5, 'cve': 2,
+        'malware': 2, 'threat': 1.5, 'osint': 2, 'nmap': 2, 'burp': 2, 'shodan': 2, 'virustotal': 2,
+        'siem': 2, 'authentication': 0.5, 'oauth': 1, 'secrets': 1, 'vault': 1, 'encryption': 1.5,
+        'recon': 1, 'forensics': 2, 'ghidra': 2, 'ida': 1, 'reverse engineering': 2,
+    },
+    'api': {
+        'api': 0.5, 'rest api': 0.5, 'graphql': 1.5, 'openapi': 2, 'swagger': 2, 'webhook': 1, 'grpc': 1.5,
+        'postman': 1.5, 'http client': 0.5,
+    },
+    'filesystem': {
+        'filesystem': 2, 'file system': 2, 'files': 1, 'directory': 1, 'folder': 1, 'file': 0.5,
+        'dropbox': 1.5, 'onedrive': 1.5, 'box com': 1, 'ftp': 1.5, 'sftp': 1.5, 'storage': 0.5, 'pdf': 0.5,
+    },
+}
+
+# canonical tag -> other spellings of the same thing (the canonical name
+# itself always matches too). Only true variants belong here: related
+# products or broader terms ("mariadb", "crypto", "mail") would rewrite
+# topics into tags that mean something else.
+TAG_SYNONYMS = {
+    'postgresql': ['postgres'],
+    'mysql': [],
+    'sqlite': ['sqlite3'],
+    'mongodb': ['mongo'],
+    'redis': [],
+    'elasticsearch': ['elastic search'],
+    'vector-database': ['vector db', 'vectordb'],
+    'sql': [],
+    'browser': [],
+    'playwright': [],
+    'puppeteer': [],
+    'scraping': ['web scraping', 'webscraping'],
+    'aws': ['amazon web services'],
+    'azure': [],
+    'gcp': ['google cloud platform'],
+    'cloudflare': [],
+    'kubernetes': ['k8s'],
+    'docker': [],
+    'terraform': [],
+    'iac': ['infrastructure as code'],
+    'git': [],
+    'github': [],
+    'gitlab': [],
+    'slack': [],
+    'discord': [],
+    'telegram': [],
+    'email': ['e mail'],
+    'notion': [],
+    'obsidian': [],
+    'jira': [],
+    'calendar': [],
+    'spreadsheet': ['spreadsheets'],
+    'task-management': [],
+    'security': [],
+    'osint': [],
+    'vulnerability-scanning': ['vulnerability scanner'],
+    'graphql': [],
+    'openapi': [],
+    'filesystem': ['file system'],
+    'search': [],
+    'finance': [],
+    'youtube': [],
+    'image-generation': [],
+    'memory': [],
+    'testing': [],
+}
+
+# -------- Automaton -----------------------------------------------------------
+def tokens(text):
+    return TOKEN_RE.findall(text.lower())
+
+class KeywordAutomaton:
+    """Aho–Corasick automaton over word tokens.
+
+    Patterns are token sequences, so matches always fall on word
+    boundaries and multi-word phrases ("google cloud") are single patterns.
+    ``scan`` yields the payloads of every pattern occurrence in one pass.
+    """
+
+    def __init__(self):
+        self.goto = [{}]
+        self.fail = [0]
+        self.out = [[]]
+        self.compiled = False
+
+    def add(self, phrase, payload):
+        state = 0
+        for token in tokens(phrase):
+            nxt = self.goto[state].get(token)
+            if nxt is None:
+                nxt = len(self.goto)
+                self.goto[state][token] = nxt
+                self.goto.append({})
+                self.fail.append(0)
+                self.out.append([])
+            state = nxt
+        if state:
+            self.out[state].append(payload)
+        self.compiled = False
+
+    def compile(self):
+        """Breadth-first failure links; each state inherits its fallback's outputs"""
+        queue = deque(self.goto[0].values())
+        for state in queue:
+            self.fail[state] = 0
+        while queue:
+            state = queue.popleft()
+            for token, nxt in self.goto[state].items():
+                queue.append(nxt)
+                f = self.fail[state]
+                while f and token not in self.goto[f]:
+                    f = self.fail[f]
+                target = self.goto[f].get(token, 0)
+                self.fail[nxt] = target if target != nxt else 0
+                self.out[nxt] = self.out[nxt] + self.out[self.fail[nxt]]
+        self.compiled = True
+        return self
+
+    def scan(self, words):
+        goto, fail, out = self.goto, self.fail, self.out
+        state = 0
+        for token in words:
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            if out[state]:
+                yield from out[state]
+
+def build_automaton():
+    """One automaton for every category keyword and tag synonym.
+
+    Payloads are (pattern id, kind, label, weight); the pattern id lets a
+    source count each keyword once however often it repeats.
+    """
+    automaton = KeywordAutomaton()
+    pattern = 0
+    for category, keywords in CATEGORY_KEYWORDS.items():
+        for phrase, weight in keywords.items():
+            automaton.add(phrase, (pattern, 'category', category, weight))
+            pattern += 1
+    for tag, synonyms in TAG_SYNONYMS.items():
+        for phrase in [tag.replace('-', ' ')] + synonyms:
+            automaton.add(phrase, (pattern, 'tag', tag, 1.0))
+            pattern += 1
+    return automaton.compile()
+
+_automaton = None
+
+def automaton():
+    global _automaton
+    if _automaton is None:
+        _automaton = build_automaton()
+    return _automaton
+
+_CANONICAL = {syn.replace(' ', '-'): tag for tag, synonyms in TAG_SYNONYMS.items() for syn in synonyms}
+
+def canonical_tag(tag):
+    """Map a tag or topic to its canonical spelling ("postgres" → "postgresql")"""
+    tag = tag.strip().lower().replace(' ', '-')
+    return _CANONICAL.get(tag, tag)
+
+# -------- Classifying ---------------------------------------------------------
+_ARTICLE_RE = re.compile(r'<article[^>]*markdown-body[^>]*>(.*?)</article>', re.S)
+_TAG_RE = re.compile(r'<[^>]+>')
+
+def readme_text(tool, cache_dir=CACHE_DIR):
+    """README text from the scraper's cached repo page, '' when not cached"""
+    try:
+        page = (cache_dir / f"{repo_slug(tool['githubUrl']).replace('/', '__')}.html").read_text(encoding='utf-8')
+    except (OSError, ValueError, KeyError):
+        return ''
+    m = _ARTICLE_RE.search(page)
+    return html.unescape(_TAG_RE.sub(' ', m.group(1))) if m else ''
+
+def classify(tool, readme=''):
+    """Predict (category, confidence, category scores, [(tag, score)]) for one entry"""
+    sources = {
+        'topics': ' '.join(t.replace('-', ' ') for t in tool.get('topics', []) + tool.get('tags', [])),
+        'name': tool.get('name', ''),
+        'description': tool.get('description', ''),
+        'readme': readme,
+    }
+    scan = automaton().scan
+    categories, tags = {}, {}
+    for source, text in sources.items():
+        if not text:
+            continue
+        weight = SOURCE_WEIGHTS[source]
+        seen = set()
+        for pattern, kind, label, value in scan(tokens(text)):
+            if pattern in seen:
+                continue
+            seen.add(pattern)
+            scores = categories if kind == 'category' else tags
+            scores[label] = scores.get(label, 0.0) + value * weight
+
+    if not categories:
+        category, confidence = FALLBACK_CATEGORY, 0.0
+    else:
+        category = max(categories, key=categories.get)
+        best = categories[category]
+        # Share of the evidence, discounted when there is little of it
+        confidence = best / sum(categories.values()) * (1 - math.exp(-best / 2))
+    ranked_tags = sorted(((t, s) for t, s in tags.items() if s >= MIN_TAG_SCORE), key=lambda x: -x[1])
+    return category, round(confidence, 3), categories, ranked_tags[:MAX_TAGS]
+
+def classify_catalog(data, cache_dir=CACHE_DIR):
+    """Review records for every entry, in catalog order"""
+    report = []
+    for tool in data:
+        category, confidence, scores, tags = classify(tool, readme_text(tool, cache_dir))
+        report.append({
+            'id': tool['id'],
+            'name': tool['name'],
+            'category': tool.get('category'),
+            'predicted': category,
+            'confidence': confidence,
+            'scores': {c: round(s, 2) for c, s in sorted(scores.items(), key=lambda x: -x[1])[:3]},
+            'tags': [[t, round(s, 2)] for t, s in tags],
+        })
+    return report
+
+def apply_classification(data, report, min_confidence=DEFAULT_MIN_CONFIDENCE):
+    """Set categories and tags from the report where confident; returns counts"""
+    by_id = {row['id']: row for row in report}
+    recategorized = retagged = 0
+    for tool in data:
+        row = by_id.get(tool['id'])
+        if row is None or row['confidence'] < min_confidence:
+            continue
+        if row['predicted'] != tool.get('category'):
+            tool['category'] = row['predicted']
+            recategorized += 1
+        # Classifier tags first, then the existing ones in canonical spelling
+        tags = list(dict.fromkeys([t for t, _ in row['tags']] + [canonical_tag(t) for t in tool.get('tags', [])]))
+        if tags[:MAX_TAGS] != tool.get('tags'):
+            tool['tags'] = tags[:MAX_TAGS]
+            retagged += 1
+    return {'recategorized': recategorized, 'retagged': retagged}
+
+# -------- Reporting -----------------------------------------------------------
+def print_summary(report, min_confidence=DEFAULT_MIN_CONFIDENCE):
+    confident = [r for r in report if r['confidence'] >= min_confidence]
+    agree = sum(1 for r in report if r['predicted'] == r['category'])
+    moves = [r for r in confident if r['predicted'] != r['category']]
+    print(f"\n🏷️  CLASSIFICATION of {len(report):,} entries:")
+    print(f"   • Agrees with current category: {agree:,} ({agree / max(len(report), 1):.0%})")
+    print(f"   • Confident (>= {min_confidence}): {len(confident):,}")
+    print(f"   • Confident category changes: {len(moves):,}")
+    for r in moves[:15]:
+        print(f"     - {r['name'][:35]:35} {r['category']:>13} → {r['predicted']:13} ({r['confidence']:.2f})")
+    if len(moves) > 15:
+        print(f"     … {len(moves) - 15} more in the report")
+
+def benchmark(n, data_file=DATA_FILE):
+    with open(data_file, 'r') as f:
+        base = json.load(f)
+    data = [dict(base[i % len(base)], id=i) for i in range(n)]
+    start = time.perf_counter()
+    build_automaton()
+    built = time.perf_counter()
+    for tool in data:
+        classify(tool)
+    done = time.perf_counter()
+    print(f"📊 {n:,} entries: automaton built in {(built - start) * 1000:.1f} ms, "
+          f"classified in {done - built:.2f} s ({n / (done - built):,.0f}/s)")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Classify catalog entries into categories and canonical tags")
+    parser.add_argument('--data', default=str(DATA_FILE))
+    parser.add_argument('--report', help="Default: classification.json next to --data")
+    parser.add_argument('--apply', action='store_true', help="Write confident predictions to the catalog")
+    parser.add_argument('--min-confidence', type=float, default=DEFAULT_MIN_CONFIDENCE)
+    parser.add_argument('--bench', type=int, metavar='N', help="Time classifying N synthetic entries instead")
+    args = parser.parse_args(argv)
+
+    if args.bench:
+        benchmark(args.bench, args.data)
+        return
+    args.report = args.report or str(pathlib.Path(args.data).parent / REPORT_FILE.name)
+    data = load_catalog(args.data)
+    report = classify_catalog(data)
+    with open(args.report, 'w') as f:
+        json.dump(report, f, indent=2)
+    print_summary(report, args.min_confidence)
+    print(f"\n💾 Review report saved to {args.report}")
+    if args.apply:
+        counts = apply_classification(data, report, args.min_confidence)
+        save_catalog(data, args.data)
+        print(f"✨ {counts['recategorized']} entries recategorized, {counts['retagged']} retagged")
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n\n⏹️  Operation cancelled by user")
+        sys.exit(1)
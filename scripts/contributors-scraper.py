@@ -4,18 +4,23 @@ GitHub Contributors Scraper
 Fetches contributors data from GitHub repository pages and updates the MCP data
 """
 
-import json
 import requests
 from bs4 import BeautifulSoup
 import time
 import sys
+import asyncio
 import os
 from urllib.parse import urlparse
 import re
+from catalog import DATA_FILE, load_catalog, save_catalog, is_live
+from pipeline import Pipeline, Stage
+from failure_ledger import FailureLedger, failure_kind
 
 def get_repo_contributors(github_url, max_contributors=5):
     """
-    Scrape contributors from GitHub repository main page
+    Scrape contributors from GitHub repository main page.
+    Returns (contributors, failure kind); the kind is None whenever the page
+    was fetched, even if it lists no contributors.
     """
     try:
         # Clean the URL
@@ -39,7 +44,7 @@ def get_repo_contributors(github_url, max_contributors=5):
         
         if response.status_code != 200:
             print(f"  ❌ Failed to fetch page (Status: {response.status_code})")
-            return []
+            return [], failure_kind(response.status_code, headers=response.headers, body=response.text)
         
         soup = BeautifulSoup(response.text, 'html.parser')
         contributors = []
@@ -123,124 +128,105 @@ def get_repo_contributors(github_url, max_contributors=5):
         else:
             print(f"  ⚠️  No contributors found")
             
-        return contributors
+        return contributors, None
         
     except Exception as e:
         print(f"  ❌ Error fetching contributors: {e}")
-        return []
+        return [], failure_kind(error=e)
 
-def update_contributors_data():
+def run_contributors_job(data, data_file, tools, delay, keep_empty=False, save_every=10):
     """
-    Update the MCP data with contributors information
+    Scrape contributors for ``tools`` (entries of ``data``) through a pipeline.
+    Each result is applied as soon as it arrives and the catalog is saved
+    every ``save_every`` results. Repos the failure ledger holds back after
+    repeated failures are skipped.
     """
-    data_file = '../data/mcp-data.json'
-    
-    # Read current data
-    with open(data_file, 'r') as f:
-        data = json.load(f)
-    
-    print(f"📊 Processing {len(data)} MCP tools for contributors data...")
-    
-    updated_count = 0
-    failed_count = 0
-    
-    for i, tool in enumerate(data, 1):
-        github_url = tool.get('githubUrl', '')
-        
-        if not github_url:
+    pending = []
+    for tool in tools:
+        if not is_live(tool):
             continue
-            
-        print(f"\n[{i:3d}/{len(data)}] {tool['name'][:50]}")
-        
         # Skip if contributors already exist and have data
         if tool.get('contributors') and len(tool.get('contributors', [])) > 0:
-            print(f"  ⏭️  Already has {len(tool['contributors'])} contributors, skipping")
+            print(f"  ⏭️  {tool['name'][:50]}: already has {len(tool['contributors'])} contributors, skipping")
             continue
-        
-        contributors = get_repo_contributors(github_url, max_contributors=5)
-        
+        pending.append(tool)
+    
+    ledger = FailureLedger.for_catalog('contributors', data_file)
+    pending, held = ledger.partition(pending, lambda tool: tool['githubUrl'])
+    if held:
+        print(f"  ⏸️  {len(held)} repositories held back after repeated failures (see failure_ledger.py)")
+    
+    counts = {'updated': 0, 'failed': 0, 'processed': 0, 'held': len(held)}
+    
+    def fetch(tool):
+        print(f"\n[{tool['name'][:50]}] ({tool.get('stars', 0)} ⭐)")
+        contributors, failure = get_repo_contributors(tool['githubUrl'], max_contributors=5)
+        # Add delay to be respectful
+        time.sleep(delay)
+        return tool, contributors, failure
+    
+    def store(result):
+        tool, contributors, failure = result
+        if failure is None:
+            # A page that lists no contributors is not the repo failing
+            ledger.record_success(tool['githubUrl'])
+        else:
+            ledger.record_failure(tool['githubUrl'], failure)
         if contributors:
             tool['contributors'] = contributors
-            updated_count += 1
+            counts['updated'] += 1
             print(f"  ✅ Updated with {len(contributors)} contributors")
         else:
-            tool['contributors'] = []
-            failed_count += 1
-            print(f"  ❌ No contributors found")
-        
-        # Add delay to be respectful
-        time.sleep(1)
-        
-        # Save progress every 10 items
-        if i % 10 == 0:
-            with open(data_file, 'w') as f:
-                json.dump(data, f, indent=2)
-            print(f"\n💾 Progress saved ({i}/{len(data)} processed)")
+            if keep_empty:
+                tool['contributors'] = []
+            counts['failed'] += 1
+            print(f"  ❌ No contributors found ({failure or 'none listed'})")
+        counts['processed'] += 1
+        if counts['processed'] % save_every == 0:
+            save_catalog(data, data_file)
+            print(f"\n💾 Progress saved ({counts['processed']}/{len(pending)} processed)")
+    
+    # One blocking worker keeps the original request pacing
+    asyncio.run(Pipeline(pending, [Stage('contributors', fetch, blocking=True)], store).run())
+    ledger.close()
+    save_catalog(data, data_file)
+    return counts
+
+def update_contributors_data(data_file=DATA_FILE):
+    """
+    Update the MCP data with contributors information
+    """
+    # Read current data
+    data = load_catalog(data_file)
     
-    # Final save
-    with open(data_file, 'w') as f:
-        json.dump(data, f, indent=2)
+    print(f"📊 Processing {len(data)} MCP tools for contributors data...")
+    
+    counts = run_contributors_job(data, data_file, data, delay=1, keep_empty=True)
     
     print(f"\n✨ Contributors update complete!")
-    print(f"  ✅ Successfully updated: {updated_count} tools")
-    print(f"  ❌ Failed to get contributors: {failed_count} tools")
+    print(f"  ✅ Successfully updated: {counts['updated']} tools")
+    print(f"  ❌ Failed to get contributors: {counts['failed']} tools")
     print(f"  📊 Total processed: {len(data)} tools")
     
-    return updated_count
+    return counts['updated']
 
-def update_top_repositories_only():
+def update_top_repositories_only(data_file=DATA_FILE):
     """
     Update only the top repositories that are likely to be viewed most
     """
-    data_file = '../data/mcp-data.json'
-    
-    with open(data_file, 'r') as f:
-        data = json.load(f)
+    data = load_catalog(data_file)
     
     # Sort by stars and take top 50
     top_tools = sorted(data, key=lambda x: x.get('stars', 0), reverse=True)[:50]
     
     print(f"🎯 Updating contributors for top {len(top_tools)} repositories...")
     
-    updated_count = 0
-    
-    for i, tool in enumerate(top_tools, 1):
-        github_url = tool.get('githubUrl', '')
-        
-        if not github_url:
-            continue
-            
-        print(f"\n[{i:2d}/{len(top_tools)}] {tool['name'][:50]} ({tool.get('stars', 0)} ⭐)")
-        
-        # Skip if contributors already exist
-        if tool.get('contributors') and len(tool.get('contributors', [])) > 0:
-            print(f"  ⏭️  Already has {len(tool['contributors'])} contributors")
-            continue
-        
-        contributors = get_repo_contributors(github_url, max_contributors=5)
-        
-        if contributors:
-            # Find the tool in the main data and update it
-            for main_tool in data:
-                if main_tool['id'] == tool['id']:
-                    main_tool['contributors'] = contributors
-                    break
-            updated_count += 1
-            print(f"  ✅ Updated with {len(contributors)} contributors")
-        else:
-            print(f"  ❌ No contributors found")
-        
-        # Add delay
-        time.sleep(2)
-    
-    # Save the updated data
-    with open(data_file, 'w') as f:
-        json.dump(data, f, indent=2)
+    counts = run_contributors_job(data, data_file, top_tools, delay=2)
     
     print(f"\n✨ Top repositories contributors update complete!")
-    print(f"  ✅ Successfully updated: {updated_count} tools")
+    print(f"  ✅ Successfully updated: {counts['updated']} tools")
     
-    return updated_count
+    return counts['updated']
 
 if __name__ == "__main__":
     try:
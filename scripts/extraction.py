@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+GitHub Page Extraction Engine
+Pulls repository fields out of GitHub HTML, trying cheap regex/JSON fast paths
+over the embedded payloads first and only parsing the DOM when those miss.
+Every extraction records which strategy produced each field so markup drift
+shows up in the stats instead of as silent zeros.
+"""
+
+import re
+import json
+import html as html_lib
+from collections import Counter, defaultdict
+
+MAX_TOPICS = 6
+IGNORED_LANGUAGES = {'repository', 'code', 'issues', 'pull', 'requests'}
+
+# -------- Value parsing -------------------------------------------------------
+def parse_number(text: str) -> int:
+    """Parse GitHub counter numbers (handles k, m suffixes)"""
+    if not text:
+        return 0
+    text = text.strip().lower().replace(',', '')
+    if 'k' in text:
+        return int(float(text.replace('k', '')) * 1000)
+    elif 'm' in text:
+        return int(float(text.replace('m', '')) * 1000000)
+    else:
+        return int(text)
+
+def is_counter(text: str) -> bool:
+    """Check whether text looks like a GitHub counter (e.g. 1,234 or 1.2k)"""
+    return bool(text) and text.lower().replace(',', '').replace('k', '').replace('m', '').replace('.', '').isdigit()
+
+def clean_description(text: str) -> str:
+    """Strip the boilerplate GitHub appends to meta descriptions"""
+    text = html_lib.unescape(text or '').strip()
+    text = re.sub(r'\s*Contribute to \S+ development by creating an account on GitHub\.?$', '', text)
+    return re.sub(r'\s*-\s*\S+/\S+$', '', text).strip()
+
+# -------- Strategies ----------------------------------------------------------
+class Strategy:
+    """A named way of extracting one field.
+
+    ``text`` strategies run on the raw HTML string (and so also on a partial
+    body); ``dom`` strategies need the parsed BeautifulSoup tree. Text
+    strategies too generic to trust on a prefix (where a better match may
+    still follow) set ``partial=False`` and only run on complete pages.
+    """
+
+    __slots__ = ('name', 'kind', 'func', 'partial')
+
+    def __init__(self, name, kind, func, partial=True):
+        self.name = name
+        self.kind = kind
+        self.func = func
+        self.partial = partial
+
+def regex(name, pattern, convert=lambda m: m.group(1), partial=True):
+    """Build a text strategy from a regex; ``convert`` turns the match into a value"""
+    compiled = re.compile(pattern, re.S)
+
+    def run(page):
+        m = compiled.search(page.html, page.start)
+        return convert(m) if m else None
+
+    return Strategy(name, 'text', run, partial)
+
+def dom(name, func):
+    """Build a DOM strategy; ``func`` receives the parsed soup"""
+    return Strategy(name, 'dom', lambda page: func(page.soup))
+
+def _counter(m):
+    return parse_number(m.group(1))
+
+def _language(m):
+    lang = html_lib.unescape(m.group(1)).strip().lower()
+    return lang if lang and lang not in IGNORED_LANGUAGES else None
+
+def _json_list(m):
+    try:
+        items = json.loads('[' + m.group(1) + ']')
+    except ValueError:
+        return None
+    topics = [item.lower() for item in items if isinstance(item, str) and item]
+    return topics[:MAX_TOPICS] or None
+
+def _topic_titles(page):
+    matches = list(_TOPIC_TITLE_RE.finditer(page.html, page.start))
+    # On a partial body the topic list may continue past the end of the buffer
+    if page.partial and matches and matches[-1].end() + TOPIC_SETTLE > len(page.html):
+        return None
+    topics = [m.group(1).lower() for m in matches]
+    return list(dict.fromkeys(topics))[:MAX_TOPICS] or None
+
+_TOPIC_TITLE_RE = re.compile(r'title="Topic: ([^"]+)"')
+TOPIC_SETTLE = 4096
+
+def _select_counter(*selectors):
+    def run(soup):
+        for selector in selectors:
+            for elem in soup.select(selector):
+                text = elem.get_text(strip=True)
+                if is_counter(text):
+                    return parse_number(text)
+        return None
+    return run
+
+def _select_language(soup):
+    selectors = [
+        '[data-ga-click*="language"]',
+        '.BorderGrid-cell .mt-2 span[class*="color-fg-"]',
+        '.Layout-sidebar .BorderGrid-cell span[class*="color-fg-"]'
+    ]
+    for selector in selectors:
+        lang_elem = soup.select_one(selector)
+        if lang_elem:
+            lang = lang_elem.get_text(strip=True)
+            if lang and lang.lower() not in IGNORED_LANGUAGES:
+                return lang.lower()
+    return None
+
+def _select_topics(soup):
+    topics = []
+    for elem in soup.select('a.topic-tag, [data-ga-click*="topic"] .topic-tag'):
+        topic = elem.get_text(strip=True)
+        if topic:
+            topics.append(topic.lower())
+    return list(dict.fromkeys(topics))[:MAX_TOPICS] or None
+
+def _select_description(soup):
+    desc_elem = soup.select_one('[data-pjax="#repo-content-pjax-container"] p')
+    if desc_elem:
+        return desc_elem.get_text(strip=True) or None
+    return None
+
+def _select_license(soup):
+    license_selectors = [
+        'a[href*="/blob/"][href*="LICENSE"]',
+        'a[href*="/blob/"][href*="COPYING"]',
+        '.BorderGrid-cell a[title*="license"]'
+    ]
+    for selector in license_selectors:
+        license_elem = soup.select_one(selector)
+        if license_elem:
+            return license_elem.get_text(strip=True) or None
+    return None
+
+def _select_last_commit(soup):
+    for selector in ['[data-testid="latest-commit-details"] relative-time', 'relative-time[datetime]']:
+        commit_elem = soup.select_one(selector)
+        if commit_elem and commit_elem.get('datetime'):
+            return commit_elem['datetime']
+    return None
+
+# Ordered strategies per field: cheapest and most stable first
+FIELDS = {
+    'stars': [
+        regex('counter-title', r'id="repo-stars-counter-star"[^>]*?title="([\d,]+)"', _counter),
+        regex('aria-label', r'aria-label="([\d,]+) users? starred this repository"', _counter),
+        regex('embedded-json', r'"stargazerCount":(\d+)', _counter),
+        dom('dom-counter', _select_counter(
+            '#repo-stars-counter-star',
+            'a[href$="/stargazers"] .Counter',
+            '[data-testid="stargazers"] .Counter',
+            'a[href*="stargazers"] strong'
+        )),
+    ],
+    'forks': [
+        regex('counter-title', r'id="repo-network-counter"[^>]*?title="([\d,]+)"', _counter),
+        regex('embedded-json', r'"forkCount":(\d+)', _counter),
+        dom('dom-counter', _select_counter(
+            '#repo-network-counter',
+            'a[href$="/forks"] .Counter',
+            'a[href*="network/members"] .Counter',
+            '[data-testid="forks"] .Counter'
+        )),
+    ],
+    'watchers': [
+        regex('sidebar-text', r'<strong>([\d,.kKmM]+)</strong>\s*watching', _counter),
+        regex('embedded-json', r'"watchersCount":(\d+)', _counter),
+        dom('dom-counter', _select_counter(
+            'a[href$="/watchers"] .Counter',
+            'a[href*="watchers"] .Counter',
+            'a[href$="/watchers"] strong'
+        )),
+    ],
+    'description': [
+        regex('sidebar-text', r'<p class="f4 my-3">\s*([^<]+?)\s*</p>', lambda m: html_lib.unescape(m.group(1)) or None),
+        regex('og-meta', r'<meta property="og:description" content="([^"]*)"', lambda m: clean_description(m.group(1)) or None),
+        regex('meta', r'<meta name="description" content="([^"]*)"', lambda m: clean_description(m.group(1)) or None),
+        dom('dom-about', _select_description),
+    ],
+    'language': [
+        regex('embedded-json', r'"primaryLanguage":\{"name":"([^"]+)"', _language),
+        regex('language-stats', r'<span class="color-fg-default text-bold mr-1">([^<]+)</span>', _language),
+        dom('dom-sidebar', _select_language),
+    ],
+    'topics': [
+        Strategy('topic-titles', 'text', _topic_titles),
+        regex('embedded-json', r'"topics":\[([^\]]*)\]', _json_list),
+        dom('dom-topic-tags', _select_topics),
+    ],
+    'license': [
+        regex('law-icon', r'octicon-law[^>]*>.*?</svg>\s*([^<]+?)\s*</a>', lambda m: html_lib.unescape(m.group(1)) or None),
+        regex('embedded-json', r'"license":\{[^}]*?"name":"([^"]+)"', lambda m: m.group(1)),
+        dom('dom-license-link', _select_license),
+    ],
+    'last_commit': [
+        regex('commit-details', r'data-testid="latest-commit-details".*?<relative-time[^>]*?datetime="([^"]+)"'),
+        # Any timestamp on the page; on a prefix it is rarely the latest commit's
+        regex('relative-time', r'<relative-time[^>]*?datetime="([^"]+)"', partial=False),
+        dom('dom-relative-time', _select_last_commit),
+    ],
+}
+
+# Value returned when every strategy misses
+DEFAULTS = {
+    'stars': 0,
+    'forks': 0,
+    'watchers': 0,
+    'description': '',
+    'language': 'unknown',
+    'topics': [],
+    'license': None,
+    'last_commit': None,
+}
+
+# -------- Engine --------------------------------------------------------------
+class Page:
+    """Raw HTML plus a soup that is only built the first time a DOM strategy asks.
+
+    Text strategies search from ``start``, so a growing prefix is only
+    rescanned from shortly before the newly arrived text.
+    """
+
+    def __init__(self, html, partial=False, start=0):
+        self.html = html
+        self.partial = partial
+        self.start = start
+        self._soup = None
+
+    @property
+    def soup(self):
+        if self._soup is None:
+            from bs4 import BeautifulSoup
+            self._soup = BeautifulSoup(self.html, 'html.parser')
+        return self._soup
+
+    @property
+    def parsed(self):
+        return self._soup is not None
+
+class Extractor:
+    """Runs the strategy chains and keeps per-field hit statistics"""
+
+    def __init__(self, fields=None):
+        self.fields = fields or FIELDS
+        self.hits = defaultdict(Counter)
+        self.pages = 0
+        self.dom_parses = 0
+
+    def _run(self, page, field, kinds):
+        for strategy in self.fields[field]:
+            if strategy.kind not in kinds or (page.partial and not strategy.partial):
+                continue
+            try:
+                value = strategy.func(page)
+            except Exception:
+                value = None
+            if value is not None:
+                return strategy.name, value
+        return None, None
+
+    def extract(self, html, fields=None, defaults=DEFAULTS):
+        """Extract ``fields`` (default: all) from a complete page, recording hits.
+
+        Fields no strategy could find take their value from ``defaults``
+        (``None`` if absent there), so pass ``{}`` to tell misses apart.
+        """
+        page = Page(html)
+        result = {}
+        for field in fields or self.fields:
+            name, value = self._run(page, field, ('text', 'dom'))
+            self.hits[field][name or 'miss'] += 1
+            result[field] = value if name else defaults.get(field)
+        self.pages += 1
+        if page.parsed:
+            self.dom_parses += 1
+        return result
+
+    def extract_partial(self, html, fields, start=0):
+        """Try the text fast paths only; returns just the fields that were found.
+
+        Nothing is recorded, so this is safe to call repeatedly on a growing
+        prefix of a body that is still downloading; ``start`` skips the part
+        of the prefix that earlier calls already searched.
+        """
+        page = Page(html, partial=True, start=start)
+        found = {}
+        for field in fields:
+            name, value = self._run(page, field, ('text',))
+            if name:
+                found[field] = (name, value)
+        return found
+
+    def record(self, found, fields):
+        """Record hits for a result assembled by ``extract_partial``"""
+        for field in fields:
+            self.hits[field][found[field][0] if field in found else 'miss'] += 1
+        self.pages += 1
+
+    def report(self):
+        """Per-field strategy hit counts, as printable lines"""
+        lines = [f"Pages: {self.pages}, DOM parses: {self.dom_parses}"]
+        for field, counts in self.hits.items():
+            total = sum(counts.values())
+            parts = ', '.join(f"{name} {count}" for name, count in counts.most_common())
+            lines.append(f"{field:12} {total:5} → {parts}")
+        return lines
+
+    def drift_warnings(self, threshold=0.5):
+        """Fields whose fast paths hit on less than ``threshold`` of pages, or that miss outright"""
+        warnings = []
+        for field, counts in self.hits.items():
+            total = sum(counts.values())
+            if not total:
+                continue
+            fast = sum(counts[s.name] for s in self.fields[field] if s.kind == 'text')
+            if fast / total < threshold:
+                warnings.append(f"{field}: fast paths hit only {fast}/{total} pages, markup may have changed")
+            if counts['miss']:
+                warnings.append(f"{field}: no strategy matched on {counts['miss']}/{total} pages")
+        return warnings
+
+    def print_report(self):
+        print("\n🔎 EXTRACTION STRATEGIES:")
+        for line in self.report():
+            print(f"   • {line}")
+        for warning in self.drift_warnings():
+            print(f"   ⚠️  {warning}")
+
+# Shared instance so every caller in a run contributes to the same stats
+extractor = Extractor()
+
+def extract(html, fields=None, defaults=DEFAULTS):
+    """Extract fields from a GitHub repository page using the shared extractor"""
+    return extractor.extract(html, fields, defaults)
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Failure Ledger
+SQLite record of every repo a scrape job failed on: failure type, how many
+times in a row and in total, and when it was last tried. Jobs ask the ledger
+which repos are due before they start, so a repo that keeps failing has its
+circuit opened and is retried on a slowing cadence (1, 2, 4 ... 30 days)
+instead of spending requests and delays on every run. A success closes the
+circuit again.
+
+Rate limiting (429, or a 403 whose headers or body say so) is recorded but
+never opens a circuit, since it says nothing about the repo. A repo that is
+gone (404/410) is held back for every job, not only the one that saw it.
+
+    python failure_ledger.py                 # chronic failures report
+    python failure_ledger.py --job stars
+    python failure_ledger.py --job stars --reset owner/repo
+"""
+
+import sys
+import time
+import sqlite3
+import pathlib
+import argparse
+import threading
+
+from catalog import DATA_FILE, repo_slug
+
+LEDGER_FILE = DATA_FILE.parent / "failure-ledger.sqlite"
+
+DAY = 86400
+# Consecutive failures before a repo's circuit opens, and the retry cadence after
+THRESHOLD = 3
+BASE_DELAY = DAY
+MAX_DELAY = 30 * DAY
+
+# Failures that are not the repo's fault, and ones that hold for every job
+TRANSIENT_KINDS = frozenset({'rate_limited'})
+SHARED_KINDS = frozenset({'not_found'})
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS failures (
+    job TEXT NOT NULL,
+    repo TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    detail TEXT,
+    streak INTEGER NOT NULL DEFAULT 0,
+    total INTEGER NOT NULL DEFAULT 0,
+    first_failed REAL NOT NULL,
+    last_attempt REAL NOT NULL,
+    last_success REAL,
+    retry_after REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (job, repo)
+);
+CREATE INDEX IF NOT EXISTS failures_retry ON failures (retry_after);
+"""
+
+def is_rate_limited(headers=None, body=None):
+    """Whether a 403 response carries GitHub's rate-limit headers or message"""
+    if headers is not None and (headers.get('Retry-After') or headers.get('X-RateLimit-Remaining') == '0'):
+        return True
+    return body is not None and 'rate limit' in body.lower()
+
+def failure_kind(status=None, error=None, headers=None, body=None):
+    """Failure type from an HTTP status (plus the response's headers/body when known) or a raised exception"""
+    if error is not None:
+        if 'Timeout' in type(error).__name__:
+            return 'timeout'
+        return 'network' if isinstance(error, OSError) else 'error'
+    if status in (404, 410):
+        return 'not_found'
+    if status == 429 or (status == 403 and is_rate_limited(headers, body)):
+        return 'rate_limited'
+    if status == 403:
+        return 'forbidden'
+    if status and status >= 500:
+        return 'server_error'
+    if status and status != 200:
+        return 'http_error'
+    return 'no_data'
+
+def retry_delay(streak):
+    """Seconds until a repo with ``streak`` consecutive failures is tried again (0: circuit closed)"""
+    if streak < THRESHOLD:
+        return 0
+    return min(BASE_DELAY * 2 ** (streak - THRESHOLD), MAX_DELAY)
+
+class FailureLedger:
+    """Per-repo failure history for one job, in a SQLite file shared by all jobs.
+
+    Repos are keyed by owner/repo; GitHub URLs are accepted anywhere a repo
+    is expected. Safe to use from pipeline worker threads.
+    """
+
+    def __init__(self, job, path=LEDGER_FILE):
+        self.job = job
+        self.path = str(path)
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @classmethod
+    def for_catalog(cls, job, data_file=DATA_FILE):
+        """The ledger kept next to ``data_file``"""
+        return cls(job, pathlib.Path(data_file).parent / LEDGER_FILE.name)
+
+    @staticmethod
+    def key(repo):
+        return repo_slug(repo) if 'github.com' in repo else repo
+
+    # -------- Scheduling ------------------------------------------------------
+    def open_circuits(self, now=None):
+        """{repo: retry time} for repos this job should not try yet"""
+        now = now or time.time()
+        with self.lock:
+            rows = self.db.execute(
+                "SELECT repo, MAX(retry_after) FROM failures WHERE retry_after > ? AND "
+                f"(job = ? OR kind IN ({','.join('?' * len(SHARED_KINDS))})) GROUP BY repo",
+                (now, self.job, *SHARED_KINDS)
+            ).fetchall()
+        return dict(rows)
+
+    def partition(self, items, repo=lambda item: item, now=None):
+        """Split ``items`` into (due, held back); ``repo`` maps an item to its repo or URL"""
+        circuits = self.open_circuits(now)
+        due, held = [], []
+        for item in items:
+            (held if self.key(repo(item)) in circuits else due).append(item)
+        return due, held
+
+    # -------- Recording -------------------------------------------------------
+    def record_failure(self, repo, kind, detail=None, now=None):
+        """Count a failure; returns the repo's retry time (0 while its circuit is closed)"""
+        # An unknown kind is still a failure, never a NULL that aborts the job
+        kind = kind or failure_kind()
+        repo, now = self.key(repo), now or time.time()
+        counts = 0 if kind in TRANSIENT_KINDS else 1
+        with self.lock:
+            self.db.execute('BEGIN IMMEDIATE')
+            row = self.db.execute(
+                'SELECT streak FROM failures WHERE job = ? AND repo = ?', (self.job, repo)
+            ).fetchone()
+            streak = (row[0] if row else 0) + counts
+            delay = retry_delay(streak)
+            retry_after = now + delay if delay else 0
+            self.db.execute(
+                "INSERT INTO failures (job, repo, kind, detail, streak, total, first_failed, last_attempt, retry_after) "
+                "VALUES (?, ?, ?, ?, ?, 1, ?, ?, ?) "
+                "ON CONFLICT (job, repo) DO UPDATE SET kind = excluded.kind, detail = excluded.detail, "
+                "streak = excluded.streak, total = total + 1, last_attempt = excluded.last_attempt, "
+                "first_failed = CASE WHEN streak = 0 THEN excluded.first_failed ELSE first_failed END, "
+                "retry_after = excluded.retry_after",
+                (self.job, repo, kind, detail, streak, now, now, retry_after)
+            )
+            self.db.execute('COMMIT')
+        return retry_after
+
+    def record_success(self, repo, now=None):
+        """Close the repo's circuit; its failure total is kept for the report"""
+        with self.lock:
+            self.db.execute(
+                "UPDATE failures SET streak = 0, retry_after = 0, last_attempt = ?, last_success = ? "
+                "WHERE job = ? AND repo = ?",
+                (now or time.time(), now or time.time(), self.job, self.key(repo))
+            )
+
+    def reset(self, repo=None):
+        """Forget one repo's failures for this job, or all of them"""
+        with self.lock:
+            if repo:
+                self.db.execute('DELETE FROM failures WHERE job = ? AND repo = ?', (self.job, self.key(repo)))
+            else:
+                self.db.execute('DELETE FROM failures WHERE job = ?', (self.job,))
+
+# -------- Reports -------------------------------------------------------------
+def chronic_failures(db, job=None, min_streak=THRESHOLD):
+    """Rows for repos failing at least ``min_streak`` times in a row, worst first"""
+    query = ("SELECT job, repo, kind, detail, streak, total, first_failed, last_attempt, retry_after "
+             "FROM failures WHERE streak >= ?")
+    params = [min_streak]
+    if job:
+        query += " AND job = ?"
+        params.append(job)
+    columns = ('job', 'repo', 'kind', 'detail', 'streak', 'total', 'first_failed', 'last_attempt', 'retry_after')
+    rows = db.execute(query + " ORDER BY streak DESC, total DESC, repo", params).fetchall()
+    return [dict(zip(columns, row)) for row in rows]
+
+def print_report(path=LEDGER_FILE, job=None, min_streak=THRESHOLD, limit=30):
+    db = sqlite3.connect(str(path))
+    db.executescript(SCHEMA)
+    failing = db.execute(
+        "SELECT job, kind, COUNT(*) FROM failures WHERE streak > 0 AND (? IS NULL OR job = ?) "
+        "GROUP BY job, kind ORDER BY job, COUNT(*) DESC", (job, job)
+    ).fetchall()
+    chronic = chronic_failures(db, job, min_streak)
+    db.close()
+
+    if not failing:
+        print("✅ No repos are currently failing")
+        return chronic
+    print("\n📒 FAILING REPOS BY JOB AND TYPE:")
+    for job_name, kind, count in failing:
+        print(f"   • {job_name:14} {kind:14} {count:5,}")
+
+    now = time.time()
+    print(f"\n🔌 CHRONIC FAILURES ({len(chronic)} repos, {min_streak}+ in a row):")
+    for row in chronic[:limit]:
+        if row['retry_after'] > now:
+            retry = f"retry in {(row['retry_after'] - now) / DAY:.1f} d"
+        else:
+            retry = "due"
+        print(f"   • {row['repo'][:40]:40} {row['job']:12} {row['kind']:13} "
+              f"{row['streak']:3}x ({row['total']} total)  {retry}")
+    if len(chronic) > limit:
+        print(f"   ... and {len(chronic) - limit} more")
+    return chronic
+
+def main():
+    parser = argparse.ArgumentParser(description="Report and manage repos that keep failing")
+    parser.add_argument('--ledger', default=str(LEDGER_FILE))
+    parser.add_argument('--job', help="Only this job (stars, scrape, contributors)")
+    parser.add_argument('--min-streak', type=int, default=THRESHOLD)
+    parser.add_argument('--reset', metavar='REPO', nargs='?', const='', help="Forget a repo's failures (all with --job and no repo)")
+    args = parser.parse_args()
+
+    if args.reset is not None:
+        if not args.job:
+            parser.error("--reset needs --job")
+        with FailureLedger(args.job, args.ledger) as ledger:
+            ledger.reset(args.reset or None)
+        print(f"🧹 Cleared {args.reset or 'all failures'} for {args.job}")
+        return
+    print_report(args.ledger, args.job, args.min_streak)
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n\n⏹️  Operation cancelled by user")
+        sys.exit(1)
@@ -1,9 +1,12 @@
 #!/usr/bin/env python3
-# pip install aiohttp bs4 tqdm pandas
-import re, json, asyncio, aiohttp, pathlib, time, sys
-from bs4 import BeautifulSoup
-from tqdm.asyncio import tqdm
-import pandas as pd
+# pip install -r requirements.txt
+import asyncio, aiohttp, pathlib, time, sys
+from tqdm import tqdm
+from extraction import extract, extractor, FIELDS
+from partial_fetch import fetch_fields_async, print_stats
+from catalog import repo_slug, repo_record, apply_github_data, load_catalog, save_catalog, sort_by_stars, is_live
+from pipeline import Pipeline, Stage, JsonArrayWriter
+from failure_ledger import FailureLedger, failure_kind
 
 HEADERS = {
     "User-Agent": "mcp-curator-scraper/1.0 (contact: admin@mcpcurator.com)",
@@ -15,283 +18,129 @@ HEADERS = {
     "Upgrade-Insecure-Requests": "1",
 }
 
-# -------- Helper functions -----------------------------------------------------
-def repo_slug(url: str) -> str:
-    """Extract owner/repo from GitHub URL"""
-    m = re.search(r"github\.com[:/](.+?)/(.+?)(?:\.git|/|$)", url)
-    if not m:
-        raise ValueError(f"Bad GitHub URL: {url}")
-    return f"{m.group(1)}/{m.group(2)}"
-
-def parse_number(text: str) -> int:
-    """Parse GitHub counter numbers (handles k, m suffixes)"""
-    if not text:
-        return 0
-    text = text.strip().lower()
-    if 'k' in text:
-        return int(float(text.replace('k', '')) * 1000)
-    elif 'm' in text:
-        return int(float(text.replace('m', '')) * 1000000)
-    else:
-        return int(text.replace(',', ''))
-
-def get_counter(soup, selector):
-    """Extract counter from GitHub page"""
-    elements = soup.select(selector)
-    for elem in elements:
-        text = elem.get_text(strip=True)
-        if text and text.replace(',', '').replace('k', '').replace('m', '').replace('.', '').isdigit():
-            return parse_number(text)
-    return 0
-
-def extract_language(soup):
-    """Extract primary language from GitHub page"""
-    # Try multiple selectors for language
-    selectors = [
-        '[data-ga-click*="language"]',
-        '.BorderGrid-cell .mt-2 span[class*="color-fg-"]',
-        '.Layout-sidebar .BorderGrid-cell span[class*="color-fg-"]'
-    ]
-    
-    for selector in selectors:
-        lang_elem = soup.select_one(selector)
-        if lang_elem:
-            lang = lang_elem.get_text(strip=True)
-            if lang and lang not in ['repository', 'code', 'issues', 'pull', 'requests']:
-                return lang.lower()
-    
-    return 'unknown'
-
-def extract_topics(soup):
-    """Extract topics/tags from GitHub page"""
-    topics = []
-    topic_elements = soup.select('[data-ga-click*="topic"] .topic-tag')
-    for elem in topic_elements:
-        topic = elem.get_text(strip=True)
-        if topic:
-            topics.append(topic.lower())
-    return topics[:6]  # Limit to 6 topics
-
-def extract_license(soup):
-    """Extract license information"""
-    license_selectors = [
-        'a[href*="/blob/"][href*="LICENSE"]',
-        'a[href*="/blob/"][href*="COPYING"]',
-        '.BorderGrid-cell a[title*="license"]'
-    ]
-    
-    for selector in license_selectors:
-        license_elem = soup.select_one(selector)
-        if license_elem:
-            return license_elem.get_text(strip=True)
-    
-    return None
-
-def extract_last_commit(soup):
-    """Extract last commit date"""
-    commit_selectors = [
-        'relative-time[datetime]',
-        '[data-testid="latest-commit-details"] relative-time'
-    ]
-    
-    for selector in commit_selectors:
-        commit_elem = soup.select_one(selector)
-        if commit_elem and commit_elem.get('datetime'):
-            return commit_elem['datetime']
-    
-    return None
-
 # -------- Main scraping function ----------------------------------------------
-async def fetch_repo_data(session, url, cache_dir):
-    """Fetch and parse GitHub repository data"""
+async def fetch_repo_data(session, url, cache_dir, ledger=None):
+    """Fetch and parse GitHub repository data, recording the outcome in ``ledger`` if given"""
     try:
         slug = repo_slug(url)
         html_path = cache_dir / f"{slug.replace('/', '__')}.html"
         
         # Check cache first (with 1 hour expiry)
         if html_path.exists() and (time.time() - html_path.stat().st_mtime) < 3600:
-            html = html_path.read_text(encoding="utf-8")
+            fields = extract(html_path.read_text(encoding="utf-8"))
         else:
             # Add random delay to avoid being blocked
             await asyncio.sleep(0.5 + (hash(url) % 10) * 0.1)
             
-            async with session.get(url, headers=HEADERS, timeout=30) as resp:
-                if resp.status != 200:
-                    print(f"❌ Failed to fetch {url}: HTTP {resp.status}")
-                    return None
-                
-                html = await resp.text()
+            # Stream the page and stop reading once every field is found; only
+            # complete pages are cached, since later readers (e.g. the README
+            # text in classify.py) need more than the fields
+            status, fields, html, response_headers = await fetch_fields_async(session, url, FIELDS, headers=HEADERS)
+            if fields is None:
+                print(f"❌ Failed to fetch {url}: HTTP {status}")
+                if ledger:
+                    ledger.record_failure(url, failure_kind(status, headers=response_headers), f"HTTP {status}")
+                return None
+            
+            if html is not None:
                 html_path.write_text(html, encoding="utf-8")
         
-        soup = BeautifulSoup(html, "html.parser")
-        
-        # Extract all the data we need
-        stars = get_counter(soup, [
-            '#repo-stars-counter-star',
-            'a[href$="/stargazers"] .Counter',
-            '[data-testid="stargazers"] .Counter',
-            'a[href*="stargazers"] strong'
-        ])
-        
-        forks = get_counter(soup, [
-            '#repo-network-counter',
-            'a[href$="/forks"] .Counter',
-            'a[href*="network/members"] .Counter',
-            '[data-testid="forks"] .Counter'
-        ])
-        
-        watchers = get_counter(soup, [
-            'a[href$="/watchers"] .Counter',
-            'a[href*="watchers"] .Counter'
-        ])
+        data = repo_record(url, fields)
+        if ledger:
+            ledger.record_success(url)
         
-        # Extract description
-        description = ""
-        desc_elem = soup.select_one('[data-pjax="#repo-content-pjax-container"] p')
-        if desc_elem:
-            description = desc_elem.get_text(strip=True)
-        else:
-            # Fallback to meta description
-            meta_desc = soup.select_one('meta[name="description"]')
-            if meta_desc:
-                description = meta_desc.get('content', '')
-        
-        # Extract language
-        language = extract_language(soup)
-        
-        # Extract topics
-        topics = extract_topics(soup)
-        
-        # Extract license
-        license_info = extract_license(soup)
-        
-        # Extract last commit
-        last_commit = extract_last_commit(soup)
-        
-        data = {
-            "slug": slug,
-            "url": url,
-            "stars": stars,
-            "forks": forks,
-            "watchers": watchers,
-            "description": description,
-            "language": language,
-            "topics": topics,
-            "license": license_info,
-            "last_commit": last_commit,
-            "scraped_at": time.strftime("%Y-%m-%d %H:%M:%S")
-        }
-        
-        print(f"✅ {slug}: {stars} stars, {forks} forks, {language}")
+        print(f"✅ {slug}: {data['stars']} stars, {data['forks']} forks, {data['language']}")
         return data
         
     except Exception as e:
         print(f"❌ Error scraping {url}: {e}")
+        if ledger:
+            ledger.record_failure(url, failure_kind(error=e), str(e)[:200])
         return None
 
 # -------- Main orchestrator ---------------------------------------------------
-async def scrape_github_repos(input_file="mcp-data.json", output_file="github-data.json", max_concurrent=3):
-    """Main function to scrape all GitHub repositories"""
+async def scrape_github_repos(input_file="mcp-data.json", output_file="github-data.json", max_concurrent=3,
+                              checkpoint_seconds=300):
+    """Main function to scrape all GitHub repositories.
+
+    Runs as a staged pipeline: each scrape record is written to the raw output
+    file and merged into the catalog as soon as it arrives. The catalog is
+    checkpointed at most every ``checkpoint_seconds``, and never sooner than
+    ten times the last checkpoint took: a save rewrites the whole catalog, so
+    saving per N records would make a large run quadratic.
+    """
     
     # Create cache directory
-    cache_dir = pathlib.Path("data/github_cache")
+    cache_dir = pathlib.Path(input_file).parent / "github_cache"
     cache_dir.mkdir(parents=True, exist_ok=True)
     
     # Load existing MCP data
-    with open(input_file, 'r') as f:
-        mcp_data = json.load(f)
+    mcp_data = load_catalog(input_file)
     
-    # Extract GitHub URLs
-    github_urls = []
+    # Catalog entries per GitHub URL (a repo can be listed more than once)
+    tools_by_url = {}
     for tool in mcp_data:
-        if 'githubUrl' in tool and tool['githubUrl']:
-            github_urls.append(tool['githubUrl'])
+        if is_live(tool):
+            tools_by_url.setdefault(tool['githubUrl'], []).append(tool)
+    
+    # Repos that keep failing are retried on the ledger's schedule, not every run
+    ledger = FailureLedger.for_catalog('scrape', input_file)
+    due, held = ledger.partition(tools_by_url)
     
-    print(f"🚀 Starting to scrape {len(github_urls)} GitHub repositories...")
+    print(f"🚀 Starting to scrape {len(due)} GitHub repositories...")
+    if held:
+        print(f"⏸️  {len(held)} repositories held back after repeated failures (see failure_ledger.py)")
     print(f"📊 Using {max_concurrent} concurrent connections")
     
-    # Create semaphore for rate limiting
-    semaphore = asyncio.Semaphore(max_concurrent)
+    # Only (slug, stars) is kept per repo, for the closing statistics
+    scraped = []
+    next_checkpoint = time.monotonic() + checkpoint_seconds
     
     async with aiohttp.ClientSession(
         connector=aiohttp.TCPConnector(limit=max_concurrent),
         timeout=aiohttp.ClientTimeout(total=30)
     ) as session:
         
-        async def bounded_fetch(url):
-            async with semaphore:
-                return await fetch_repo_data(session, url, cache_dir)
+        async def fetch(url):
+            return await fetch_repo_data(session, url, cache_dir, ledger)
         
-        # Execute all scraping tasks
-        results = []
-        tasks = [bounded_fetch(url) for url in github_urls]
-        
-        for coro in tqdm.as_completed(tasks, total=len(tasks), desc="Scraping repos"):
-            try:
-                result = await coro
-                if result:
-                    results.append(result)
-            except Exception as e:
-                print(f"⚠️ Task failed: {e}", file=sys.stderr)
-    
-    print(f"✅ Successfully scraped {len(results)} repositories")
-    
-    # Create a lookup dictionary
-    github_data_lookup = {}
-    for item in results:
-        github_data_lookup[item['url']] = item
-    
-    # Update the original MCP data with scraped information
-    updated_mcp_data = []
-    for tool in mcp_data:
-        github_url = tool.get('githubUrl', '')
-        if github_url in github_data_lookup:
-            github_info = github_data_lookup[github_url]
+        with JsonArrayWriter(output_file) as raw, tqdm(total=len(due), desc="Scraping repos") as bar:
             
-            # Update the tool with real GitHub data
-            tool.update({
-                'stars': github_info['stars'],
-                'forks': github_info.get('forks', 0),
-                'watchers': github_info.get('watchers', 0),
-                'description': github_info['description'] or tool.get('description', ''),
-                'language': github_info['language'] if github_info['language'] != 'unknown' else tool.get('language', 'typescript'),
-                'topics': github_info.get('topics', []),
-                'license': github_info.get('license'),
-                'lastUpdated': github_info.get('last_commit', tool.get('lastUpdated', '')),
-                'scraped_at': github_info['scraped_at']
-            })
+            def store(record):
+                nonlocal next_checkpoint
+                raw.write(record)
+                for tool in tools_by_url[record['url']]:
+                    apply_github_data(tool, record)
+                scraped.append((record['slug'], record['stars']))
+                if time.monotonic() >= next_checkpoint:
+                    start = time.monotonic()
+                    save_catalog(mcp_data, input_file)
+                    took = time.monotonic() - start
+                    next_checkpoint = start + took + max(checkpoint_seconds, 10 * took)
             
-            # Update tags with topics
-            if github_info.get('topics'):
-                existing_tags = set(tool.get('tags', []))
-                new_tags = list(existing_tags.union(set(github_info['topics'])))[:6]
-                tool['tags'] = new_tags
-        
-        updated_mcp_data.append(tool)
+            pipeline = Pipeline(due, [Stage('fetch', fetch, workers=max_concurrent)], store, progress=bar)
+            stats = await pipeline.run()
+    ledger.close()
+    
+    print(f"✅ Successfully scraped {len(scraped)} repositories")
+    failed = stats['fetch_dropped'] + stats['fetch_errors']
+    if failed:
+        print(f"⚠️ {failed} repositories failed", file=sys.stderr)
     
     # Sort by stars (descending)
-    updated_mcp_data.sort(key=lambda x: x.get('stars', 0), reverse=True)
+    sort_by_stars(mcp_data)
     
     # Save updated data
-    with open(input_file, 'w') as f:
-        json.dump(updated_mcp_data, f, indent=2)
-    
-    # Save raw GitHub data as well
-    with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2)
+    save_catalog(mcp_data, input_file)
     
-    # Print statistics
-    total_stars = sum(item['stars'] for item in results)
-    avg_stars = total_stars / len(results) if results else 0
-    top_repos = sorted(results, key=lambda x: x['stars'], reverse=True)[:10]
+    # Print statistics (pandas is only needed here, so load it late)
+    import pandas as pd
+    from analytics import print_summary
+    scraped = pd.DataFrame.from_records(scraped, columns=['slug', 'stars']).astype({'stars': 'int64'})
+    print_summary(scraped, name_col='slug')
     
-    print(f"\n📈 SCRAPING STATISTICS:")
-    print(f"   • Total repositories: {len(results)}")
-    print(f"   • Total stars: {total_stars:,}")
-    print(f"   • Average stars: {avg_stars:.1f}")
-    print(f"\n🏆 TOP 10 REPOSITORIES:")
-    for i, repo in enumerate(top_repos, 1):
-        print(f"   {i:2d}. {repo['slug']:30} {repo['stars']:6,} ⭐")
+    extractor.print_report()
+    print_stats()
     
     print(f"\n💾 Data saved to:")
     print(f"   • Updated MCP data: {input_file}")
@@ -310,6 +159,6 @@ if __name__ == "__main__":
     # Run the scraper
     asyncio.run(scrape_github_repos(
         input_file=str(mcp_data_path),
-        output_file="github-scraped-data.json",
+        output_file=str(mcp_data_path.parent / "github-scraped-data.json"),
         max_concurrent=3  # Conservative to avoid being blocked
     ))
\ No newline at end of file
@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+"""
+HTTP Fixtures
+Record/replay transport for the scrapers. Once installed it sits under both
+``requests`` (as the HTTPAdapter's send) and ``aiohttp`` (as the session's
+request), so fetch_repo_data, get_repo_contributors, get_github_stars and
+the link resolver run unchanged against a fixture archive instead of GitHub.
+
+  • record  serve what the archive has, fetch and store everything else
+  • replay  serve only from the archive; unknown URLs fail like a dead network
+
+Responses are stored in a zip archive (deflate compressed), one entry per
+method + URL. Recording appends through one open handle, and the archive's
+index is written when the transport is uninstalled. Concurrent misses for
+the same URL share a single fetch. Replay can add latency and inject failures, which makes the
+whole pipeline usable offline and as a performance harness.
+
+    python http_fixtures.py record ../data/fixtures/github.zip github-scraper.py
+    python http_fixtures.py replay ../data/fixtures/github.zip --latency 0.2 --jitter 0.1 \\
+        --error-rate 0.05 mcp-curator.py scrape --concurrency 10
+    python http_fixtures.py list ../data/fixtures/github.zip
+"""
+
+import io
+import sys
+import json
+import time
+import random
+import asyncio
+import hashlib
+import pathlib
+import zipfile
+import argparse
+import threading
+from collections import Counter
+
+SCRIPTS_DIR = pathlib.Path(__file__).resolve().parent
+
+# Bodies are stored decoded, so these no longer describe them
+_DROP_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection'}
+
+class FixtureMissing(ConnectionError):
+    """A replayed request that the archive has no response for"""
+
+class Fixture:
+    """One stored response"""
+
+    __slots__ = ('status', 'reason', 'headers', 'body', 'url')
+
+    def __init__(self, status, reason, headers, body, url):
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.body = body
+        self.url = url
+
+    @property
+    def charset(self):
+        content_type = self.headers.get('Content-Type', '')
+        for part in content_type.split(';')[1:]:
+            key, _, value = part.strip().partition('=')
+            if key.lower() == 'charset':
+                return value.strip('"') or None
+        return None
+
+class FixtureArchive:
+    """Zip archive of responses keyed by sha1(method + URL)"""
+
+    def __init__(self, path):
+        self.path = pathlib.Path(path)
+        self._lock = threading.Lock()
+        self._zip = None
+        self._writing = False
+        self._names = set()
+        if self.path.exists():
+            self._zip = zipfile.ZipFile(self.path, 'r')
+            self._names = set(self._zip.namelist())
+
+    @staticmethod
+    def key(method, url):
+        return hashlib.sha1(f"{method.upper()} {url}".encode()).hexdigest()
+
+    def __contains__(self, request):
+        return f"{self.key(*request)}.json" in self._names
+
+    def __len__(self):
+        return sum(1 for name in self._names if name.endswith('.json'))
+
+    def _read(self, key):
+        meta = json.loads(self._zip.read(f"{key}.json"))
+        body = self._zip.read(f"{key}.body")
+        return Fixture(meta['status'], meta['reason'], meta['headers'], body, meta['url'])
+
+    def get(self, method, url):
+        key = self.key(method, url)
+        if f"{key}.json" not in self._names:
+            return None
+        with self._lock:
+            return self._read(key)
+
+    def put(self, method, url, status, reason, headers, body, final_url):
+        """Store a response; if the URL was stored meanwhile, that response is kept and returned"""
+        headers = {k: v for k, v in headers.items() if k.lower() not in _DROP_HEADERS}
+        meta = {'method': method.upper(), 'request_url': url, 'url': final_url, 'status': status,
+                'reason': reason, 'headers': headers, 'recorded_at': time.strftime("%Y-%m-%d %H:%M:%S")}
+        key = self.key(method, url)
+        with self._lock:
+            if f"{key}.json" in self._names:
+                return self._read(key)
+            if not self._writing:
+                # One append handle for the whole recording; reads go through it too
+                if self._zip is not None:
+                    self._zip.close()
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._zip = zipfile.ZipFile(self.path, 'a', compression=zipfile.ZIP_DEFLATED)
+                self._writing = True
+            self._zip.writestr(f"{key}.json", json.dumps(meta, indent=2))
+            self._zip.writestr(f"{key}.body", body)
+            self._names.update((f"{key}.json", f"{key}.body"))
+        return Fixture(status, reason, headers, body, final_url)
+
+    def entries(self):
+        """Metadata of every stored response"""
+        for name in sorted(self._names):
+            if name.endswith('.json'):
+                with self._lock:
+                    yield json.loads(self._zip.read(name))
+
+    def close(self):
+        """Close the archive; after recording this writes the zip index"""
+        with self._lock:
+            if self._zip is not None:
+                self._zip.close()
+                self._zip = None
+                self._writing = False
+
+# -------- aiohttp response stand-in --------------------------------------------
+class _StreamBody:
+    """The parts of aiohttp's StreamReader the scrapers use"""
+
+    def __init__(self, body):
+        self._buffer = io.BytesIO(body)
+
+    async def read(self, n=-1):
+        return self._buffer.read(n)
+
+    async def iter_chunked(self, n):
+        while chunk := self._buffer.read(n):
+            yield chunk
+
+    async def iter_any(self):
+        while chunk := self._buffer.read(64 * 1024):
+            yield chunk
+
+class ReplayResponse:
+    """Duck-typed aiohttp.ClientResponse built from a Fixture"""
+
+    def __init__(self, fixture, method):
+        from multidict import CIMultiDict, CIMultiDictProxy
+        from yarl import URL
+        self.method = method
+        self.status = fixture.status
+        self.reason = fixture.reason
+        self.headers = CIMultiDictProxy(CIMultiDict(fixture.headers))
+        self.url = URL(fixture.url)
+        self.charset = fixture.charset
+        self.content = _StreamBody(fixture.body)
+        self._body = fixture.body
+        self.closed = False
+
+    @property
+    def ok(self):
+        return self.status < 400
+
+    async def read(self):
+        return self._body
+
+    async def text(self, encoding=None, errors='strict'):
+        return self._body.decode(encoding or self.charset or 'utf-8', errors)
+
+    async def json(self, **kwargs):
+        return json.loads(self._body)
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            import aiohttp
+            raise aiohttp.ClientResponseError(None, (), status=self.status, message=self.reason or '')
+
+    def release(self):
+        self.closed = True
+
+    close = release
+
+    async def wait_for_close(self):
+        self.closed = True
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.release()
+
+# -------- Transport -------------------------------------------------------------
+class FixtureTransport:
+    """Patches requests and aiohttp to go through a FixtureArchive.
+
+    ``latency`` + uniform ``jitter`` (seconds) is added to every replayed
+    response. With probability ``error_rate`` a replayed request fails:
+    with HTTP ``error_status`` if given, otherwise with the library's
+    connection error. ``seed`` makes the injected faults repeatable.
+    """
+
+    def __init__(self, archive, mode='replay', latency=0.0, jitter=0.0, error_rate=0.0,
+                 error_status=None, seed=0):
+        if mode not in ('record', 'replay'):
+            raise ValueError(f"mode must be 'record' or 'replay', not {mode!r}")
+        self.archive = archive if isinstance(archive, FixtureArchive) else FixtureArchive(archive)
+        self.mode = mode
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.random = random.Random(seed)
+        self.stats = Counter()
+        self._originals = None
+        # Misses being recorded: a lock per key (requests) or the pending fetch (aiohttp)
+        self._key_locks = {}
+        self._key_locks_lock = threading.Lock()
+        self._pending = {}
+
+    # -------- Shared --------------------------------------------------------
+    def _delay(self):
+        return self.latency + (self.random.uniform(0, self.jitter) if self.jitter else 0.0)
+
+    def _fault(self):
+        """None, or the injected failure for this request ('raise' or a status)"""
+        if self.error_rate and self.random.random() < self.error_rate:
+            self.stats['injected_errors'] += 1
+            return self.error_status or 'raise'
+        return None
+
+    def _lookup(self, method, url):
+        fixture = self.archive.get(method, url)
+        if fixture is not None:
+            self.stats['replayed'] += 1
+        elif self.mode == 'replay':
+            self.stats['missing'] += 1
+            raise FixtureMissing(f"No fixture for {method.upper()} {url}")
+        return fixture
+
+    def _key_lock(self, method, url):
+        with self._key_locks_lock:
+            return self._key_locks.setdefault(FixtureArchive.key(method, url), threading.Lock())
+
+    @staticmethod
+    def _error_fixture(status, url):
+        return Fixture(status, 'Injected', {'Content-Type': 'text/plain'}, b'', url)
+
+    # -------- requests ------------------------------------------------------
+    def _requests_send(self, adapter, request, **kwargs):
+        import requests
+        from urllib3 import HTTPResponse
+
+        fault = self._fault()
+        if fault == 'raise':
+            raise requests.ConnectionError(f"Injected connection error for {request.url}", request=request)
+        if fault:
+            fixture = self._error_fixture(fault, request.url)
+        else:
+            fixture = self._lookup(request.method, request.url)
+        if fixture is None:
+            with self._key_lock(request.method, request.url):
+                # Another thread may have recorded it while this one waited
+                fixture = self.archive.get(request.method, request.url)
+                if fixture is None:
+                    # Read the whole body so the stored copy is complete, even for streamed calls
+                    real = self._originals['requests'](adapter, request, **kwargs)
+                    fixture = self.archive.put(request.method, request.url, real.status_code, real.reason,
+                                               dict(real.headers), real.content, real.url)
+                    real.close()
+                    self.stats['recorded'] += 1
+        else:
+            time.sleep(self._delay())
+
+        raw = HTTPResponse(body=io.BytesIO(fixture.body), headers=fixture.headers, status=fixture.status,
+                           reason=fixture.reason, preload_content=False, decode_content=False)
+        response = adapter.build_response(request, raw)
+        response.url = fixture.url
+        return response
+
+    # -------- aiohttp -------------------------------------------------------
+    async def _aiohttp_request(self, session, method, str_or_url, **kwargs):
+        import aiohttp
+
+        url = str(str_or_url)
+        fault = self._fault()
+        if fault == 'raise':
+            raise aiohttp.ClientConnectionError(f"Injected connection error for {url}")
+        if fault:
+            fixture = self._error_fixture(fault, url)
+        else:
+            fixture = self._lookup(method, url)
+        if fixture is None:
+            fixture = await self._record_async(session, method, str_or_url, kwargs)
+        else:
+            delay = self._delay()
+            if delay:
+                await asyncio.sleep(delay)
+        return ReplayResponse(fixture, method.upper())
+
+    async def _record_async(self, session, method, str_or_url, kwargs):
+        """Fetch and store a missing response; concurrent misses for one URL await the same fetch"""
+        url = str(str_or_url)
+        key = FixtureArchive.key(method, url)
+        if key in self._pending:
+            return await asyncio.shield(self._pending[key])
+        future = self._pending[key] = asyncio.get_running_loop().create_future()
+        try:
+            real = await self._originals['aiohttp'](session, method, str_or_url, **kwargs)
+            try:
+                body = await real.read()
+            finally:
+                real.release()
+            fixture = self.archive.put(method, url, real.status, real.reason,
+                                       dict(real.headers), body, str(real.url))
+            self.stats['recorded'] += 1
+            future.set_result(fixture)
+            return fixture
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # retrieved here, so an unawaited failure is not logged again
+            raise
+        finally:
+            if not future.done():
+                future.cancel()
+            del self._pending[key]
+
+    # -------- Installing ----------------------------------------------------
+    def install(self):
+        import requests.adapters
+        import aiohttp
+
+        transport = self
+        self._originals = {'requests': requests.adapters.HTTPAdapter.send,
+                           'aiohttp': aiohttp.ClientSession._request}
+
+        def send(adapter, request, **kwargs):
+            return transport._requests_send(adapter, request, **kwargs)
+
+        async def request(session, method, str_or_url, **kwargs):
+            return await transport._aiohttp_request(session, method, str_or_url, **kwargs)
+
+        requests.adapters.HTTPAdapter.send = send
+        aiohttp.ClientSession._request = request
+        return self
+
+    def uninstall(self):
+        if self._originals is None:
+            return
+        import requests.adapters
+        import aiohttp
+        requests.adapters.HTTPAdapter.send = self._originals['requests']
+        aiohttp.ClientSession._request = self._originals['aiohttp']
+        self._originals = None
+        self.archive.close()
+
+    def __enter__(self):
+        return self.install()
+
+    def __exit__(self, *exc):
+        self.uninstall()
+        return False
+
+    def print_stats(self):
+        s = self.stats
+        print(f"\n📼 FIXTURES ({self.mode}, {len(self.archive)} stored): {s['replayed']} replayed, "
+              f"{s['recorded']} recorded, {s['missing']} missing, {s['injected_errors']} injected errors")
+
+# -------- Command line --------------------------------------------------------
+def run_script(transport, script, args):
+    """Run a scripts/ entry point as __main__ with the transport installed"""
+    import runpy
+    path = pathlib.Path(script)
+    if not path.exists():
+        path = SCRIPTS_DIR / script
+    sys.argv = [str(path)] + list(args)
+    if str(path.parent) not in sys.path:
+        sys.path.insert(0, str(path.parent))
+    start = time.perf_counter()
+    try:
+        with transport:
+            runpy.run_path(str(path), run_name='__main__')
+    finally:
+        transport.print_stats()
+        print(f"⏱️  {path.name} finished in {time.perf_counter() - start:.2f} s")
+
+def main():
+    parser = argparse.ArgumentParser(description="Record or replay scraper HTTP traffic")
+    sub = parser.add_subparsers(dest='command', required=True)
+    for mode in ('record', 'replay'):
+        p = sub.add_parser(mode, help=f"Run a script in {mode} mode")
+        p.add_argument('archive')
+        if mode == 'replay':
+            p.add_argument('--latency', type=float, default=0.0, help="Seconds added to every response")
+            p.add_argument('--jitter', type=float, default=0.0, help="Extra random delay, up to this many seconds")
+            p.add_argument('--error-rate', type=float, default=0.0, help="Share of requests that fail")
+            p.add_argument('--error-status', type=int, help="Fail with this HTTP status instead of a connection error")
+            p.add_argument('--seed', type=int, default=0)
+        p.add_argument('script', help="Script in scripts/ (or a path)")
+        p.add_argument('args', nargs=argparse.REMAINDER)
+    p = sub.add_parser('list', help="List stored responses")
+    p.add_argument('archive')
+    args = parser.parse_args()
+
+    if args.command == 'list':
+        archive = FixtureArchive(args.archive)
+        for meta in archive.entries():
+            print(f"  {meta['status']} {meta['method']:4} {meta['request_url']}")
+        print(f"\n📼 {len(archive)} responses in {args.archive}")
+        return
+
+    options = {}
+    if args.command == 'replay':
+        options = {'latency': args.latency, 'jitter': args.jitter, 'error_rate': args.error_rate,
+                   'error_status': args.error_status, 'seed': args.seed}
+    run_script(FixtureTransport(args.archive, args.command, **options), args.script, args.args)
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n\n⏹️  Operation cancelled by user")
+        sys.exit(1)
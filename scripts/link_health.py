@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Link Health Resolver
+Issues HEAD requests for every githubUrl, follows and records redirects, and
+caches the canonical URL and final status with a TTL. Applying the results
+rewrites renamed/transferred repos to their canonical URL and marks deleted
+ones ``dead`` so the scrapers skip them instead of paying for a 301 or 404
+on every run.
+
+    python link_health.py                 # check stale URLs and update mcp-data.json
+    python link_health.py --dry-run       # only report
+    python link_health.py --ttl-days 0    # recheck everything
+"""
+
+import sys
+import json
+import time
+import asyncio
+import argparse
+from urllib.parse import urljoin
+
+from catalog import DATA_FILE, load_catalog, save_catalog
+from schema import to_github_url
+
+CACHE_FILE = DATA_FILE.parent / "link-health.json"
+DEFAULT_TTL = 7 * 24 * 3600
+MAX_REDIRECTS = 5
+DEAD_STATUSES = {404, 410, 451}
+
+HEADERS = {
+    'User-Agent': 'mcp-curator-scraper/1.0 (contact: admin@mcpcurator.com)',
+}
+
+class LinkCache:
+    """url -> {status, canonical, redirects, checked_at}, persisted as JSON"""
+
+    def __init__(self, path=CACHE_FILE, ttl=DEFAULT_TTL):
+        self.path = path
+        self.ttl = ttl
+        try:
+            with open(path, 'r') as f:
+                entries = json.load(f)
+        except FileNotFoundError:
+            entries = {}
+        # Keys written before the schema normalized githubUrl (trailing '/' or
+        # '.git') are moved to the normalized URL the catalog now stores
+        self.entries = {}
+        for url, entry in entries.items():
+            key = to_github_url(url)
+            if key not in self.entries or url == key:
+                self.entries[key] = entry
+
+    def save(self):
+        with open(self.path, 'w') as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
+
+    def fresh(self, url):
+        entry = self.entries.get(url)
+        return entry is not None and time.time() - entry['checked_at'] < self.ttl
+
+    def get(self, url):
+        return self.entries.get(url)
+
+    def put(self, url, status, canonical, redirects):
+        self.entries[url] = {
+            'status': status,
+            'canonical': canonical,
+            'redirects': redirects,
+            'checked_at': time.time(),
+        }
+
+    def is_dead(self, url):
+        entry = self.entries.get(url)
+        return entry is not None and entry['status'] in DEAD_STATUSES
+
+    def canonical(self, url):
+        entry = self.entries.get(url)
+        return entry['canonical'] if entry and entry.get('canonical') else url
+
+async def resolve(session, url):
+    """Follow redirects by hand with HEAD; returns (final status, canonical url, hops)"""
+    hops = []
+    current = url
+    for _ in range(MAX_REDIRECTS + 1):
+        async with session.head(current, headers=HEADERS, allow_redirects=False) as resp:
+            if resp.status in (301, 302, 303, 307, 308) and 'Location' in resp.headers:
+                current = urljoin(current, resp.headers['Location']).rstrip('/')
+                hops.append(current)
+                continue
+            return resp.status, (current if resp.status == 200 else None), hops
+    return None, None, hops
+
+async def check_urls(urls, cache, concurrency=10):
+    """Resolve every URL that has no fresh cache entry"""
+    import aiohttp
+
+    stale = [url for url in dict.fromkeys(urls) if not cache.fresh(url)]
+    print(f"🔗 {len(stale)} of {len(set(urls))} URLs need checking")
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=20)) as session:
+        async def check(url):
+            async with semaphore:
+                try:
+                    status, canonical, hops = await resolve(session, url)
+                except Exception as e:
+                    print(f"  ⚠️  {url}: {e}")
+                    return
+                # Only cache definitive answers; rate limits and 5xx get retried next run
+                if status != 200 and status not in DEAD_STATUSES:
+                    print(f"  ⚠️  {url}: HTTP {status}, not cached")
+                    return
+                cache.put(url, status, canonical, hops)
+                if status in DEAD_STATUSES:
+                    print(f"  💀 {url}: HTTP {status}")
+                elif hops:
+                    print(f"  ↪️  {url} → {canonical or hops[-1]}")
+
+        await asyncio.gather(*(check(url) for url in stale))
+    cache.save()
+
+def apply_to_catalog(data, cache):
+    """Rewrite githubUrls to canonical form and flag dead entries; returns counts"""
+    renamed = dead = revived = 0
+    for tool in data:
+        url = tool.get('githubUrl')
+        if not url or cache.get(url) is None:
+            continue
+        if cache.is_dead(url):
+            if not tool.get('dead'):
+                tool['dead'] = True
+                dead += 1
+            continue
+        if tool.pop('dead', None):
+            revived += 1
+        canonical = cache.canonical(url)
+        if canonical != url:
+            tool['githubUrl'] = canonical
+            # Carry the result over so the canonical URL is not re-checked
+            cache.entries.setdefault(canonical, dict(cache.get(url), redirects=[]))
+            renamed += 1
+    return {'renamed': renamed, 'dead': dead, 'revived': revived}
+
+def run(data_file=DATA_FILE, ttl_days=DEFAULT_TTL / 86400, concurrency=10, dry_run=False):
+    """Check stale links and, unless ``dry_run``, apply the results to the catalog"""
+    cache = LinkCache(ttl=ttl_days * 86400)
+    data = load_catalog(data_file)
+    asyncio.run(check_urls([t['githubUrl'] for t in data if t.get('githubUrl')], cache, concurrency))
+
+    if dry_run:
+        return
+    counts = apply_to_catalog(data, cache)
+    save_catalog(data, data_file)
+    cache.save()
+    print(f"\n✨ {counts['renamed']} URLs canonicalized, {counts['dead']} newly dead, {counts['revived']} revived")
+
+def main():
+    parser = argparse.ArgumentParser(description="Check githubUrl health and resolve redirects")
+    parser.add_argument('--data', default=str(DATA_FILE))
+    parser.add_argument('--ttl-days', type=float, default=DEFAULT_TTL / 86400)
+    parser.add_argument('--concurrency', type=int, default=10)
+    parser.add_argument('--dry-run', action='store_true', help="Check links but leave the catalog untouched")
+    args = parser.parse_args()
+    run(args.data, args.ttl_days, args.concurrency, args.dry_run)
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n\n⏹️  Operation cancelled by user")
+        sys.exit(1)
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+MCP Curator CLI
+One entry point for the catalog maintenance scripts. Only argparse is loaded
+up front; each subcommand imports its own script (and that script's heavy
+dependencies) when it runs, so light jobs start fast.
+
+    python mcp-curator.py stars                # refresh stars for every repo
+    python mcp-curator.py stars --mode key     # just the key repositories
+    python mcp-curator.py scrape --concurrency 3
+    python mcp-curator.py contributors --mode owner
+    python mcp-curator.py dedup
+    python mcp-curator.py snapshots diff 12           # snapshot 12 against the current catalog
+    python mcp-curator.py links --dry-run
+    python mcp-curator.py failures --job stars
+    python mcp-curator.py index
+    python mcp-curator.py classify --apply
+    python mcp-curator.py rank --apply-ratings
+    python mcp-curator.py stats category language
+    python mcp-curator.py -v stats             # also report import times
+    python mcp-curator.py --fixtures ../data/fixtures/github.zip scrape   # offline replay
+"""
+
+import sys
+import time
+import argparse
+import pathlib
+import importlib.util
+
+STARTED = time.perf_counter()
+SCRIPTS_DIR = pathlib.Path(__file__).resolve().parent
+VERBOSE = False
+
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+def load(name):
+    """Import a script or module from scripts/ by file name, timing it in verbose mode"""
+    start = time.perf_counter()
+    module_name = name[:-3].replace('-', '_')
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, SCRIPTS_DIR / name)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    if VERBOSE:
+        print(f"⏱️  Loaded {name} in {(time.perf_counter() - start) * 1000:.0f} ms")
+    return module
+
+# -------- Subcommands ---------------------------------------------------------
+def cmd_scrape(args):
+    import asyncio
+    scraper = load('github-scraper.py')
+    data_file = pathlib.Path(args.data)
+    asyncio.run(scraper.scrape_github_repos(
+        input_file=str(data_file),
+        output_file=str(data_file.parent / "github-scraped-data.json"),
+        max_concurrent=args.concurrency
+    ))
+
+def cmd_stars(args):
+    if args.mode == 'all':
+        load('update-all-stars.py').main(args.data)
+    elif args.mode == 'batch':
+        load('batch-update.py').main(args.data)
+    else:
+        load('quick-scraper.py').update_key_repos(args.data)
+
+def cmd_contributors(args):
+    if args.mode == 'owner':
+        load('simple-contributors.py').add_owner_as_contributor(args.data)
+    elif args.mode == 'top':
+        load('contributors-scraper.py').update_top_repositories_only(args.data)
+    else:
+        load('contributors-scraper.py').update_contributors_data(args.data)
+
+def cmd_dedup(args):
+    load('remove-duplicates.py').remove_duplicates(args.data)
+
+def cmd_snapshots(args):
+    load('snapshots.py').main(['--data', args.data] + args.rest)
+
+def cmd_links(args):
+    load('link_health.py').run(args.data, args.ttl_days, args.concurrency, args.dry_run)
+
+def cmd_failures(args):
+    if args.reset is not None and not args.job:
+        sys.exit("❌ --reset needs --job")
+    ledger = load('failure_ledger.py')
+    path = pathlib.Path(args.data).parent / ledger.LEDGER_FILE.name
+    if args.reset is not None:
+        with ledger.FailureLedger(args.job, path) as failures:
+            failures.reset(args.reset or None)
+        print(f"🧹 Cleared {args.reset or 'all failures'} for {args.job}")
+    else:
+        ledger.print_report(path, args.job, args.min_streak or ledger.THRESHOLD)
+
+def cmd_index(args):
+    import json
+    analytics = load('analytics.py')
+    frame = analytics.load_frame(args.data)
+    out = pathlib.Path(args.data).parent / "category-counts.json"
+    with open(out, 'w') as f:
+        json.dump(analytics.category_counts(frame), f, indent=2)
+    print(f"💾 Category counts saved to {out}")
+
+    recommend = load('recommend.py')
+    out_dir = pathlib.Path(args.data).parent
+    neighbours = recommend.rebuild(args.data, path=out_dir / "related-tools.json")
+
+    scores = load('ranking.py').run(args.data, out=out_dir / "rankings.json")
+
+    pages = load('pages.py')
+    with open(args.data, 'r') as f:
+        data = json.load(f)
+    counts = pages.write_pages(data, out_dir / "pages", recommend.related_ids(data, neighbours), scores)
+    print(f"📄 {counts['pages']} page payloads: {counts['written']} written, {counts['removed']} removed")
+
+def cmd_classify(args):
+    argv = ['--data', args.data]
+    if args.apply:
+        argv.append('--apply')
+    if args.min_confidence is not None:
+        argv += ['--min-confidence', str(args.min_confidence)]
+    load('classify.py').main(argv)
+
+def cmd_rank(args):
+    ranking = load('ranking.py')
+    ranking.run(args.data, args.top or ranking.TOP_N, args.apply_ratings)
+
+def cmd_stats(args):
+    analytics = load('analytics.py')
+    unknown = set(args.reports) - set(analytics.REPORTS)
+    if unknown:
+        print(f"❌ Unknown report(s): {', '.join(sorted(unknown))}. Choose from: {', '.join(analytics.REPORTS)}")
+        sys.exit(2)
+    frame = analytics.load_frame(args.data, use_cache=not args.no_cache)
+    reports = args.reports or analytics.REPORTS
+    history = analytics.load_history(args.data) if 'history' in reports else None
+    analytics.print_reports(frame, reports, history)
+
+def build_parser():
+    default_data = str(SCRIPTS_DIR.parent / "data" / "mcp-data.json")
+    parser = argparse.ArgumentParser(prog='mcp-curator', description="MCP Curator catalog tooling")
+    parser.add_argument('-v', '--verbose', action='store_true', help="Report import and run times")
+    parser.add_argument('--data', default=default_data, help="Path to mcp-data.json")
+    parser.add_argument('--fixtures', metavar='ARCHIVE', help="Serve HTTP from a fixture archive (see http_fixtures.py)")
+    parser.add_argument('--record', action='store_true', help="With --fixtures, fetch and store missing responses")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('scrape', help="Scrape full repo data for every githubUrl")
+    p.add_argument('--concurrency', type=int, default=3)
+    p.set_defaults(func=cmd_scrape)
+
+    p = sub.add_parser('stars', help="Refresh star counts")
+    p.add_argument('--mode', choices=['all', 'batch', 'key'], default='all',
+                   help="all repos, the first 50 (batch) or the key repositories")
+    p.set_defaults(func=cmd_stars)
+
+    p = sub.add_parser('contributors', help="Fill in contributors")
+    p.add_argument('--mode', choices=['top', 'all', 'owner'], default='top',
+                   help="scrape the top 50, scrape all, or just add repo owners")
+    p.set_defaults(func=cmd_contributors)
+
+    p = sub.add_parser('dedup', help="Remove known duplicate entries")
+    p.set_defaults(func=cmd_dedup)
+
+    p = sub.add_parser('snapshots', help="List, diff and restore catalog versions (see snapshots.py)")
+    p.add_argument('rest', nargs=argparse.REMAINDER, metavar='take|list|diff|restore|prune ...')
+    p.set_defaults(func=cmd_snapshots)
+
+    p = sub.add_parser('links', help="Resolve redirects and mark dead repos")
+    p.add_argument('--ttl-days', type=float, default=7)
+    p.add_argument('--concurrency', type=int, default=10)
+    p.add_argument('--dry-run', action='store_true')
+    p.set_defaults(func=cmd_links)
+
+    p = sub.add_parser('failures', help="Report repos that keep failing, or clear their record")
+    p.add_argument('--job', choices=['scrape', 'stars', 'contributors'])
+    p.add_argument('--min-streak', type=int, help="Default: failure_ledger.THRESHOLD")
+    p.add_argument('--reset', metavar='REPO', nargs='?', const='', help="Forget a repo's failures (all with no repo)")
+    p.set_defaults(func=cmd_failures)
+
+    p = sub.add_parser('index', help="Rebuild derived index files and page payloads for the site")
+    p.set_defaults(func=cmd_index)
+
+    p = sub.add_parser('classify', help="Predict categories and canonical tags")
+    p.add_argument('--apply', action='store_true', help="Write confident predictions to the catalog")
+    p.add_argument('--min-confidence', type=float, help="Default: classify.DEFAULT_MIN_CONFIDENCE")
+    p.set_defaults(func=cmd_classify)
+
+    p = sub.add_parser('rank', help="Score tools by popularity and write per-category top lists")
+    p.add_argument('--top', type=int, help="Default: ranking.TOP_N")
+    p.add_argument('--apply-ratings', action='store_true', help="Replace ratings with score percentiles")
+    p.set_defaults(func=cmd_rank)
+
+    p = sub.add_parser('stats', help="Print analytics reports")
+    p.add_argument('reports', nargs='*', metavar='report')
+    p.add_argument('--no-cache', action='store_true')
+    p.set_defaults(func=cmd_stats)
+
+    return parser
+
+def main(argv=None):
+    global VERBOSE
+    args = build_parser().parse_args(argv)
+    VERBOSE = args.verbose
+    if VERBOSE:
+        print(f"⏱️  CLI ready in {(time.perf_counter() - STARTED) * 1000:.0f} ms")
+    start = time.perf_counter()
+    if args.fixtures:
+        fixtures = load('http_fixtures.py')
+        with fixtures.FixtureTransport(args.fixtures, 'record' if args.record else 'replay') as transport:
+            args.func(args)
+        transport.print_stats()
+    else:
+        args.func(args)
+    if VERBOSE:
+        print(f"⏱️  {args.command} finished in {time.perf_counter() - start:.2f} s")
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n\n⏹️  Operation cancelled by user")
+        sys.exit(1)
+    except Exception as e:
+        if VERBOSE:
+            import traceback
+            traceback.print_exc()
+        print(f"\n❌ Error: {e}")
+        sys.exit(1)
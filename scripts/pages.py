@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Page Payloads
+Precomputes what the site's static pages need from the catalog and shards it
+into small JSON files, so a page build reads a few kilobytes instead of
+importing and scanning all of mcp-data.json:
+
+    data/pages/tools/<slug>.json           tool entry, related tools, category membership
+    data/pages/categories/<category>.json  tool cards for one category page
+    data/pages/index.json                  slugs and categories for generateStaticParams
+    data/pages/sitemap.json                every page path with its lastmod
+
+Related tools come from related-tools.json (recommend.py) when it exists,
+otherwise they are the first tools of the same category. Category pages list
+tools by popularity score (ranking.py) once the catalog has been ranked,
+otherwise in catalog order. Both files are read from the directory of --data,
+where `mcp-curator index` writes them.
+
+A page's lastmod is when its payload last changed (tracked by content hash
+in manifest.json); pages seen for the first time take the tool's scrape
+time or lastUpdated. Unchanged shards are not rewritten; run bookkeeping
+(scraped_at) is left out of payloads, so a re-scrape alone changes none.
+
+    python pages.py                  # rebuild data/pages from mcp-data.json
+    python pages.py --out /tmp/pages
+"""
+
+import sys
+import json
+import time
+import hashlib
+import pathlib
+import argparse
+
+from catalog import DATA_FILE
+from changeset import BOOKKEEPING_FIELDS, generate_slug
+
+PAGES_DIR = DATA_FILE.parent / "pages"
+RELATED_COUNT = 6
+
+# Fields the tool cards on category and related-tool lists render
+CARD_FIELDS = ('id', 'name', 'description', 'language', 'tags', 'rating', 'stars', 'lastUpdated')
+
+def tool_card(tool, slug):
+    card = {field: tool.get(field) for field in CARD_FIELDS}
+    card['slug'] = slug
+    return card
+
+def assign_slugs(data):
+    """slug -> tool, first entry wins like getToolBySlug's find(); returns (slugs, collisions)"""
+    slugs = {}
+    collisions = 0
+    for tool in data:
+        slug = generate_slug(tool['name'])
+        if slug in slugs:
+            collisions += 1
+            continue
+        slugs[slug] = tool
+    return slugs, collisions
+
+def related_by_category(data, count=RELATED_COUNT):
+    """id -> related ids: the first ``count`` other tools of the same category (the site's old rule)"""
+    by_category = {}
+    for tool in data:
+        by_category.setdefault(tool['category'], []).append(tool['id'])
+    return {
+        tool['id']: [i for i in by_category[tool['category']][:count + 1] if i != tool['id']][:count]
+        for tool in data
+    }
+
+def load_related(data, data_dir=DATA_FILE.parent):
+    """Related ids from the recommender's neighbours file in ``data_dir``, or None to use the category rule"""
+    import recommend
+    neighbours = recommend.load_neighbours(data_dir / recommend.NEIGHBOURS_FILE.name)
+    return recommend.related_ids(data, neighbours) if neighbours else None
+
+def load_scores(data_dir=DATA_FILE.parent):
+    """id -> popularity score from the last ranking run in ``data_dir``, or None to keep catalog order"""
+    import ranking
+    return ranking.load_scores(data_dir / ".cache" / ranking.STATE_FILE.name)
+
+def _digest(payload):
+    return hashlib.sha1(json.dumps(payload, sort_keys=True).encode()).hexdigest()[:16]
+
+# -------- Building ------------------------------------------------------------
+def build_pages(data, related=None, scores=None):
+    """All page payloads as {relative path: payload}, plus the slug index"""
+    slugs, collisions = assign_slugs(data)
+    # Every tool is listed and counted; only the /mcp/<slug> shards are
+    # deduplicated, and cards link by slug just as the site's generateSlug does
+    slug_of = {tool['id']: generate_slug(tool['name']) for tool in data}
+    by_id = {tool['id']: tool for tool in data}
+    related = related if related is not None else related_by_category(data)
+
+    members = {}
+    for tool in data:
+        members.setdefault(tool['category'], []).append(tool)
+    counts = {category: len(group) for category, group in members.items()}
+
+    payloads = {}
+    for slug, tool in slugs.items():
+        payloads[f"tools/{slug}.json"] = {
+            'slug': slug,
+            # Bookkeeping would change the hash (and lastmod) of every shard on every scrape
+            'tool': {k: v for k, v in tool.items() if k not in BOOKKEEPING_FIELDS},
+            'related': [tool_card(by_id[i], slug_of[i]) for i in related.get(tool['id'], []) if i in by_id],
+            'category': {'name': tool['category'], 'count': counts[tool['category']]},
+        }
+    for category, group in members.items():
+        if scores:
+            group = sorted(group, key=lambda tool: -scores.get(tool['id'], float('-inf')))
+        payloads[f"categories/{category}.json"] = {
+            'category': category,
+            'count': len(group),
+            'tools': [tool_card(tool, slug_of[tool['id']]) for tool in group],
+            'others': [{'name': c, 'count': n} for c, n in counts.items() if c != category],
+        }
+    index = {
+        'slugs': list(slugs),
+        'categories': [{'name': c, 'count': n} for c, n in counts.items()],
+    }
+    return payloads, index, slugs, collisions
+
+def first_seen(data, slugs, now):
+    """lastmod for shards with no manifest entry yet, from each tool's scrape history"""
+    def lastmod(tool):
+        # scraped_at is "YYYY-MM-DD HH:MM:SS", lastUpdated a date
+        return tool['scraped_at'].replace(' ', 'T') if tool.get('scraped_at') else tool.get('lastUpdated') or now
+
+    dates = {f"tools/{slug}.json": lastmod(tool) for slug, tool in slugs.items()}
+    for tool in data:
+        path = f"categories/{tool['category']}.json"
+        dates[path] = max(dates.get(path, ''), lastmod(tool))
+    return dates
+
+def write_pages(data, out_dir=PAGES_DIR, related=None, scores=None):
+    """Write changed shards, drop stale ones, update manifest and sitemap; returns counts"""
+    now = time.strftime("%Y-%m-%dT%H:%M:%S")
+    payloads, index, slugs, collisions = build_pages(data, related, scores)
+    fallback = first_seen(data, slugs, now)
+    manifest_file = out_dir / "manifest.json"
+    try:
+        with open(manifest_file, 'r') as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        manifest = {}
+
+    written = 0
+    new_manifest = {}
+    for path, payload in payloads.items():
+        digest = _digest(payload)
+        previous = manifest.get(path)
+        target = out_dir / path
+        if previous and previous['hash'] == digest and target.exists():
+            new_manifest[path] = previous
+            continue
+        lastmod = now if previous else fallback[path]
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with open(target, 'w') as f:
+            json.dump(payload, f, separators=(',', ':'))
+        new_manifest[path] = {'hash': digest, 'lastmod': lastmod}
+        written += 1
+
+    removed = 0
+    for path in manifest.keys() - new_manifest.keys():
+        (out_dir / path).unlink(missing_ok=True)
+        removed += 1
+
+    sitemap = []
+    for path, entry in new_manifest.items():
+        kind, name = path[:-5].split('/', 1)
+        sitemap.append({'path': f"/{'mcp' if kind == 'tools' else 'category'}/{name}", 'lastmod': entry['lastmod']})
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for name, content in (('index.json', index), ('sitemap.json', sitemap)):
+        with open(out_dir / name, 'w') as f:
+            json.dump(content, f, separators=(',', ':'))
+    with open(manifest_file, 'w') as f:
+        json.dump(new_manifest, f, indent=2, sort_keys=True)
+
+    return {'pages': len(payloads), 'written': written, 'removed': removed, 'collisions': collisions}
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute per-page JSON payloads for the site")
+    parser.add_argument('--data', default=str(DATA_FILE))
+    parser.add_argument('--out', help="Default: pages/ next to --data")
+    args = parser.parse_args()
+
+    data_dir = pathlib.Path(args.data).parent
+    with open(args.data, 'r') as f:
+        data = json.load(f)
+    out_dir = pathlib.Path(args.out) if args.out else data_dir / PAGES_DIR.name
+    counts = write_pages(data, out_dir, load_related(data, data_dir), load_scores(data_dir))
+    print(f"📄 {counts['pages']} pages: {counts['written']} written, {counts['removed']} removed")
+    if counts['collisions']:
+        print(f"⚠️  {counts['collisions']} tools share a slug with an earlier entry and have no page of their own")
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Partial-Body Fetching
+Streams a GitHub page in chunks, runs the extraction fast paths on the growing
+prefix and closes the connection as soon as every requested field is found.
+If the body ends with fields still missing, the full page goes through the
+normal extractor (including its DOM fallbacks).
+"""
+
+import codecs
+from collections import Counter
+
+import requests
+
+from extraction import extractor as shared_extractor, DEFAULTS
+
+CHUNK_SIZE = 32 * 1024
+# Each new chunk is searched together with this much of the text before it,
+# so a match straddling a chunk boundary is still found
+OVERLAP = 16 * 1024
+
+# Run-wide counters: requests, early_stops, bytes_read
+stats = Counter()
+
+class PartialBody:
+    """Accumulates decoded chunks and checks them against the requested fields"""
+
+    def __init__(self, fields, encoding=None, extractor=None):
+        self.fields = list(fields)
+        self.extractor = extractor or shared_extractor
+        self.decoder = codecs.getincrementaldecoder(encoding or 'utf-8')(errors='replace')
+        self.text = ''
+        self.found = {}
+        self.bytes_read = 0
+        self.truncated = False
+
+    def feed(self, chunk: bytes) -> bool:
+        """Add a chunk; returns True once every requested field has been found.
+
+        Only fields still missing are searched for, and only in the new text
+        plus OVERLAP characters before it, so a page costs one pass.
+        """
+        self.bytes_read += len(chunk)
+        start = max(len(self.text) - OVERLAP, 0)
+        self.text += self.decoder.decode(chunk)
+        missing = [f for f in self.fields if f not in self.found]
+        self.found.update(self.extractor.extract_partial(self.text, missing, start))
+        return len(self.found) == len(self.fields)
+
+    def finish(self, complete: bool, defaults=DEFAULTS) -> dict:
+        """Turn what was read into a result, falling back to a full extraction"""
+        stats['requests'] += 1
+        stats['bytes_read'] += self.bytes_read
+        if not complete:
+            self.text += self.decoder.decode(b'', final=True)
+            return self.extractor.extract(self.text, self.fields, defaults)
+        stats['early_stops'] += 1
+        self.truncated = True
+        self.extractor.record(self.found, self.fields)
+        return {field: value for field, (_, value) in self.found.items()}
+
+def fetch_fields(url, fields, headers=None, timeout=15, defaults=DEFAULTS):
+    """Fetch only as much of ``url`` as needed to extract ``fields`` (requests).
+
+    Returns ``(status, result, html, headers)``; ``result`` is None for
+    non-200 responses, ``html`` is the whole page, or None when the download
+    stopped early and only a prefix was read, and ``headers`` are the
+    response headers (for failure_kind).
+    """
+    with requests.get(url, headers=headers, timeout=timeout, stream=True) as response:
+        if response.status_code != 200:
+            return response.status_code, None, None, response.headers
+        body = PartialBody(fields, response.encoding)
+        complete = False
+        for chunk in response.iter_content(CHUNK_SIZE):
+            if body.feed(chunk):
+                complete = True
+                break
+        # Leaving the with-block closes the connection without draining the rest
+        result = body.finish(complete, defaults)
+        return response.status_code, result, None if body.truncated else body.text, response.headers
+
+async def fetch_fields_async(session, url, fields, headers=None, timeout=30, defaults=DEFAULTS):
+    """Async counterpart of ``fetch_fields`` for an aiohttp session"""
+    async with session.get(url, headers=headers, timeout=timeout) as resp:
+        if resp.status != 200:
+            return resp.status, None, None, resp.headers
+        body = PartialBody(fields, resp.charset)
+        complete = False
+        async for chunk in resp.content.iter_chunked(CHUNK_SIZE):
+            if body.feed(chunk):
+                complete = True
+                resp.close()
+                break
+        result = body.finish(complete, defaults)
+        return resp.status, result, None if body.truncated else body.text, resp.headers
+
+def print_stats():
+    """Print how often fetches stopped early and how much was downloaded"""
+    if not stats['requests']:
+        return
+    avg_kb = stats['bytes_read'] / stats['requests'] / 1024
+    print(f"\n📉 PARTIAL FETCHES: {stats['early_stops']}/{stats['requests']} stopped early, "
+          f"{stats['bytes_read'] / 1024:,.0f} KB read ({avg_kb:.0f} KB/page)")
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Staged Pipeline
+Bounded-concurrency building block for the scraping jobs. A producer feeds
+items from a (sync or async) iterable into a bounded queue, each stage runs
+its own pool of workers between two queues, and a single sink consumes the
+results as they arrive. Because every queue is bounded, a slow stage or a
+slow sink pushes back on the producer instead of letting work pile up, so
+memory stays flat and results reach storage while the run is going.
+
+    stages = [Stage('fetch', fetch, workers=3), Stage('parse', parse, blocking=True)]
+    stats = asyncio.run(Pipeline(urls, stages, sink=store).run())
+
+A stage function returns the item for the next stage, or None to drop it.
+Blocking functions (requests, BeautifulSoup) run in a thread when the stage
+is created with ``blocking=True``. The sink is only ever called from one
+task, so it can write files or mutate the catalog without locking.
+"""
+
+import json
+import asyncio
+import inspect
+from collections import Counter
+
+# Queue marker telling a worker its upstream is exhausted
+_DONE = object()
+
+class Stage:
+    """One step of a pipeline: a function and the number of workers running it"""
+
+    __slots__ = ('name', 'func', 'workers', 'blocking', 'queue_size')
+
+    def __init__(self, name, func, workers=1, blocking=False, queue_size=None):
+        self.name = name
+        self.func = func
+        self.workers = max(int(workers), 1)
+        self.blocking = blocking
+        # Items allowed to wait in front of this stage
+        self.queue_size = queue_size or 2 * self.workers
+
+    async def call(self, item):
+        if self.blocking:
+            return await asyncio.to_thread(self.func, item)
+        result = self.func(item)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+class Pipeline:
+    """Producer → stage queues/worker pools → sink"""
+
+    def __init__(self, source, stages, sink, progress=None, sink_queue_size=None):
+        self.source = source
+        self.stages = list(stages)
+        self.sink = sink
+        # Anything with tqdm's update(); advanced once per finished item
+        self.progress = progress
+        self.sink_queue_size = sink_queue_size or 2 * self.stages[-1].workers
+        self.stats = Counter()
+        self._in_flight = 0
+
+    # -------- Bookkeeping -----------------------------------------------------
+    def _finished(self, outcome):
+        self.stats[outcome] += 1
+        self._in_flight -= 1
+        if self.progress is not None:
+            self.progress.update(1)
+
+    async def _close(self, queue, consumers):
+        for _ in range(consumers):
+            await queue.put(_DONE)
+
+    # -------- Tasks -----------------------------------------------------------
+    async def _produce(self, out, consumers):
+        if hasattr(self.source, '__aiter__'):
+            async for item in self.source:
+                await self._emit(out, item)
+        else:
+            for item in self.source:
+                await self._emit(out, item)
+        await self._close(out, consumers)
+
+    async def _emit(self, out, item):
+        self.stats['produced'] += 1
+        self._in_flight += 1
+        self.stats['peak_in_flight'] = max(self.stats['peak_in_flight'], self._in_flight)
+        await out.put(item)
+
+    async def _work(self, stage, inbox, out, remaining, consumers):
+        while True:
+            item = await inbox.get()
+            if item is _DONE:
+                # The last worker of a stage to finish closes the next queue
+                remaining[stage.name] -= 1
+                if remaining[stage.name] == 0:
+                    await self._close(out, consumers)
+                return
+            try:
+                result = await stage.call(item)
+            except Exception as e:
+                print(f"⚠️  {stage.name} failed on {item!r:.80}: {e}")
+                self._finished(f"{stage.name}_errors")
+                continue
+            if result is None:
+                self._finished(f"{stage.name}_dropped")
+            else:
+                await out.put(result)
+
+    async def _drain(self, inbox):
+        while True:
+            item = await inbox.get()
+            if item is _DONE:
+                return
+            result = self.sink(item)
+            if inspect.isawaitable(result):
+                await result
+            self._finished('stored')
+
+    async def run(self):
+        """Run until the source is exhausted and every item has reached the sink"""
+        queues = [asyncio.Queue(maxsize=stage.queue_size) for stage in self.stages]
+        queues.append(asyncio.Queue(maxsize=self.sink_queue_size))
+        consumers = [stage.workers for stage in self.stages] + [1]
+        remaining = {stage.name: stage.workers for stage in self.stages}
+
+        tasks = [asyncio.create_task(self._produce(queues[0], consumers[0]))]
+        for i, stage in enumerate(self.stages):
+            for _ in range(stage.workers):
+                tasks.append(asyncio.create_task(
+                    self._work(stage, queues[i], queues[i + 1], remaining, consumers[i + 1])
+                ))
+        tasks.append(asyncio.create_task(self._drain(queues[-1])))
+
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # A failing sink (or cancellation) stops the whole pipeline
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        return self.stats
+
+# -------- Sinks ---------------------------------------------------------------
+class JsonArrayWriter:
+    """Writes a JSON array one element at a time, so results are on disk as they arrive.
+
+    The file is valid JSON once closed; a run that dies midway leaves every
+    element written so far, just without the closing bracket.
+    """
+
+    def __init__(self, path, flush_every=10):
+        self.path = path
+        self.flush_every = flush_every
+        self.count = 0
+        self._file = None
+
+    def __enter__(self):
+        self._file = open(self.path, 'w')
+        self._file.write('[')
+        return self
+
+    def write(self, item):
+        self._file.write(',\n  ' if self.count else '\n  ')
+        self._file.write(json.dumps(item))
+        self.count += 1
+        if self.count % self.flush_every == 0:
+            self._file.flush()
+
+    def __exit__(self, *exc):
+        self._file.write('\n]\n' if self.count else ']\n')
+        self._file.close()
+        return False
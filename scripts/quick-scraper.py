@@ -1,9 +1,9 @@
 #!/usr/bin/env python3
-import json
-import requests
-from bs4 import BeautifulSoup
+from extraction import extractor
+from partial_fetch import fetch_fields, print_stats
 import re
 import sys
+from catalog import DATA_FILE, load_catalog, save_catalog, sort_by_stars
 
 def get_repo_stars(github_url):
     """Get real stars count from GitHub repository"""
@@ -12,43 +12,21 @@ def get_repo_stars(github_url):
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         }
         
-        response = requests.get(github_url, headers=headers, timeout=10)
-        if response.status_code != 200:
+        # Stars sit in the page header, so stop downloading once they are parsed
+        status, fields, _, _ = fetch_fields(github_url, ['stars'], headers=headers, timeout=10, defaults={})
+        if fields is None:
             return None
             
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Try multiple selectors for stars
-        star_selectors = [
-            '#repo-stars-counter-star',
-            'a[href$="/stargazers"] .Counter',
-            'a[href*="stargazers"] strong',
-            '[data-testid="stargazers"] .Counter'
-        ]
-        
-        for selector in star_selectors:
-            star_elem = soup.select_one(selector)
-            if star_elem:
-                text = star_elem.get_text(strip=True)
-                # Parse number (handle k, m suffixes)
-                if 'k' in text.lower():
-                    return int(float(text.lower().replace('k', '')) * 1000)
-                elif 'm' in text.lower():
-                    return int(float(text.lower().replace('m', '')) * 1000000)
-                else:
-                    return int(text.replace(',', ''))
-        
-        return None
+        return fields['stars']
         
     except Exception as e:
         print(f"Error fetching {github_url}: {e}")
         return None
 
-def update_key_repos():
+def update_key_repos(data_file=DATA_FILE):
     """Update star counts for key repositories"""
     # Load current data
-    with open('../data/mcp-data.json', 'r') as f:
-        data = json.load(f)
+    data = load_catalog(data_file)
     
     # Key repositories to update
     key_repos = [
@@ -84,16 +62,18 @@ def update_key_repos():
             print(f"Updated {tool['name']}: {old_stars} → {new_stars} stars")
     
     # Sort by stars
-    data.sort(key=lambda x: x.get('stars', 0), reverse=True)
+    sort_by_stars(data)
     
     # Save updated data
-    with open('../data/mcp-data.json', 'w') as f:
-        json.dump(data, f, indent=2)
+    save_catalog(data, data_file)
     
     print(f"\n✅ Updated {updated_count} repositories")
     print("📊 Top 10 tools by stars:")
     for i, tool in enumerate(data[:10], 1):
         print(f"  {i:2d}. {tool['name']:30} {tool.get('stars', 0):6,} ⭐")
+    
+    extractor.print_report()
+    print_stats()
 
 if __name__ == "__main__":
     update_key_repos()
\ No newline at end of file
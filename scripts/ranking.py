@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Popularity Ranking
+Composite score per tool from stars, star velocity, forks, contributor count
+and how recently it was updated, computed with NumPy over the whole catalog:
+
+    score = log10(1 + stars) + 0.5·log10(1 + forks) + 0.3·log10(1 + contributors)
+          + 0.5·log10(1 + stars gained per week) + 0.5^(days since lastUpdated / 180)
+
+Recency is worth at most one point (a repo updated today against one idle
+for years is 10x the stars), and a tool with no lastUpdated gets the
+catalog's median recency rather than counting as abandoned. Star velocity
+is measured on every run a day or more after the last one, so a burst of
+stars fades again as later runs see fewer. Only entries whose inputs, age
+or velocity changed since the last run are rescored. Per-category top-N
+lists are picked with a heap and written to data/rankings.json, and the
+page payloads order category pages by score.
+
+    python ranking.py                   # rank the catalog, write data/rankings.json
+    python ranking.py --top 50
+    python ranking.py --apply-ratings   # also replace static ratings with score-based ones
+    python ranking.py --bench 100000    # time scoring on a synthetic catalog
+"""
+
+import sys
+import json
+import time
+import heapq
+import pathlib
+import argparse
+
+import numpy as np
+
+from catalog import DATA_FILE, load_catalog, save_catalog
+
+RANKINGS_FILE = DATA_FILE.parent / "rankings.json"
+STATE_FILE = DATA_FILE.parent / ".cache" / "ranking-state.npz"
+TOP_N = 20
+
+WEIGHTS = {'stars': 1.0, 'forks': 0.5, 'contributors': 0.3, 'velocity': 0.5, 'recency': 1.0}
+EPOCH = np.datetime64('2020-01-01', 'D')
+# Days after which the recency term has halved
+RECENCY_HALF_LIFE = 180
+# Days after which an old velocity measurement counts half against a new one
+VELOCITY_HALF_LIFE = 7
+
+FEATURES = ('stars', 'forks', 'contributors', 'updated')
+
+# -------- Scoring -------------------------------------------------------------
+def features(data):
+    """Catalog columns as arrays; ``updated`` is days since EPOCH (NaN when unknown)"""
+    n = len(data)
+    ids = np.fromiter((t['id'] for t in data), dtype=np.int64, count=n)
+    stars = np.fromiter((t.get('stars', 0) for t in data), dtype=np.float64, count=n)
+    forks = np.fromiter((t.get('forks', 0) for t in data), dtype=np.float64, count=n)
+    contributors = np.fromiter((len(t.get('contributors') or ()) for t in data), dtype=np.float64, count=n)
+    dates = np.array([t.get('lastUpdated') or 'NaT' for t in data], dtype='datetime64[D]')
+    updated = (dates - EPOCH).astype(np.float64)
+    updated[np.isnat(dates)] = np.nan
+    return ids, {'stars': stars, 'forks': forks, 'contributors': contributors, 'updated': updated}
+
+def recency(updated, today):
+    """0-1 recency from days since EPOCH; unknown dates get the median of the known ones"""
+    age = np.maximum(today - updated, 0)
+    value = 0.5 ** (age / RECENCY_HALF_LIFE)
+    unknown = np.isnan(value)
+    if unknown.any():
+        value[unknown] = np.median(value[~unknown]) if not unknown.all() else 0.5
+    return value
+
+def composite_score(stars, forks, contributors, velocity, recent):
+    """Vectorized score; every argument is an array of the same length"""
+    return (WEIGHTS['stars'] * np.log10(1 + stars)
+            + WEIGHTS['forks'] * np.log10(1 + forks)
+            + WEIGHTS['contributors'] * np.log10(1 + contributors)
+            + WEIGHTS['velocity'] * np.log10(1 + 7 * velocity)
+            + WEIGHTS['recency'] * recent)
+
+def _differs(old, new):
+    """Elementwise old != new, with NaN equal to NaN"""
+    return (old != new) & ~(np.isnan(old) & np.isnan(new))
+
+class RankingState:
+    """Scores and inputs from the previous run, aligned by id (``path=None`` keeps it in memory)"""
+
+    def __init__(self, path=STATE_FILE):
+        self.path = path
+        self.ids = np.empty(0, dtype=np.int64)
+        self.columns = {name: np.empty(0) for name in FEATURES + ('recency', 'velocity', 'seen', 'score')}
+        if path is None:
+            return
+        try:
+            with np.load(path) as saved:
+                self.ids = saved['ids']
+                self.columns = {name: saved[name] for name in self.columns}
+        except (FileNotFoundError, KeyError):
+            pass
+
+    def update(self, ids, columns, today=None):
+        """Rescore only new or changed entries; returns (scores aligned with ``ids``, rescored count)"""
+        today = float((np.datetime64(today or 'today', 'D') - EPOCH).astype(np.int64))
+        n = len(ids)
+
+        # Where each current id sits in the previous run, if it was there
+        order = np.argsort(self.ids)
+        pos = np.searchsorted(self.ids[order], ids)
+        pos[pos >= len(order)] = 0
+        found = np.zeros(n, dtype=bool)
+        if len(order):
+            found = self.ids[order][pos] == ids
+        prev = np.where(found, order[pos] if len(order) else 0, 0)
+
+        def previous(name, default=0.0):
+            return np.where(found, self.columns[name][prev] if len(order) else default, default)
+
+        changed = ~found
+        for name in FEATURES:
+            changed |= _differs(previous(name), columns[name])
+
+        # Recency moves with the date, so it is an input of its own
+        recent = recency(columns['updated'], today)
+        changed |= _differs(previous('recency'), recent)
+
+        # Star velocity: stars gained per day since the last measurement,
+        # averaged with the previous velocity by how long ago that was measured
+        old_velocity = previous('velocity')
+        seen = np.where(found, previous('seen'), today)
+        elapsed = today - seen
+        measured = found & (elapsed > 0)
+        gained = np.maximum(columns['stars'] - previous('stars'), 0) / np.maximum(elapsed, 1)
+        keep = 0.5 ** (elapsed / VELOCITY_HALF_LIFE)
+        velocity = np.where(measured, keep * old_velocity + (1 - keep) * gained, old_velocity)
+        seen = np.where(measured | ~found, today, seen)
+        changed |= velocity != old_velocity
+
+        scores = previous('score')
+        if changed.any():
+            scores[changed] = composite_score(*(columns[name][changed] for name in ('stars', 'forks', 'contributors')),
+                                              velocity[changed], recent[changed])
+
+        self.ids = ids
+        self.columns = dict(columns, recency=recent, velocity=velocity, seen=seen, score=scores)
+        return scores, int(changed.sum())
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez(self.path, ids=self.ids, **self.columns)
+
+# -------- Rankings ------------------------------------------------------------
+def top_by_category(categories, scores, n=TOP_N):
+    """{category: row indices of its top ``n``} via heap selection, best first"""
+    rows_by_category = {}
+    for row, category in enumerate(categories):
+        rows_by_category.setdefault(category, []).append(row)
+    return {
+        category: heapq.nlargest(n, rows, key=scores.__getitem__)
+        for category, rows in rows_by_category.items()
+    }
+
+def score_ratings(scores):
+    """Ratings "3.0"-"5.0" from each score's percentile in the catalog"""
+    if len(scores) == 0:
+        return []
+    percentile = np.argsort(np.argsort(scores, kind='stable'), kind='stable') / max(len(scores) - 1, 1)
+    return [f"{r:.1f}" for r in 3.0 + 2.0 * percentile]
+
+def rank_catalog(data, state=None, top=TOP_N, today=None):
+    """Score the catalog; returns (rankings document, scores aligned with ``data``, rescored count)"""
+    from changeset import generate_slug
+
+    state = state or RankingState()
+    ids, columns = features(data)
+    scores, rescored = state.update(ids, columns, today)
+
+    def entry(row):
+        tool = data[row]
+        return {'id': tool['id'], 'slug': generate_slug(tool['name']), 'score': round(float(scores[row]), 4)}
+
+    overall = heapq.nlargest(top, range(len(data)), key=scores.__getitem__)
+    rankings = {
+        'generated_at': time.strftime("%Y-%m-%d %H:%M:%S"),
+        'weights': dict(WEIGHTS, recency_half_life=RECENCY_HALF_LIFE, velocity_half_life=VELOCITY_HALF_LIFE),
+        'overall': [entry(row) for row in overall],
+        'categories': {
+            category: [entry(row) for row in rows]
+            for category, rows in top_by_category([t['category'] for t in data], scores, top).items()
+        },
+    }
+    return rankings, scores, rescored
+
+def load_scores(path=STATE_FILE):
+    """id -> score from the last ranking run, or None if there has not been one"""
+    state = RankingState(path)
+    return dict(zip(state.ids.tolist(), state.columns['score'].tolist())) or None
+
+def run(data_file=DATA_FILE, top=TOP_N, apply_ratings=False, out=None):
+    """Rank the catalog and write the rankings file next to it; returns id -> score"""
+    data_dir = pathlib.Path(data_file).parent
+    out = out or data_dir / RANKINGS_FILE.name
+    data = load_catalog(data_file)
+    state = RankingState(data_dir / ".cache" / STATE_FILE.name)
+    start = time.perf_counter()
+    rankings, scores, rescored = rank_catalog(data, state, top)
+    elapsed = time.perf_counter() - start
+    with open(out, 'w') as f:
+        json.dump(rankings, f, indent=2)
+    state.save()
+    print(f"🏆 Ranked {len(data):,} tools in {elapsed * 1000:.1f} ms ({rescored:,} rescored) → {out}")
+
+    if apply_ratings:
+        for tool, rating in zip(data, score_ratings(scores)):
+            tool['rating'] = rating
+        save_catalog(data, data_file)
+        print("⭐ Ratings updated from scores")
+    return dict(zip(state.ids.tolist(), scores.tolist()))
+
+# -------- Benchmark -----------------------------------------------------------
+def benchmark(n):
+    rng = np.random.default_rng(0)
+    ids = np.arange(n, dtype=np.int64)
+    columns = {
+        'stars': np.floor(rng.pareto(1.2, n) * 50),
+        'forks': np.floor(rng.pareto(1.4, n) * 8),
+        'contributors': rng.integers(0, 30, n).astype(np.float64),
+        'updated': rng.integers(1500, 2200, n).astype(np.float64),
+    }
+    categories = rng.choice(['database', 'automation', 'cloud', 'security', 'utilities'], n).tolist()
+    state = RankingState(path=None)
+
+    start = time.perf_counter()
+    scores, _ = state.update(ids, columns, '2026-01-01')
+    full = time.perf_counter()
+    columns = dict(columns, stars=columns['stars'].copy())
+    touched = rng.choice(n, n // 100, replace=False)
+    columns['stars'][touched] += 5
+    # Same day, so only the touched rows are rescored (a later day also moves recency)
+    state.update(ids, columns, '2026-01-01')
+    incremental = time.perf_counter()
+    top_by_category(categories, scores.tolist())
+    done = time.perf_counter()
+    print(f"📊 {n:,} tools")
+    print(f"   • full scoring:         {(full - start) * 1000:7.1f} ms")
+    print(f"   • 1% changed, rescored: {(incremental - full) * 1000:7.1f} ms")
+    print(f"   • top {TOP_N} per category:   {(done - incremental) * 1000:7.1f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description="Composite popularity ranking")
+    parser.add_argument('--data', default=str(DATA_FILE))
+    parser.add_argument('--top', type=int, default=TOP_N)
+    parser.add_argument('--apply-ratings', action='store_true', help="Replace ratings with score percentiles")
+    parser.add_argument('--bench', type=int, metavar='N', help="Time scoring N synthetic tools instead")
+    args = parser.parse_args()
+    if args.bench:
+        benchmark(args.bench)
+    else:
+        run(args.data, args.top, args.apply_ratings)
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n\n⏹️  Operation cancelled by user")
+        sys.exit(1)
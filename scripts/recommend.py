@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Related Tools Recommender
+Builds sparse TF-IDF vectors for every tool over its tags, topics, language
+and name/description words, and writes the top-k most similar tools per tool
+(cosine similarity) to data/related-tools.json for the page payloads.
+
+Similarities come from sparse matrix products over blocks of rows, and the
+per-row top-k is picked with one sort per block, so a rebuild costs about
+as much as the catalog's term overlap, not a Python loop over tool pairs.
+
+    python recommend.py                # rebuild data/related-tools.json
+    python recommend.py --k 10
+    python recommend.py --bench 100000 # time a rebuild on a synthetic catalog
+"""
+
+import re
+import sys
+import json
+import time
+import argparse
+from array import array
+
+import numpy as np
+from scipy import sparse
+
+from catalog import DATA_FILE
+
+NEIGHBOURS_FILE = DATA_FILE.parent / "related-tools.json"
+DEFAULT_K = 6
+BLOCK_ROWS = 2048
+
+# Terms in more than this share of tools (or more than MAX_DF_COUNT tools)
+# say little about similarity ("api", boilerplate description phrases) but
+# dominate the cost, since every pair of tools sharing a term is a candidate
+MAX_DF = 0.2
+MAX_DF_COUNT = 1000
+
+# Weight of one occurrence per source field
+WEIGHTS = {'tag': 3.0, 'lang': 1.0, 'name': 2.0, 'desc': 1.0}
+
+WORD_RE = re.compile(r'[a-z][a-z0-9]+')
+STOPWORDS = frozenset("""
+    a an and are as at be by for from in into is it its of on or the to via with your
+    mcp server servers model context protocol
+""".split())
+
+# -------- Vectors -------------------------------------------------------------
+def tool_terms(tool):
+    """(term, weight) pairs for one tool; terms are prefixed with their field"""
+    terms = []
+    for tag in dict.fromkeys(tool.get('tags', []) + tool.get('topics', [])):
+        terms.append(('t:' + tag, WEIGHTS['tag']))
+    language = tool.get('language')
+    if language and language != 'unknown':
+        terms.append(('l:' + language, WEIGHTS['lang']))
+    for word in WORD_RE.findall(tool.get('name', '').lower()):
+        if word not in STOPWORDS:
+            terms.append(('w:' + word, WEIGHTS['name']))
+    for word in WORD_RE.findall(tool.get('description', '').lower()):
+        if word not in STOPWORDS:
+            terms.append(('w:' + word, WEIGHTS['desc']))
+    return terms
+
+def build_matrix(data, max_df=MAX_DF):
+    """L2-normalized TF-IDF rows (CSR, float32), one per tool in catalog order"""
+    vocabulary = {}
+    indptr = array('q', [0])
+    indices = array('i')
+    values = array('f')
+    for tool in data:
+        for term, weight in tool_terms(tool):
+            indices.append(vocabulary.setdefault(term, len(vocabulary)))
+            values.append(weight)
+        indptr.append(len(indices))
+
+    n = len(data)
+    matrix = sparse.csr_matrix(
+        (np.frombuffer(values, dtype=np.float32), np.frombuffer(indices, dtype=np.int32),
+         np.frombuffer(indptr, dtype=np.int64)),
+        shape=(n, max(len(vocabulary), 1)),
+    )
+    matrix.sum_duplicates()
+
+    # Document frequency, then drop terms that are unique or near-universal
+    df = np.bincount(matrix.indices, minlength=matrix.shape[1])
+    useful = (df >= 2) & (df <= max(min(max_df * n, MAX_DF_COUNT), 2))
+    matrix.data *= useful[matrix.indices]
+    matrix.eliminate_zeros()
+
+    # Sublinear tf, smoothed idf, unit rows
+    matrix.data = np.log1p(matrix.data)
+    idf = (np.log((1 + n) / (1 + df)) + 1).astype(np.float32)
+    matrix.data *= idf[matrix.indices]
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1
+    matrix.data /= np.repeat(norms, np.diff(matrix.indptr)).astype(np.float32)
+    return matrix
+
+# -------- Neighbours ----------------------------------------------------------
+def top_k(matrix, k=DEFAULT_K, block_rows=BLOCK_ROWS):
+    """(neighbour row indices, scores), each shaped (n, k); missing slots are -1 / 0"""
+    n = matrix.shape[0]
+    neighbours = np.full((n, k), -1, dtype=np.int64)
+    scores = np.zeros((n, k), dtype=np.float32)
+    transposed = matrix.T.tocsr()
+
+    for start in range(0, n, block_rows):
+        block = (matrix[start:start + block_rows] @ transposed).tocsr()
+        block.sort_indices()
+        rows = np.repeat(np.arange(block.shape[0]), np.diff(block.indptr))
+        cols, vals = block.indices, block.data
+        keep = (cols != rows + start) & (vals > 0)
+        rows, cols, vals = rows[keep], cols[keep], vals[keep]
+
+        # By row, best score first (scores are in (0, 1]); the stable sort
+        # leaves ties in column order, i.e. the earlier (higher-starred) tool first
+        order = np.argsort(rows + (1.0 - vals.astype(np.float64)) * 0.5, kind='stable')
+        rows, cols, vals = rows[order], cols[order], vals[order]
+        rank = np.arange(len(rows)) - np.searchsorted(rows, rows)
+        top = rank < k
+        neighbours[rows[top] + start, rank[top]] = cols[top]
+        scores[rows[top] + start, rank[top]] = vals[top]
+    return neighbours, scores
+
+def compute_neighbours(data, k=DEFAULT_K, max_df=MAX_DF):
+    """{id: [[neighbour id, score], ...]} with the best match first"""
+    neighbours, scores = top_k(build_matrix(data, max_df), k)
+    ids = np.array([tool['id'] for tool in data])
+    result = {}
+    for tool_id, row, row_scores in zip(ids.tolist(), neighbours, scores):
+        found = row >= 0
+        result[tool_id] = [[int(i), round(float(s), 4)]
+                           for i, s in zip(ids[row[found]].tolist(), row_scores[found].tolist())]
+    return result
+
+def related_ids(data, neighbours, k=DEFAULT_K):
+    """id -> k related ids: nearest neighbours first, topped up from the same category"""
+    from pages import related_by_category
+    fallback = related_by_category(data, k)
+    related = {}
+    for tool in data:
+        ids = [i for i, _ in neighbours.get(str(tool['id']), neighbours.get(tool['id'], []))]
+        for i in fallback[tool['id']]:
+            if len(ids) >= k:
+                break
+            if i not in ids:
+                ids.append(i)
+        related[tool['id']] = ids[:k]
+    return related
+
+# -------- Files ---------------------------------------------------------------
+def save_neighbours(neighbours, k, path=NEIGHBOURS_FILE):
+    with open(path, 'w') as f:
+        json.dump({'k': k, 'generated_at': time.strftime("%Y-%m-%d %H:%M:%S"),
+                   'neighbours': neighbours}, f, separators=(',', ':'))
+
+def load_neighbours(path=NEIGHBOURS_FILE):
+    """{id (str): [[id, score], ...]} from the neighbours file, or None if it has not been built"""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)['neighbours']
+    except FileNotFoundError:
+        return None
+
+def rebuild(data_file=DATA_FILE, k=DEFAULT_K, path=None):
+    """Recompute neighbours for the catalog and write the neighbours file"""
+    path = path or NEIGHBOURS_FILE
+    with open(data_file, 'r') as f:
+        data = json.load(f)
+    start = time.perf_counter()
+    neighbours = compute_neighbours(data, k)
+    save_neighbours(neighbours, k, path)
+    matched = sum(1 for v in neighbours.values() if v)
+    print(f"🧭 Neighbours for {len(data):,} tools in {time.perf_counter() - start:.2f} s "
+          f"({matched:,} with matches) → {path}")
+    return neighbours
+
+# -------- Benchmark -----------------------------------------------------------
+def synthetic_catalog(base, n, seed=0):
+    """``n`` fake tools whose tag and word vocabularies grow with ``n``.
+
+    Terms are drawn Zipf-style (a few very common, a long tail of rare ones)
+    from the real catalog's tags and words plus generated ones, which is how
+    a larger real catalog's vocabulary behaves.
+    """
+    rng = np.random.default_rng(seed)
+    tags = sorted({t for tool in base for t in tool.get('tags', [])}) + [f"tag{j}" for j in range(n // 10)]
+    words = sorted({w for tool in base for w in WORD_RE.findall((tool['name'] + ' ' + tool['description']).lower())})
+    words += [f"word{j}" for j in range(n // 2)]
+    languages = sorted({tool.get('language', 'unknown') for tool in base})
+
+    def zipf(size, count):
+        return np.minimum(rng.zipf(1.3, count) - 1, size - 1)
+
+    out = []
+    tag_picks, word_picks = zipf(len(tags), (n, 4)), zipf(len(words), (n, 14))
+    for i in range(n):
+        w = word_picks[i]
+        out.append({
+            'id': i,
+            'name': f"{words[w[0]]} {words[w[1]]}",
+            'category': base[i % len(base)]['category'],
+            'language': languages[rng.integers(0, len(languages))],
+            'description': ' '.join(words[j] for j in w[2:]),
+            'tags': list(dict.fromkeys(tags[j] for j in tag_picks[i])),
+        })
+    return out
+
+def benchmark(n, k=DEFAULT_K, data_file=DATA_FILE):
+    with open(data_file, 'r') as f:
+        base = json.load(f)
+    data = synthetic_catalog(base, n)
+    start = time.perf_counter()
+    matrix = build_matrix(data)
+    built = time.perf_counter()
+    top_k(matrix, k)
+    done = time.perf_counter()
+    print(f"📊 {n:,} tools, {matrix.shape[1]:,} terms, {matrix.nnz:,} non-zeros")
+    print(f"   • vectors:    {built - start:6.2f} s")
+    print(f"   • neighbours: {done - built:6.2f} s")
+    print(f"   • total:      {done - start:6.2f} s")
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute related tools with TF-IDF similarity")
+    parser.add_argument('--data', default=str(DATA_FILE))
+    parser.add_argument('--out', default=str(NEIGHBOURS_FILE))
+    parser.add_argument('--k', type=int, default=DEFAULT_K)
+    parser.add_argument('--bench', type=int, metavar='N', help="Time a rebuild on N synthetic tools instead")
+    args = parser.parse_args()
+    if args.bench:
+        benchmark(args.bench, args.k, args.data)
+    else:
+        rebuild(args.data, args.k, args.out)
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n\n⏹️  Operation cancelled by user")
+        sys.exit(1)
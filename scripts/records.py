@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Compact Tool Records
+A ``__slots__`` record layer for the Python pipeline. Compared with the dicts
+json.load produces, records drop the per-entry dict, share one copy of every
+category, language, tag and login string (sys.intern), and keep contributors
+as (login, contributions) with the github.com URLs derived on encode instead
+of stored three times per contributor. Encoding gives back exactly the JSON
+shape the site reads.
+
+    python records.py --bench        # memory: dicts vs records for the catalog
+    python records.py --bench 100000 # same, scaled up to N entries
+"""
+
+import sys
+import json
+import time
+import tracemalloc
+from sys import intern
+
+from catalog import DATA_FILE
+
+# Marks optional fields the source entry did not have, so they are not written back
+ABSENT = object()
+
+def _owner_avatar(login):
+    return f"https://github.com/{login}.png?size=60"
+
+def _owner_url(login):
+    return f"https://github.com/{login}"
+
+class Contributor:
+    """One contributor; avatar_url is only stored when it is not the derived default"""
+
+    __slots__ = ('login', 'contributions', '_avatar')
+
+    def __init__(self, login, contributions=0, avatar_url=None):
+        self.login = intern(login)
+        self.contributions = contributions
+        self._avatar = None if avatar_url in (None, _owner_avatar(login)) else avatar_url
+
+    @property
+    def avatar_url(self):
+        return self._avatar or _owner_avatar(self.login)
+
+    @property
+    def html_url(self):
+        return _owner_url(self.login)
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(d['login'], d.get('contributions', 0), d.get('avatar_url'))
+
+    def to_dict(self):
+        return {
+            'login': self.login,
+            'avatar_url': self.avatar_url,
+            'html_url': self.html_url,
+            'contributions': self.contributions,
+        }
+
+class Tool:
+    """One catalog entry. Field names match the JSON keys."""
+
+    # Always written, in this order
+    REQUIRED = ('id', 'name', 'category', 'language', 'description', 'tags',
+                'githubUrl', 'rating', 'stars', 'lastUpdated')
+    # Written only when present in the source entry
+    OPTIONAL = ('contributors', 'forks', 'watchers', 'topics', 'license', 'scraped_at', 'dead')
+
+    __slots__ = REQUIRED + OPTIONAL + ('extra',)
+
+    @classmethod
+    def from_dict(cls, d):
+        tool = cls.__new__(cls)
+        tool.id = d['id']
+        tool.name = d['name']
+        tool.category = intern(d['category'])
+        tool.language = intern(d.get('language', 'unknown'))
+        tool.description = d.get('description', '')
+        tool.tags = tuple(intern(t) for t in d.get('tags', ()))
+        tool.githubUrl = d['githubUrl']
+        tool.rating = intern(d.get('rating', '4.0'))
+        tool.stars = d.get('stars', 0)
+        tool.lastUpdated = intern(d.get('lastUpdated', ''))
+
+        contributors = d.get('contributors', ABSENT)
+        tool.contributors = contributors if contributors is ABSENT else tuple(
+            Contributor.from_dict(c) for c in contributors
+        )
+        tool.forks = d.get('forks', ABSENT)
+        tool.watchers = d.get('watchers', ABSENT)
+        topics = d.get('topics', ABSENT)
+        tool.topics = topics if topics is ABSENT else tuple(intern(t) for t in topics)
+        tool.license = d.get('license', ABSENT)
+        tool.scraped_at = d.get('scraped_at', ABSENT)
+        tool.dead = d.get('dead', ABSENT)
+
+        # Keys outside the schema, kept in their original order
+        extra = d.keys() - _KNOWN
+        tool.extra = {k: v for k, v in d.items() if k in extra} if extra else None
+        return tool
+
+    def to_dict(self):
+        d = {
+            'id': self.id,
+            'name': self.name,
+            'category': self.category,
+            'language': self.language,
+            'description': self.description,
+            'tags': list(self.tags),
+            'githubUrl': self.githubUrl,
+            'rating': self.rating,
+            'stars': self.stars,
+            'lastUpdated': self.lastUpdated,
+        }
+        for key in self.OPTIONAL:
+            value = getattr(self, key)
+            if value is ABSENT:
+                continue
+            if key == 'contributors':
+                value = [c.to_dict() for c in value]
+            elif key == 'topics':
+                value = list(value)
+            d[key] = value
+        if self.extra:
+            d.update(self.extra)
+        return d
+
+    @property
+    def owner(self):
+        return self.githubUrl.rstrip('/').split('/')[3] if self.githubUrl.count('/') >= 3 else ''
+
+    def __repr__(self):
+        return f"Tool(id={self.id!r}, name={self.name!r}, stars={self.stars!r})"
+
+_KNOWN = frozenset(Tool.REQUIRED + Tool.OPTIONAL)
+
+def decode(data):
+    """JSON-shaped dicts → Tool records"""
+    return [Tool.from_dict(d) for d in data]
+
+def encode(tools):
+    """Tool records → JSON-shaped dicts (same shape save_catalog writes)"""
+    return [t.to_dict() for t in tools]
+
+def load_records(path=DATA_FILE):
+    from catalog import load_catalog
+    return decode(load_catalog(path))
+
+def save_records(tools, path=DATA_FILE):
+    from catalog import save_catalog
+    return save_catalog(encode(tools), path)
+
+# -------- Memory benchmark ----------------------------------------------------
+def _measure(build):
+    """Time ``build`` untraced, then build again under tracemalloc for its size"""
+    start = time.perf_counter()
+    build()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    obj = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, size, elapsed
+
+def benchmark(n=None, path=DATA_FILE):
+    """Compare traced memory of json.load dicts against Tool records"""
+    with open(path, 'r') as f:
+        base = json.load(f)
+    if n and n > len(base):
+        base = [dict(t, id=i) for i, t in enumerate(base[i % len(base)] for i in range(n))]
+    text = json.dumps(base)
+    del base
+
+    dicts, dict_bytes, dict_time = _measure(lambda: json.loads(text))
+    tools, tool_bytes, tool_time = _measure(lambda: decode(json.loads(text)))
+    roundtrip = encode(tools) == dicts
+
+    print(f"📊 {len(dicts):,} entries")
+    print(f"   • dicts:   {dict_bytes / 1e6:8.1f} MB  ({dict_time:.2f} s to load)")
+    print(f"   • records: {tool_bytes / 1e6:8.1f} MB  ({tool_time:.2f} s to load + decode)")
+    print(f"   • saving:  {1 - tool_bytes / dict_bytes:.0%}, round trip {'exact' if roundtrip else 'DIFFERS'}")
+    return dict_bytes, tool_bytes
+
+if __name__ == "__main__":
+    if '--bench' in sys.argv:
+        rest = [a for a in sys.argv[1:] if a != '--bench']
+        benchmark(int(rest[0]) if rest else None)
+    else:
+        print(__doc__.strip())
@@ -1,15 +1,14 @@
 #!/usr/bin/env python3
-import json
 import sys
 import os
+from catalog import DATA_FILE, load_catalog, save_catalog, sort_by_stars
+from snapshots import snapshot_file
 
-def remove_duplicates():
+def remove_duplicates(data_file=DATA_FILE):
     """Remove duplicate entries from MCP data based on analysis"""
     
     # Read the current data
-    data_file = '../data/mcp-data.json'
-    with open(data_file, 'r') as f:
-        data = json.load(f)
+    data = load_catalog(data_file)
     
     print(f"📊 Original dataset: {len(data)} entries")
     
@@ -44,17 +43,14 @@ def remove_duplicates():
         print(f"  • ID {entry['id']}: {entry['name']} ({entry['githubUrl']})")
     
     # Sort by stars (descending) to maintain consistency
-    filtered_data.sort(key=lambda x: x.get('stars', 0), reverse=True)
+    sort_by_stars(filtered_data)
     
-    # Create backup of original data
-    backup_file = f'{data_file}.backup'
-    with open(backup_file, 'w') as f:
-        json.dump(data, f, indent=2)
-    print(f"\n💾 Created backup: {backup_file}")
+    # Keep the original data as a snapshot (restore with snapshots.py)
+    snapshot = snapshot_file(data_file, 'before remove-duplicates')
+    print(f"\n💾 Original kept as snapshot {snapshot}")
     
     # Save the cleaned data
-    with open(data_file, 'w') as f:
-        json.dump(filtered_data, f, indent=2)
+    save_catalog(filtered_data, data_file)
     
     print(f"✨ Cleaned data saved to: {data_file}")
     
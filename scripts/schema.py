@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""
+Catalog Schema
+Validates and normalizes catalog entries to the shape lib/types.ts expects, so
+every write stores the same types and downstream code never re-parses them:
+
+  • rating       canonical one-decimal string, clamped to 0-5 ("4" → "4.0")
+  • lastUpdated  date only, YYYY-MM-DD (ISO datetimes from scrapes are cut)
+  • language     lowercase, 'unknown' when empty
+  • tags         lowercase, de-duplicated in order, at most 6
+  • counters     non-negative ints ("1,234" → 1234)
+
+Each field's coercer comes from the SCHEMA table below. The validator is
+specialized once per key layout: an entry whose keys are already in written
+order and whose values pass each field's cheap "already clean" check (the
+usual case when a scraper saves its checkpoints) is returned as it is, and
+only the others go through the coercers. Normalized entries may therefore
+share objects with the input.
+
+    python schema.py            # check mcp-data.json and report problems
+    python schema.py --fix      # normalize it in place
+"""
+
+import re
+import sys
+from itertools import chain, repeat
+from operator import itemgetter
+
+MAX_TAGS = 6
+MISSING = object()
+
+class ValidationError(ValueError):
+    """A catalog entry that cannot be coerced to the schema"""
+
+    def __init__(self, record_id, field, message):
+        super().__init__(f"Entry {record_id}: {field}: {message}")
+        self.record_id = record_id
+        self.field = field
+
+# -------- Coercers ------------------------------------------------------------
+# Each takes a value that is present and returns the normalized value or raises
+# ValueError/TypeError; validate_record wraps errors with the field name.
+# Values that are already clean are returned as they are, not copied.
+
+_DATE_RE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+_NUMBER_RE = re.compile(r'^\s*[\d,]+\s*$')
+
+def to_int(v):
+    if type(v) is int:
+        return v if v >= 0 else 0
+    if isinstance(v, float):
+        return max(int(v), 0)
+    if isinstance(v, str) and _NUMBER_RE.match(v):
+        return int(v.replace(',', ''))
+    raise ValueError(f"expected a count, got {v!r}")
+
+def to_str(v):
+    if type(v) is str:
+        return v.strip()
+    if v is None:
+        return ''
+    raise TypeError(f"expected a string, got {type(v).__name__}")
+
+def to_required_str(v):
+    v = to_str(v)
+    if not v:
+        raise ValueError("must not be empty")
+    return v
+
+def to_lower(v):
+    return to_str(v).lower()
+
+def to_language(v):
+    return to_lower(v) or 'unknown'
+
+def to_rating(v):
+    rating = float(v)
+    return f"{min(max(rating, 0.0), 5.0):.1f}"
+
+def to_date(v):
+    if v in (None, ''):
+        return ''
+    m = _DATE_RE.match(to_str(v))
+    if not m:
+        raise ValueError(f"expected a date, got {v!r}")
+    return m.group(1)
+
+def _only(values, *types):
+    return set(map(type, values)) <= set(types)
+
+def _items_clean(items):
+    """Every item a non-empty, stripped, lowercase string"""
+    if '' in items or not _only(items, str):
+        return False
+    return list(map(str.strip, items)) == items and _lowercase(items)
+
+def _lowercase(items):
+    # lower() works per character, so the joined items are unchanged only if each one is
+    joined = '\n'.join(items)
+    return joined == joined.lower()
+
+def tags_clean(v):
+    return type(v) is list and len(v) <= MAX_TAGS and _items_clean(v) and len(set(v)) == len(v)
+
+def to_tags(v):
+    if not isinstance(v, list):
+        raise TypeError(f"expected a list, got {type(v).__name__}")
+    if tags_clean(v):
+        return v
+    tags = []
+    for tag in v:
+        if type(tag) is not str:
+            raise TypeError(f"expected string tags, got {type(tag).__name__}")
+        tag = tag.strip().lower()
+        if tag and tag not in tags:
+            tags.append(tag)
+    return tags[:MAX_TAGS]
+
+def str_list_clean(v):
+    return type(v) is list and _items_clean(v)
+
+def to_str_list(v):
+    if not isinstance(v, list):
+        raise TypeError(f"expected a list, got {type(v).__name__}")
+    if str_list_clean(v):
+        return v
+    return [to_lower(item) for item in v if item]
+
+def to_github_url(v):
+    url = to_required_str(v).rstrip('/')
+    return url[:-4] if url.endswith('.git') else url
+
+def contributor_clean(c):
+    return (type(c) is dict and len(c) == 4 and type(c.get('login')) is str and type(c.get('avatar_url')) is str
+            and type(c.get('html_url')) is str and type(c.get('contributions')) is int)
+
+def contributors_clean(v):
+    return type(v) is list and all(map(contributor_clean, v))
+
+def to_contributors(v):
+    if v is None:
+        return []
+    if not isinstance(v, list):
+        raise TypeError(f"expected a list, got {type(v).__name__}")
+    if contributors_clean(v):
+        return v
+    out = []
+    for c in v:
+        if contributor_clean(c):
+            out.append(c)
+            continue
+        if not isinstance(c, dict) or not c.get('login'):
+            raise ValueError(f"contributor without login: {c!r}")
+        login = to_required_str(c['login'])
+        out.append({
+            'login': login,
+            'avatar_url': to_str(c.get('avatar_url')) or f"https://github.com/{login}.png?size=60",
+            'html_url': to_str(c.get('html_url')) or f"https://github.com/{login}",
+            'contributions': to_int(c.get('contributions') or 0),
+        })
+    return out
+
+def to_optional_str(v):
+    return None if v is None else to_str(v)
+
+def to_bool(v):
+    return bool(v)
+
+# -------- Clean checks --------------------------------------------------------
+# coercer -> test for a value the coercer would return unchanged
+DATE_OK = re.compile(r'\d{4}-\d{2}-\d{2}').fullmatch
+RATING_OK = re.compile(r'[0-4]\.\d|5\.0').fullmatch
+
+CLEAN = {
+    to_int: lambda v: type(v) is int and v >= 0,
+    to_str: lambda v: type(v) is str and v == v.strip(),
+    to_required_str: lambda v: type(v) is str and v != '' and v == v.strip(),
+    to_lower: lambda v: type(v) is str and v == v.strip().lower(),
+    to_language: lambda v: type(v) is str and v != '' and v == v.strip().lower(),
+    to_rating: lambda v: type(v) is str and RATING_OK(v) is not None,
+    to_date: lambda v: type(v) is str and (v == '' or DATE_OK(v) is not None),
+    to_tags: tags_clean,
+    to_str_list: str_list_clean,
+    to_github_url: lambda v: (type(v) is str and v != '' and v == v.strip()
+                              and v[-1] != '/' and not v.endswith('.git')),
+    to_contributors: contributors_clean,
+    to_optional_str: lambda v: v is None or (type(v) is str and v == v.strip()),
+    to_bool: lambda v: type(v) is bool,
+}
+
+# -------- Column checks -------------------------------------------------------
+# coercer -> test that a whole column (one field of every entry sharing a key
+# layout) is clean. They run map/set over the column so the per-value work
+# stays in C; a column that fails is re-checked value by value with CLEAN.
+
+def _stripped(col):
+    return _only(col, str) and list(map(str.strip, col)) == col
+
+def _lowered(col):
+    return _stripped(col) and _lowercase(col)
+
+def _counts(col):
+    return _only(col, int) and min(col, default=0) >= 0
+
+def _tags_column(col):
+    if not _only(col, list) or max(map(len, col), default=0) > MAX_TAGS:
+        return False
+    tags = list(chain.from_iterable(col))
+    return _items_clean(tags) and sum(map(len, map(set, col))) == len(tags)
+
+def _str_list_column(col):
+    return _only(col, list) and _items_clean(list(chain.from_iterable(col)))
+
+def _contributors_column(col):
+    if not _only(col, list):
+        return False
+    people = list(chain.from_iterable(col))
+    if not _only(people, dict) or not set(map(len, people)) <= {4}:
+        return False
+    try:
+        return all(_only(map(itemgetter(key), people), kind) for key, kind in
+                   (('login', str), ('avatar_url', str), ('html_url', str), ('contributions', int)))
+    except KeyError:
+        return False
+
+COLUMN_CLEAN = {
+    to_int: _counts,
+    to_str: _stripped,
+    to_required_str: lambda col: _stripped(col) and '' not in col,
+    to_lower: _lowered,
+    to_language: lambda col: _lowered(col) and '' not in col,
+    to_rating: lambda col: _only(col, str) and all(map(RATING_OK, col)),
+    to_date: lambda col: _only(col, str) and all(map(DATE_OK, filter(None, col))),
+    to_tags: _tags_column,
+    to_str_list: _str_list_column,
+    to_github_url: lambda col: (_stripped(col) and '' not in col
+                                and not any(map(str.endswith, col, repeat(('/', '.git'))))),
+    to_contributors: _contributors_column,
+    to_optional_str: lambda col: _stripped([v for v in col if v is not None]),
+    to_bool: lambda col: _only(col, bool),
+}
+
+# unknown fields are kept as they are
+_ANYTHING = (lambda v: True, lambda col: True)
+
+# -------- Schema --------------------------------------------------------------
+# (field, coercer, required, default when missing) in the order fields are
+# written; fields with default MISSING are left out when absent.
+SCHEMA = [
+    ('id', to_int, True, MISSING),
+    ('name', to_required_str, True, MISSING),
+    ('category', to_lower, True, MISSING),
+    ('language', to_language, False, 'unknown'),
+    ('description', to_str, False, ''),
+    ('tags', to_tags, False, []),
+    ('githubUrl', to_github_url, True, MISSING),
+    ('rating', to_rating, False, '4.0'),
+    ('stars', to_int, False, 0),
+    ('lastUpdated', to_date, False, ''),
+    ('contributors', to_contributors, False, MISSING),
+    ('forks', to_int, False, MISSING),
+    ('watchers', to_int, False, MISSING),
+    ('topics', to_str_list, False, MISSING),
+    ('license', to_optional_str, False, MISSING),
+    ('scraped_at', to_optional_str, False, MISSING),
+    ('dead', to_bool, False, MISSING),
+]
+
+KNOWN_FIELDS = frozenset(field for field, _, _, _ in SCHEMA)
+
+def specialize(keys, schema=SCHEMA):
+    """(value check, column check) per key of an entry, or () if such an entry always needs rewriting.
+
+    An entry can be returned as it is only when its keys are already in
+    written order (schema fields, then unknown ones) with nothing to default.
+    """
+    present = set(keys)
+    written = [field for field, _, required, default in schema
+               if field in present or required or default is not MISSING]
+    written += [k for k in keys if k not in KNOWN_FIELDS]
+    if list(keys) != written:
+        return ()
+    coercers = {field: coercer for field, coercer, _, _ in schema}
+    return tuple((CLEAN[coercers[k]], COLUMN_CLEAN[coercers[k]]) if k in coercers else _ANYTHING
+                 for k in keys)
+
+# key layout -> checks; catalogs have only a handful of layouts
+_SPECIALIZED = {}
+
+def _checks(keys):
+    checks = _SPECIALIZED.get(keys)
+    if checks is None:
+        checks = _SPECIALIZED[keys] = specialize(keys)
+    return checks
+
+def validate_record(rec):
+    """Normalized entry, or ``rec`` itself if it already is; raises ValidationError naming the bad field.
+
+    Fields outside the schema are kept as they are, after the known ones.
+    """
+    checks = _checks(tuple(rec))
+    if checks and all([clean(v) for (clean, _), v in zip(checks, rec.values())]):
+        return rec
+    return coerce_record(rec)
+
+def coerce_record(rec):
+    """Normalized copy of one entry, running every field through its coercer"""
+    out = {}
+    for field, coercer, required, default in SCHEMA:
+        v = rec.get(field, MISSING)
+        if v is MISSING:
+            if required:
+                raise ValidationError(rec.get('id', '?'), field, "is required")
+            if default is not MISSING:
+                out[field] = type(default)(default)
+            continue
+        try:
+            out[field] = coercer(v)
+        except (ValueError, TypeError) as e:
+            raise ValidationError(rec.get('id', '?'), field, str(e)) from None
+    for k, v in rec.items():
+        if k not in KNOWN_FIELDS:
+            out[k] = v
+    return out
+
+def _dirty_rows(data):
+    """Indexes of the entries that need rewriting, found a column at a time per key layout"""
+    layouts = {}
+    for i, keys in enumerate(map(tuple, data)):
+        layouts.setdefault(keys, []).append(i)
+    dirty = set()
+    for keys, rows in layouts.items():
+        checks = _checks(keys)
+        if not checks:
+            dirty.update(rows)
+            continue
+        group = [data[i] for i in rows]
+        for key, (clean, column_clean) in zip(keys, checks):
+            column = list(map(itemgetter(key), group))
+            if not column_clean(column):
+                dirty.update(i for i, v in zip(rows, column) if not clean(v))
+    return sorted(dirty)
+
+def normalize_catalog(data):
+    """Validate and normalize every entry; raises ValidationError on the first bad one.
+
+    Also rejects duplicate ids, since the site and changesets key on them.
+    """
+    out = list(data)
+    for i in _dirty_rows(data):
+        out[i] = coerce_record(data[i])
+    ids = list(map(itemgetter('id'), out))
+    if len(set(ids)) != len(ids):
+        seen = set()
+        for record_id in ids:
+            if record_id in seen:
+                raise ValidationError(record_id, 'id', "duplicate id")
+            seen.add(record_id)
+    return out
+
+def check_catalog(data):
+    """Collect every problem instead of stopping at the first"""
+    errors = []
+    for tool in data:
+        try:
+            validate_record(tool)
+        except ValidationError as e:
+            errors.append(e)
+    return errors
+
+if __name__ == "__main__":
+    from catalog import DATA_FILE, load_catalog, save_catalog
+
+    data = load_catalog(DATA_FILE)
+    errors = check_catalog(data)
+    for e in errors:
+        print(f"  ❌ {e}")
+    if errors:
+        print(f"\n{len(errors)} invalid entries")
+        sys.exit(1)
+    normalized = normalize_catalog(data)
+    changed = sum(1 for a, b in zip(data, normalized) if a != b)
+    print(f"✅ {len(data)} entries valid, {changed} would change when normalized")
+    if '--fix' in sys.argv and changed:
+        save_catalog(normalized, DATA_FILE)
+        print(f"💾 Normalized catalog saved to {DATA_FILE}")
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Sharded Refresh
+Splits the catalog refresh across several workers through a shared work queue.
+
+    python sharded-refresh.py enqueue            # start a refresh: shards from mcp-data.json
+    python sharded-refresh.py enqueue --resume   # add to the current refresh instead
+    python sharded-refresh.py work --worker-id a # run one worker (any machine)
+    python sharded-refresh.py local --workers 4  # enqueue + 4 worker processes here
+    python sharded-refresh.py status
+    python sharded-refresh.py merge              # apply results to mcp-data.json
+"""
+
+import os
+import sys
+import time
+import random
+import socket
+import argparse
+import multiprocessing
+
+from work_queue import WorkQueue
+from catalog import DATA_FILE, load_catalog, save_catalog, sort_by_stars, is_live, repo_record, merge_github_data
+from extraction import FIELDS
+
+QUEUE_FILE = DATA_FILE.parent / "refresh-queue.sqlite"
+
+HEADERS = {
+    'User-Agent': 'mcp-curator-scraper/1.0 (contact: admin@mcpcurator.com)',
+    'Accept-Language': 'en',
+}
+
+def fetch_repo(url):
+    """Fetch one repo page and build its scrape record (None on failure)"""
+    from partial_fetch import fetch_fields
+    try:
+        status, fields, _, _ = fetch_fields(url, FIELDS, headers=HEADERS, timeout=30)
+        if fields is None:
+            print(f"  ❌ {url}: HTTP {status}")
+            return None
+        return repo_record(url, fields)
+    except Exception as e:
+        print(f"  ❌ {url}: {e}")
+        return None
+
+def enqueue(queue, shard_size, resume=False):
+    """Queue the catalog's URLs as a new refresh, or into the current one with ``resume``"""
+    if not resume:
+        queue.start_refresh()
+    urls = [tool['githubUrl'] for tool in load_catalog() if is_live(tool)]
+    added = queue.enqueue(urls, shard_size)
+    print(f"📦 Refresh {queue.generation()}: queued {len(urls)} URLs, {added} new shards of up to {shard_size}")
+
+def work(queue_file, worker_id, delay=1.0, lease_seconds=300, fetch=fetch_repo):
+    """Lease shards until none are left, reporting results after each shard"""
+    queue = WorkQueue(queue_file, lease_seconds)
+    done = 0
+    try:
+        while True:
+            lease = queue.lease(worker_id)
+            if lease is None:
+                break
+            shard, urls = lease
+            print(f"[{worker_id}] 📦 Shard {shard} ({len(urls)} repos)")
+            results = []
+            for url in urls:
+                record = fetch(url)
+                if record:
+                    results.append(record)
+                # Keep the lease alive while working through a slow shard
+                if not queue.renew(shard, worker_id):
+                    break
+                time.sleep(delay + random.uniform(0, delay))
+            if not queue.complete(shard, worker_id, results):
+                # Another worker holds the shard now and will fetch all of it
+                print(f"[{worker_id}] ⚠️  Lost lease on {shard}, dropping {len(results)} results")
+                continue
+            done += 1
+            print(f"[{worker_id}] ✅ Shard {shard}: {len(results)}/{len(urls)} repos")
+    finally:
+        queue.close()
+    print(f"[{worker_id}] 🏁 No shards left after {done} shards")
+    return done
+
+def merge(queue):
+    """Apply all reported results to the catalog; safe to run repeatedly"""
+    results = queue.results()
+    data = merge_github_data(load_catalog(), results)
+    sort_by_stars(data)
+    save_catalog(data)
+    print(f"💾 Merged {len(results)} results into {DATA_FILE}")
+
+def status(queue):
+    counts = queue.progress()
+    print(f"📊 Refresh {counts['generation']}:")
+    for key in ['pending', 'leased', 'expired', 'done', 'results']:
+        print(f"   • {key:8} {counts.get(key, 0)}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Sharded catalog refresh")
+    parser.add_argument('--queue', default=str(QUEUE_FILE), help="SQLite queue file (shared between workers)")
+    parser.add_argument('--lease', type=int, default=300, help="Lease duration in seconds")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('enqueue')
+    p.add_argument('--shard-size', type=int, default=25)
+    p.add_argument('--resume', action='store_true', help="Add to the current refresh instead of starting one")
+
+    p = sub.add_parser('work')
+    p.add_argument('--worker-id', default=f"{socket.gethostname()}-{os.getpid()}")
+    p.add_argument('--delay', type=float, default=1.0)
+
+    p = sub.add_parser('local')
+    p.add_argument('--workers', type=int, default=4)
+    p.add_argument('--shard-size', type=int, default=25)
+    p.add_argument('--delay', type=float, default=1.0)
+    p.add_argument('--resume', action='store_true', help="Finish the current refresh instead of starting one")
+
+    sub.add_parser('merge')
+    sub.add_parser('status')
+
+    args = parser.parse_args()
+    queue = WorkQueue(args.queue, lease_seconds=args.lease)
+
+    if args.command == 'enqueue':
+        enqueue(queue, args.shard_size, args.resume)
+    elif args.command == 'work':
+        work(args.queue, args.worker_id, args.delay, args.lease)
+    elif args.command == 'local':
+        enqueue(queue, args.shard_size, args.resume)
+        workers = [
+            multiprocessing.Process(target=work, args=(args.queue, f"local-{n}", args.delay, args.lease))
+            for n in range(args.workers)
+        ]
+        for proc in workers:
+            proc.start()
+        for proc in workers:
+            proc.join()
+        status(queue)
+        merge(queue)
+    elif args.command == 'merge':
+        merge(queue)
+    elif args.command == 'status':
+        status(queue)
+    queue.close()
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n\n⏹️  Operation cancelled by user")
+        sys.exit(1)
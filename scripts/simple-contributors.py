@@ -4,27 +4,25 @@ Simple Contributors Script
 Adds repository owner as primary contributor for MCP tools
 """
 
-import json
 import sys
 import os
 from urllib.parse import urlparse
+from catalog import DATA_FILE
+from records import ABSENT, Contributor, load_records, save_records
 
-def add_owner_as_contributor():
+def add_owner_as_contributor(data_file=DATA_FILE):
     """
     Add repository owner as primary contributor for all MCP tools
     """
-    data_file = '../data/mcp-data.json'
-    
     # Read current data
-    with open(data_file, 'r') as f:
-        data = json.load(f)
+    data = load_records(data_file)
     
     print(f"📊 Processing {len(data)} MCP tools...")
     
     updated_count = 0
     
     for i, tool in enumerate(data, 1):
-        github_url = tool.get('githubUrl', '')
+        github_url = tool.githubUrl
         
         if not github_url:
             continue
@@ -39,31 +37,23 @@ def add_owner_as_contributor():
                 repo = path_parts[1]
                 
                 # Skip if contributors already exist
-                if tool.get('contributors') and len(tool.get('contributors', [])) > 0:
-                    print(f"[{i:3d}/{len(data)}] {tool['name'][:50]} - Already has contributors")
+                if tool.contributors is not ABSENT and len(tool.contributors) > 0:
+                    print(f"[{i:3d}/{len(data)}] {tool.name[:50]} - Already has contributors")
                     continue
                 
                 # Add owner as primary contributor
-                contributors = [{
-                    'login': owner,
-                    'avatar_url': f"https://github.com/{owner}.png?size=60",
-                    'html_url': f"https://github.com/{owner}",
-                    'contributions': 1
-                }]
-                
-                tool['contributors'] = contributors
+                tool.contributors = (Contributor(owner, contributions=1),)
                 updated_count += 1
                 
-                print(f"[{i:3d}/{len(data)}] {tool['name'][:50]} - Added {owner} as contributor")
+                print(f"[{i:3d}/{len(data)}] {tool.name[:50]} - Added {owner} as contributor")
             else:
-                print(f"[{i:3d}/{len(data)}] {tool['name'][:50]} - Invalid GitHub URL")
+                print(f"[{i:3d}/{len(data)}] {tool.name[:50]} - Invalid GitHub URL")
                 
         except Exception as e:
-            print(f"[{i:3d}/{len(data)}] {tool['name'][:50]} - Error: {e}")
+            print(f"[{i:3d}/{len(data)}] {tool.name[:50]} - Error: {e}")
     
     # Save the updated data
-    with open(data_file, 'w') as f:
-        json.dump(data, f, indent=2)
+    save_records(data, data_file)
     
     print(f"\n✨ Contributors update complete!")
     print(f"  ✅ Successfully updated: {updated_count} tools")
@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+"""
+Catalog Snapshots
+Every version of mcp-data.json, kept as content-addressed record chunks in one
+SQLite file. Each tool entry is stored once (zlib-compressed, keyed by its
+hash) no matter how many versions contain it, and a snapshot is a short list
+of group hashes, where a group is a run of consecutive records cut at
+content-defined boundaries. A version that changes a few tools therefore
+adds those records plus the groups around them, and hundreds of versions
+cost little more than one full copy.
+
+Diffs compare group hashes first and only open the groups that differ, so
+two snapshots of a large catalog diff in milliseconds. Restores rebuild the
+file byte for byte as save_catalog wrote it.
+
+save_catalog snapshots the catalog it is about to replace, once per run.
+
+    python snapshots.py take [FILE ...] [--label TEXT]   # snapshot files (default: mcp-data.json)
+    python snapshots.py list
+    python snapshots.py diff 12 15                        # or "diff 12" against the current file
+    python snapshots.py restore 12 [--out FILE]
+    python snapshots.py prune --keep 200                  # drop old snapshots, compact the store
+    python snapshots.py --bench 300                       # storage and diff timings for N versions
+"""
+
+import sys
+import json
+import time
+import zlib
+import random
+import struct
+import sqlite3
+import hashlib
+import pathlib
+import argparse
+import tempfile
+
+from catalog import DATA_FILE
+from changeset import diff_catalogs, summary
+
+STORE_FILE = DATA_FILE.parent / "snapshots.sqlite"
+
+# A group ends after a record whose hash has its first byte below this, so
+# groups average 256 / GROUP_CUT records and boundaries move with content,
+# not position: inserting a tool only changes the group it lands in
+GROUP_CUT = 21
+MAX_GROUP = 64
+
+# Records are a few hundred bytes of JSON with the same keys and URL
+# prefixes, which zlib alone barely shrinks; a preset dictionary sampled from
+# the first catalog stored (kept in the store) makes them about 4x smaller
+DICTIONARY_SIZE = 32 * 1024
+
+DIGEST_SIZE = 16
+ENTRY = struct.Struct(f'>{DIGEST_SIZE}sq')  # record hash, tool id
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    digest BLOB PRIMARY KEY,
+    body BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at TEXT NOT NULL,
+    label TEXT,
+    count INTEGER NOT NULL,
+    groups BLOB NOT NULL,
+    text_hash TEXT NOT NULL
+);
+"""
+
+def digest(body):
+    return hashlib.blake2b(body, digest_size=DIGEST_SIZE).digest()
+
+def encode_record(tool):
+    """Canonical bytes for one entry; key order is kept so restores match the file"""
+    return json.dumps(tool, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+def catalog_text(data):
+    """The file text save_catalog writes for ``data``"""
+    return json.dumps(data, indent=2)
+
+def text_hash(text):
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+def split_groups(entries):
+    """Cut (record hash, id) pairs into content-defined groups"""
+    groups, current = [], []
+    for entry in entries:
+        current.append(entry)
+        if entry[0][0] < GROUP_CUT or len(current) >= MAX_GROUP:
+            groups.append(current)
+            current = []
+    if current:
+        groups.append(current)
+    return groups
+
+class SnapshotStore:
+    """Snapshots of the catalog and the deduplicated records they share"""
+
+    def __init__(self, path=STORE_FILE):
+        self.path = str(path)
+        self.db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        self.db.executescript(SCHEMA)
+        self._groups = {}
+        row = self.db.execute("SELECT value FROM meta WHERE key = 'dictionary'").fetchone()
+        self.dictionary = row[0] if row else None
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @classmethod
+    def for_catalog(cls, data_file=DATA_FILE):
+        """The store kept next to ``data_file``"""
+        return cls(pathlib.Path(data_file).parent / STORE_FILE.name)
+
+    # -------- Writing ---------------------------------------------------------
+    def take(self, data, label=None, text=None):
+        """Store ``data`` as a new snapshot; returns its id, or the latest id if nothing changed"""
+        text_sha = text_hash(text if text is not None else catalog_text(data))
+        latest = self.db.execute('SELECT id, text_hash FROM snapshots ORDER BY id DESC LIMIT 1').fetchone()
+        if latest and latest[1] == text_sha:
+            return latest[0]
+
+        objects = {}
+        entries = []
+        for tool in data:
+            body = encode_record(tool)
+            key = digest(body)
+            objects[key] = body
+            entries.append((key, tool['id']))
+        group_keys = []
+        for group in split_groups(entries):
+            body = b''.join(ENTRY.pack(*entry) for entry in group)
+            key = digest(body)
+            objects[key] = body
+            group_keys.append(key)
+
+        self.db.execute('BEGIN IMMEDIATE')
+        if self.dictionary is None and entries:
+            # Sampled from the first non-empty catalog; an empty one has nothing to learn from
+            records = [objects[key] for key, _ in entries]
+            self.dictionary = b''.join(records[::max(len(records) // 256, 1)])[-DICTIONARY_SIZE:]
+            self.db.execute("INSERT INTO meta (key, value) VALUES ('dictionary', ?)", (self.dictionary,))
+        known = self._existing(list(objects))
+        self.db.executemany(
+            'INSERT INTO objects (digest, body) VALUES (?, ?)',
+            [(key, self._compress(body)) for key, body in objects.items() if key not in known]
+        )
+        cur = self.db.execute(
+            'INSERT INTO snapshots (created_at, label, count, groups, text_hash) VALUES (?, ?, ?, ?, ?)',
+            (time.strftime("%Y-%m-%d %H:%M:%S"), label, len(data), b''.join(group_keys), text_sha)
+        )
+        self.db.execute('COMMIT')
+        return cur.lastrowid
+
+    def _existing(self, keys, batch=500):
+        found = set()
+        for i in range(0, len(keys), batch):
+            chunk = keys[i:i + batch]
+            found.update(row[0] for row in self.db.execute(
+                f"SELECT digest FROM objects WHERE digest IN ({','.join('?' * len(chunk))})", chunk
+            ))
+        return found
+
+    def _compress(self, body):
+        compressor = zlib.compressobj(9, zdict=self.dictionary)
+        return compressor.compress(body) + compressor.flush()
+
+    # -------- Reading ---------------------------------------------------------
+    def _object(self, key):
+        row = self.db.execute('SELECT body FROM objects WHERE digest = ?', (key,)).fetchone()
+        if row is None:
+            raise KeyError(f"Snapshot store is missing object {key.hex()}")
+        decompressor = zlib.decompressobj(zdict=self.dictionary)
+        return decompressor.decompress(row[0]) + decompressor.flush()
+
+    def _group_keys(self, snapshot_id):
+        row = self.db.execute('SELECT groups FROM snapshots WHERE id = ?', (snapshot_id,)).fetchone()
+        if row is None:
+            raise KeyError(f"No snapshot {snapshot_id}")
+        return [row[0][i:i + DIGEST_SIZE] for i in range(0, len(row[0]), DIGEST_SIZE)]
+
+    def _group(self, key):
+        """[(record hash, id)] for one group; groups never change, so they are cached"""
+        if key not in self._groups:
+            body = self._object(key)
+            self._groups[key] = [ENTRY.unpack_from(body, i) for i in range(0, len(body), ENTRY.size)]
+        return self._groups[key]
+
+    def _records(self, keys):
+        return [json.loads(self._object(key)) for key in keys]
+
+    def snapshots(self):
+        """All snapshots as dicts, oldest first"""
+        rows = self.db.execute('SELECT id, created_at, label, count, length(groups) FROM snapshots ORDER BY id')
+        return [{'id': i, 'created_at': created, 'label': label, 'count': count, 'groups': size // DIGEST_SIZE}
+                for i, created, label, count, size in rows]
+
+    def load(self, snapshot_id):
+        """The tool list as it was in ``snapshot_id``"""
+        keys = [key for group in self._group_keys(snapshot_id) for key, _ in self._group(group)]
+        return self._records(keys)
+
+    def field_history(self, field):
+        """[(snapshot, {id: value of ``field``})] for every snapshot, oldest first.
+
+        Each distinct record is decompressed once, however many snapshots share it.
+        """
+        values, history = {}, []
+        for snapshot in self.snapshots():
+            column = {}
+            for group in self._group_keys(snapshot['id']):
+                for key, tool_id in self._group(group):
+                    if key not in values:
+                        values[key] = json.loads(self._object(key)).get(field)
+                    column[tool_id] = values[key]
+            history.append((snapshot, column))
+        return history
+
+    def restore(self, snapshot_id, path=DATA_FILE):
+        """Write ``snapshot_id`` back out to ``path``; returns False if the text differs from the original.
+
+        The file being replaced is snapshotted first, so a restore can be undone,
+        unless it is not valid JSON; restoring over a corrupted file still works.
+        """
+        text = catalog_text(self.load(snapshot_id))
+        path = pathlib.Path(path)
+        if path.exists():
+            current = path.read_text()
+            try:
+                replaced = json.loads(current)
+            except ValueError as e:
+                print(f"⚠️  {path.name} is not valid JSON ({e}); it is replaced without a snapshot", file=sys.stderr)
+            else:
+                self.take(replaced, f"before restoring {snapshot_id}", current)
+        path.write_text(text)
+        expected = self.db.execute('SELECT text_hash FROM snapshots WHERE id = ?', (snapshot_id,)).fetchone()[0]
+        return text_hash(text) == expected
+
+    # -------- Diffing ---------------------------------------------------------
+    def diff(self, old_id, new):
+        """Changeset (as in changeset.py) from snapshot ``old_id`` to snapshot id or tool list ``new``"""
+        old_groups = self._group_keys(old_id)
+        old_entries = [entry for group in old_groups for entry in self._group(group)]
+        tools = {}
+        if isinstance(new, int):
+            new_groups = self._group_keys(new)
+            new_entries = [entry for group in new_groups for entry in self._group(group)]
+            # Records in groups both sides share are unchanged; look only at the rest
+            shared = set(old_groups) & set(new_groups)
+            old_open = {entry for group in old_groups if group not in shared for entry in self._group(group)}
+            new_open = {entry for group in new_groups if group not in shared for entry in self._group(group)}
+        else:
+            new_entries = []
+            for tool in new:
+                key = digest(encode_record(tool))
+                tools[key] = tool
+                new_entries.append((key, tool['id']))
+            old_open, new_open = set(old_entries), set(new_entries)
+
+        removed, added = old_open - new_open, new_open - old_open
+        old_sub = self._records([entry[0] for entry in old_entries if entry in removed])
+        new_keys = [entry[0] for entry in new_entries if entry in added]
+        new_sub = [tools[key] for key in new_keys] if tools else self._records(new_keys)
+
+        changes = diff_catalogs(old_sub, new_sub)
+        old_ids = [i for _, i in old_entries]
+        new_ids = [i for _, i in new_entries]
+        old_set, new_set = set(old_ids), set(new_ids)
+        changes['count'] = len(new_entries)
+        changes['order_changed'] = [i for i in old_ids if i in new_set] != [i for i in new_ids if i in old_set]
+        return changes
+
+    # -------- Compaction ------------------------------------------------------
+    def prune(self, keep):
+        """Drop all but the newest ``keep`` snapshots, then compact; returns (snapshots, objects) removed"""
+        cur = self.db.execute(
+            'DELETE FROM snapshots WHERE id NOT IN (SELECT id FROM snapshots ORDER BY id DESC LIMIT ?)', (keep,)
+        )
+        return cur.rowcount, self.compact()
+
+    def compact(self):
+        """Delete objects no snapshot references and shrink the file; returns objects removed"""
+        live = set()
+        for (groups,) in self.db.execute('SELECT groups FROM snapshots'):
+            for i in range(0, len(groups), DIGEST_SIZE):
+                key = groups[i:i + DIGEST_SIZE]
+                if key not in live:
+                    live.add(key)
+                    live.update(record for record, _ in self._group(key))
+        dead = [key for (key,) in self.db.execute('SELECT digest FROM objects') if key not in live]
+        self.db.execute('BEGIN IMMEDIATE')
+        self.db.executemany('DELETE FROM objects WHERE digest = ?', [(key,) for key in dead])
+        self.db.execute('COMMIT')
+        self._groups = {key: group for key, group in self._groups.items() if key in live}
+        self.db.execute('VACUUM')
+        return len(dead)
+
+def snapshot_file(path, label=None, store_path=None):
+    """Snapshot the catalog file at ``path`` into the store next to it; returns the snapshot id"""
+    path = pathlib.Path(path)
+    text = path.read_text()
+    store = SnapshotStore(store_path) if store_path else SnapshotStore.for_catalog(path)
+    with store:
+        return store.take(json.loads(text), label or path.name, text)
+
+# -------- Benchmark -----------------------------------------------------------
+def benchmark(versions, data_file=DATA_FILE):
+    """Snapshot ``versions`` successive edits of the catalog into a scratch store and time diffs"""
+    with tempfile.TemporaryDirectory() as scratch:
+        _benchmark(max(versions, 2), data_file, pathlib.Path(scratch) / STORE_FILE.name)
+
+def _benchmark(versions, data_file, store_path):
+    with open(data_file, 'r') as f:
+        data = json.load(f)
+    size = len(catalog_text(data).encode('utf-8'))
+    rng = random.Random(0)
+    ids = []
+    with SnapshotStore(store_path) as store:
+        start = time.perf_counter()
+        for v in range(versions):
+            # A typical run: a few star refreshes, sometimes an addition or removal
+            for tool in rng.sample(data, 5):
+                tool['stars'] = tool.get('stars', 0) + rng.randint(1, 20)
+            if v % 10 == 3:
+                data.insert(rng.randrange(len(data)), dict(data[0], id=100000 + v, name=f"Tool {v}"))
+            if v % 10 == 7:
+                data.pop(rng.randrange(len(data)))
+            ids.append(store.take(data, f"v{v}"))
+        took = time.perf_counter() - start
+
+        start = time.perf_counter()
+        changes = store.diff(ids[0], ids[-1])
+        diffed = time.perf_counter() - start
+        start = time.perf_counter()
+        store.diff(ids[-2], ids[-1])
+        adjacent = time.perf_counter() - start
+
+    stored = store_path.stat().st_size
+    print(f"📊 {versions} versions of a {size / 1024:,.0f} KB catalog")
+    print(f"   • snapshots:       {took / versions * 1000:6.1f} ms each")
+    print(f"   • store size:      {stored / 1024:6,.0f} KB ({stored / size:.1f}x one copy, "
+          f"{versions} copies would be {versions * size / 1024 / 1024:,.0f} MB)")
+    print(f"   • diff first→last: {diffed * 1000:6.1f} ms ({summary(changes)})")
+    print(f"   • diff adjacent:   {adjacent * 1000:6.1f} ms")
+
+# -------- CLI -----------------------------------------------------------------
+def print_changes(changes):
+    print(f"🔀 {summary(changes)}")
+    for key in ('added', 'removed'):
+        if changes[key]:
+            print(f"   • {key}: {', '.join(map(str, changes[key][:20]))}{' ...' if len(changes[key]) > 20 else ''}")
+    for tool_id, fields in list(changes['changed'].items())[:20]:
+        print(f"   • {tool_id}: {', '.join(fields)}")
+    if len(changes['changed']) > 20:
+        print(f"   ... and {len(changes['changed']) - 20} more changed")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Deduplicated snapshots of mcp-data.json")
+    parser.add_argument('--store', help="Default: snapshots.sqlite next to --data")
+    parser.add_argument('--data', default=str(DATA_FILE))
+    parser.add_argument('--bench', type=int, metavar='N', help="Time N synthetic versions instead")
+    sub = parser.add_subparsers(dest='command')
+    p = sub.add_parser('take')
+    p.add_argument('files', nargs='*')
+    p.add_argument('--label')
+    sub.add_parser('list')
+    p = sub.add_parser('diff')
+    p.add_argument('old', type=int)
+    p.add_argument('new', type=int, nargs='?', help="Default: the current catalog file")
+    p = sub.add_parser('restore')
+    p.add_argument('id', type=int)
+    p.add_argument('--out', help="Default: the catalog file")
+    p = sub.add_parser('prune')
+    p.add_argument('--keep', type=int, required=True)
+    args = parser.parse_args(argv)
+
+    if args.bench:
+        benchmark(args.bench, args.data)
+        return
+    store_path = args.store or pathlib.Path(args.data).parent / STORE_FILE.name
+    if args.command == 'take':
+        for path in args.files or [args.data]:
+            print(f"📸 {path} → snapshot {snapshot_file(path, args.label, store_path)}")
+        return
+
+    with SnapshotStore(store_path) as store:
+        if args.command == 'diff':
+            if args.new is None:
+                with open(args.data, 'r') as f:
+                    print_changes(store.diff(args.old, json.load(f)))
+            else:
+                print_changes(store.diff(args.old, args.new))
+        elif args.command == 'restore':
+            out = args.out or args.data
+            exact = store.restore(args.id, out)
+            print(f"⏪ Snapshot {args.id} restored to {out}" + ("" if exact else " (formatting differs from the original file)"))
+        elif args.command == 'prune':
+            snapshots, objects = store.prune(args.keep)
+            print(f"🧹 Dropped {snapshots} snapshots and {objects} unreferenced objects")
+        else:
+            for snap in store.snapshots():
+                print(f"  {snap['id']:5}  {snap['created_at']}  {snap['count']:7,} tools  {snap['label'] or ''}")
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n\n⏹️  Operation cancelled by user")
+        sys.exit(1)
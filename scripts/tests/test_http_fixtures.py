@@ -0,0 +1,80 @@
+"""Replay the committed sample archive through the scrapers' fetch path"""
+
+import sys
+import asyncio
+import pathlib
+import zipfile
+import importlib.util
+
+import aiohttp
+from aiohttp import web
+
+SCRIPTS_DIR = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from http_fixtures import FixtureArchive, FixtureTransport  # noqa: E402
+from failure_ledger import FailureLedger  # noqa: E402
+
+SAMPLE = pathlib.Path(__file__).resolve().parent / "fixtures" / "github-sample.zip"
+REPO_URL = "https://github.com/example-org/example-mcp"
+
+def load_script(name):
+    spec = importlib.util.spec_from_file_location(name.replace('-', '_'), SCRIPTS_DIR / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+async def scrape(scraper, urls, cache_dir, ledger):
+    async with aiohttp.ClientSession() as session:
+        return [await scraper.fetch_repo_data(session, url, cache_dir, ledger) for url in urls]
+
+def test_replay_fetch_repo_data(tmp_path):
+    scraper = load_script('github-scraper')
+    with FixtureTransport(SAMPLE, 'replay') as transport, \
+            FailureLedger('scrape', tmp_path / "ledger.sqlite") as ledger:
+        found, gone, unknown = asyncio.run(scrape(
+            scraper, [REPO_URL, "https://github.com/example-org/gone", "https://github.com/example-org/unrecorded"],
+            tmp_path, ledger))
+        failures = dict(ledger.db.execute("SELECT repo, kind FROM failures").fetchall())
+
+    assert found['stars'] == 1234
+    assert found['forks'] == 56
+    assert found['language'] == 'python'
+    assert found['topics'] == ['mcp', 'testing']
+    assert gone is None and unknown is None
+    assert failures == {'example-org/gone': 'not_found', 'example-org/unrecorded': 'network'}
+    assert transport.stats['replayed'] == 2
+    assert transport.stats['missing'] == 1
+
+def test_record_concurrent_misses_once(tmp_path):
+    hits = []
+
+    async def page(request):
+        hits.append(request.path)
+        await asyncio.sleep(0.05)
+        return web.Response(text="<html>ok</html>", content_type='text/html')
+
+    async def run():
+        app = web.Application()
+        app.router.add_get('/repo', page)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        url = f"http://127.0.0.1:{runner.addresses[0][1]}/repo"
+        try:
+            with FixtureTransport(tmp_path / "recorded.zip", 'record'):
+                async with aiohttp.ClientSession() as session:
+                    async def get():
+                        async with session.get(url) as resp:
+                            return await resp.text()
+                    return await asyncio.gather(*(get() for _ in range(5)))
+        finally:
+            await runner.cleanup()
+
+    bodies = asyncio.run(run())
+    assert bodies == ["<html>ok</html>"] * 5
+    assert hits == ['/repo']
+    with zipfile.ZipFile(tmp_path / "recorded.zip") as zf:
+        assert len(zf.namelist()) == len(set(zf.namelist())) == 2
+    assert len(FixtureArchive(tmp_path / "recorded.zip")) == 1
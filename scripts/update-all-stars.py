@@ -1,12 +1,15 @@
 #!/usr/bin/env python3
-import json
-import requests
-from bs4 import BeautifulSoup
+from extraction import extractor
+from partial_fetch import fetch_fields, print_stats
 import time
 import random
+import asyncio
+from catalog import DATA_FILE, load_catalog, save_catalog, sort_by_stars, is_live
+from pipeline import Pipeline, Stage
+from failure_ledger import FailureLedger, failure_kind
 
 def get_github_stars(url):
-    """Get real-time stars from GitHub repository"""
+    """Get real-time stars from GitHub repository; returns (stars, failure kind)"""
     try:
         headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
@@ -15,92 +18,77 @@ def get_github_stars(url):
         # Add random delay to avoid being blocked
         time.sleep(random.uniform(0.5, 1.5))
         
-        response = requests.get(url, headers=headers, timeout=15)
-        if response.status_code != 200:
-            return None
+        # Stars sit in the page header, so stop downloading once they are parsed
+        status, fields, _, response_headers = fetch_fields(url, ['stars'], headers=headers, timeout=15, defaults={})
+        if fields is None:
+            return None, failure_kind(status, headers=response_headers)
+        if fields['stars'] is None:
+            # The page loaded but had no star counter (e.g. the markup changed)
+            return None, failure_kind()
             
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Try multiple selectors for stars
-        selectors = [
-            '#repo-stars-counter-star',
-            'a[href$="/stargazers"] .Counter',
-            'a[href*="stargazers"] strong',
-            '[data-testid="stargazers"] .Counter',
-            'a[href*="stargazers"] span[title]'
-        ]
-        
-        for selector in selectors:
-            elem = soup.select_one(selector)
-            if elem:
-                text = elem.get_text(strip=True) or elem.get('title', '')
-                if text:
-                    # Parse number (handle k, m suffixes)
-                    text = text.lower().replace(',', '')
-                    if 'k' in text:
-                        return int(float(text.replace('k', '')) * 1000)
-                    elif 'm' in text:
-                        return int(float(text.replace('m', '')) * 1000000)
-                    elif text.isdigit():
-                        return int(text)
-        
-        return None
+        return fields['stars'], None
         
     except Exception as e:
         print(f"❌ Error fetching {url}: {e}")
-        return None
+        return None, failure_kind(error=e)
 
-def main():
-    """Update all GitHub stars in batches"""
-    with open('../data/mcp-data.json', 'r') as f:
-        data = json.load(f)
+def main(data_file=DATA_FILE, batch_size=10, batch_pause=10):
+    """Update all GitHub stars, pausing between batches of requests"""
+    data = load_catalog(data_file)
+    ledger = FailureLedger.for_catalog('stars', data_file)
     
-    # Get all GitHub URLs
-    github_repos = [(i, tool) for i, tool in enumerate(data) if tool.get('githubUrl')]
+    # Get all GitHub URLs, minus repos whose failure circuit is open
+    github_repos, held = ledger.partition([tool for tool in data if is_live(tool)], lambda tool: tool['githubUrl'])
     
     print(f"🚀 Found {len(github_repos)} repositories to update")
+    if held:
+        print(f"⏸️  {len(held)} repositories held back after repeated failures (see failure_ledger.py)")
     
-    # Process in batches of 10
-    batch_size = 10
     updated_count = 0
     
-    for i in range(0, len(github_repos), batch_size):
-        batch = github_repos[i:i+batch_size]
-        
-        print(f"\n📦 Processing batch {i//batch_size + 1}/{(len(github_repos) + batch_size - 1)//batch_size}")
-        
-        for idx, tool in batch:
-            github_url = tool['githubUrl']
-            stars = get_github_stars(github_url)
-            
-            if stars is not None:
-                old_stars = tool.get('stars', 0)
-                data[idx]['stars'] = stars
-                updated_count += 1
-                
-                if stars != old_stars:
-                    print(f"  ✅ {tool['name'][:30]:30} {old_stars:6,} → {stars:6,} ⭐")
-                else:
-                    print(f"  ⚡ {tool['name'][:30]:30} {stars:6,} ⭐ (no change)")
-            else:
-                print(f"  ❌ {tool['name'][:30]:30} Failed")
+    def fetch(item):
+        n, tool = item
+        if n % batch_size == 0:
+            # Wait between batches
+            if n:
+                print("⏳ Waiting 10 seconds before next batch...")
+                time.sleep(batch_pause)
+            print(f"\n📦 Processing batch {n // batch_size + 1}/{(len(github_repos) + batch_size - 1) // batch_size}")
+        return (tool, *get_github_stars(tool['githubUrl']))
+    
+    def store(result):
+        nonlocal updated_count
+        tool, stars, failure = result
+        if stars is None:
+            ledger.record_failure(tool['githubUrl'], failure)
+            print(f"  ❌ {tool['name'][:30]:30} Failed ({failure})")
+            return
+        ledger.record_success(tool['githubUrl'])
+        old_stars = tool.get('stars', 0)
+        tool['stars'] = stars
+        updated_count += 1
         
-        # Wait between batches
-        if i + batch_size < len(github_repos):
-            print("⏳ Waiting 10 seconds before next batch...")
-            time.sleep(10)
+        if stars != old_stars:
+            print(f"  ✅ {tool['name'][:30]:30} {old_stars:6,} → {stars:6,} ⭐")
+        else:
+            print(f"  ⚡ {tool['name'][:30]:30} {stars:6,} ⭐ (no change)")
+    
+    asyncio.run(Pipeline(enumerate(github_repos), [Stage('stars', fetch, blocking=True)], store).run())
+    ledger.close()
     
     # Sort by updated stars
-    data.sort(key=lambda x: x.get('stars', 0), reverse=True)
+    sort_by_stars(data)
     
     # Save updated data
-    with open('../data/mcp-data.json', 'w') as f:
-        json.dump(data, f, indent=2)
+    save_catalog(data, data_file)
     
     print(f"\n🎉 Successfully updated {updated_count} repositories!")
     print("\n🏆 Top 15 repositories by stars:")
     for i, tool in enumerate(data[:15], 1):
         print(f"  {i:2d}. {tool['name'][:40]:40} {tool.get('stars', 0):8,} ⭐")
+    
+    extractor.print_report()
+    print_stats()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
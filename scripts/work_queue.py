@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Sharded Work Queue
+SQLite-backed queue of leased URL shards so several refresh workers (processes
+or machines sharing the database file) can split a catalog refresh. Leases
+expire, so shards held by a crashed worker are picked up again, and only the
+worker currently holding a shard's lease can report it done. Each refresh is
+its own generation of shards and results.
+"""
+
+import json
+import time
+import sqlite3
+import hashlib
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS generations (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS shards (
+    generation INTEGER NOT NULL,
+    id TEXT NOT NULL,
+    urls TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    owner TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (generation, id)
+);
+CREATE TABLE IF NOT EXISTS results (
+    generation INTEGER NOT NULL,
+    url TEXT NOT NULL,
+    shard_id TEXT NOT NULL,
+    data TEXT NOT NULL,
+    reported_at REAL NOT NULL,
+    PRIMARY KEY (generation, url)
+);
+"""
+
+def shard_id(urls):
+    """Stable id for a shard, so re-enqueueing the same URLs into a refresh is a no-op"""
+    return hashlib.sha1('\n'.join(urls).encode('utf-8')).hexdigest()[:16]
+
+class WorkQueue:
+    """Leased shards and their results in one SQLite file.
+
+    Every refresh is a generation: ``start_refresh`` opens a new one and drops
+    the shards and results of earlier ones, so a second refresh fetches
+    everything again instead of finding its shards already done. Workers only
+    lease shards of the current generation.
+    """
+
+    def __init__(self, path, lease_seconds=300):
+        self.path = str(path)
+        self.lease_seconds = lease_seconds
+        self.db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        columns = [row[1] for row in self.db.execute('PRAGMA table_info(shards)')]
+        if columns and 'generation' not in columns:
+            # Queue file from before generations; it only holds transient state
+            self.db.executescript('DROP TABLE shards; DROP TABLE IF EXISTS results;')
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def generation(self):
+        """The current refresh's generation, starting one if there is none"""
+        row = self.db.execute('SELECT MAX(id) FROM generations').fetchone()
+        return row[0] if row[0] is not None else self.start_refresh()
+
+    def start_refresh(self):
+        """Open a new generation and forget earlier refreshes; returns its id"""
+        self.db.execute('BEGIN IMMEDIATE')
+        generation = self.db.execute('INSERT INTO generations (started_at) VALUES (?)', (time.time(),)).lastrowid
+        self.db.execute('DELETE FROM shards WHERE generation < ?', (generation,))
+        self.db.execute('DELETE FROM results WHERE generation < ?', (generation,))
+        self.db.execute('COMMIT')
+        return generation
+
+    def enqueue(self, urls, shard_size=25):
+        """Split ``urls`` into shards of the current refresh; returns how many new shards were added"""
+        generation = self.generation()
+        urls = sorted(dict.fromkeys(urls))
+        added = 0
+        self.db.execute('BEGIN IMMEDIATE')
+        for i in range(0, len(urls), shard_size):
+            chunk = urls[i:i + shard_size]
+            cur = self.db.execute(
+                'INSERT OR IGNORE INTO shards (generation, id, urls) VALUES (?, ?, ?)',
+                (generation, shard_id(chunk), json.dumps(chunk))
+            )
+            added += cur.rowcount
+        self.db.execute('COMMIT')
+        return added
+
+    def lease(self, worker_id):
+        """Claim the next pending or expired shard; returns ``(shard_id, urls)`` or None"""
+        now = time.time()
+        self.db.execute('BEGIN IMMEDIATE')
+        generation = self.db.execute('SELECT MAX(id) FROM generations').fetchone()[0]
+        row = self.db.execute(
+            "SELECT id, urls FROM shards WHERE generation = ? AND (status = 'pending' "
+            "OR (status = 'leased' AND lease_expires < ?)) ORDER BY attempts, id LIMIT 1",
+            (generation, now)
+        ).fetchone()
+        if row:
+            self.db.execute(
+                "UPDATE shards SET status = 'leased', owner = ?, lease_expires = ?, "
+                "attempts = attempts + 1 WHERE generation = ? AND id = ?",
+                (worker_id, now + self.lease_seconds, generation, row[0])
+            )
+        self.db.execute('COMMIT')
+        return (row[0], json.loads(row[1])) if row else None
+
+    def renew(self, shard, worker_id):
+        """Extend a lease; returns False if the shard was taken over by another worker"""
+        cur = self.db.execute(
+            "UPDATE shards SET lease_expires = ? WHERE id = ? AND owner = ? AND status = 'leased' "
+            "AND generation = (SELECT MAX(id) FROM generations)",
+            (time.time() + self.lease_seconds, shard, worker_id)
+        )
+        return cur.rowcount == 1
+
+    def complete(self, shard, worker_id, results):
+        """Store results (dicts with a ``url`` key) and mark the shard done.
+
+        Only the worker holding the lease may complete a shard; returns False
+        (storing nothing) otherwise, so a worker that lost its lease cannot mark
+        URLs it never fetched as done.
+        """
+        now = time.time()
+        self.db.execute('BEGIN IMMEDIATE')
+        generation = self.db.execute('SELECT MAX(id) FROM generations').fetchone()[0]
+        cur = self.db.execute(
+            "UPDATE shards SET status = 'done', lease_expires = NULL "
+            "WHERE generation = ? AND id = ? AND owner = ? AND status = 'leased'",
+            (generation, shard, worker_id)
+        )
+        if cur.rowcount != 1:
+            self.db.execute('ROLLBACK')
+            return False
+        self.db.executemany(
+            'INSERT OR REPLACE INTO results (generation, url, shard_id, data, reported_at) VALUES (?, ?, ?, ?, ?)',
+            [(generation, r['url'], shard, json.dumps(r), now) for r in results]
+        )
+        self.db.execute('COMMIT')
+        return True
+
+    def release(self, shard, worker_id):
+        """Give a shard back without results (e.g. worker shutting down)"""
+        self.db.execute(
+            "UPDATE shards SET status = 'pending', owner = NULL, lease_expires = NULL "
+            "WHERE id = ? AND owner = ? AND status = 'leased' AND generation = (SELECT MAX(id) FROM generations)",
+            (shard, worker_id)
+        )
+
+    def results(self):
+        """All scrape records reported in the current refresh"""
+        return [json.loads(row[0]) for row in self.db.execute(
+            'SELECT data FROM results WHERE generation = (SELECT MAX(id) FROM generations) ORDER BY url'
+        )]
+
+    def progress(self):
+        """Shard counts by status for the current refresh, with expired leases reported separately"""
+        generation = self.generation()
+        counts = dict(self.db.execute(
+            'SELECT status, COUNT(*) FROM shards WHERE generation = ? GROUP BY status', (generation,)
+        ))
+        counts['expired'] = self.db.execute(
+            "SELECT COUNT(*) FROM shards WHERE generation = ? AND status = 'leased' AND lease_expires < ?",
+            (generation, time.time())
+        ).fetchone()[0]
+        counts['results'] = self.db.execute(
+            'SELECT COUNT(*) FROM results WHERE generation = ?', (generation,)
+        ).fetchone()[0]
+        counts['generation'] = generation
+        return counts